@@ -0,0 +1,96 @@
+"""
+Script para medir la búsqueda de códigos conocidos en grupos de red.
+
+Compara buscar cada código de la BD en cada grupo (una pasada por código)
+con AutomataCodigos (una sola pasada por grupo) y verifica que encuentren
+los mismos códigos en las mismas posiciones. Ambas búsquedas solo aceptan
+códigos que empiezan un segmento del nombre, seguidos a lo sumo de dígitos.
+
+Uso: python scripts/medir_automata_codigos.py [repeticiones]
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+# Añadir el directorio src al path para las importaciones
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from matriz_rol.data.automata_codigos import AutomataCodigos
+
+CANTIDADES_CODIGOS = [10, 500, 5000]
+GRUPOS = 2000
+
+
+def generar_codigos(cantidad: int):
+    """Genera códigos de 4 letras distintos."""
+    return [
+        "".join(chr(65 + (numero // 26**i) % 26) for i in range(4))
+        for numero in range(cantidad)
+    ]
+
+
+def generar_grupos(codigos):
+    """Genera grupos de red que contienen algunos de los códigos."""
+    return [
+        f"GR_{codigos[numero % len(codigos)]}_CONSULTA_{numero % 3}"
+        for numero in range(GRUPOS)
+    ]
+
+
+def busqueda_por_codigo(codigos, grupos):
+    """Busca cada código por separado en cada grupo."""
+    patrones = [
+        (codigo, re.compile(rf"(?<![A-Z0-9]){re.escape(codigo)}(?=[0-9]*(?![A-Z0-9]))"))
+        for codigo in codigos
+    ]
+    resultado = {}
+    for grupo in grupos:
+        texto = grupo.upper()
+        encontrados = [
+            (codigo, coincidencia.start())
+            for codigo, patron in patrones
+            for coincidencia in patron.finditer(texto)
+        ]
+        resultado[grupo] = sorted(encontrados, key=lambda par: par[1])
+    return resultado
+
+
+def cronometrar(funcion, repeticiones: int) -> float:
+    """Milisegundos promedio de una llamada."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def main():
+    """Ejecuta la medición y muestra el resultado."""
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    print(f"📏 Milisegundos por lista de {GRUPOS} grupos")
+    print(f"   {'Códigos':>8} {'Por código':>11} {'Autómata':>9}")
+    for cantidad in CANTIDADES_CODIGOS:
+        codigos = generar_codigos(cantidad)
+        grupos = generar_grupos(codigos)
+        automata = AutomataCodigos(codigos)
+
+        if busqueda_por_codigo(codigos, grupos) != automata.ubicar(grupos):
+            print("❌ Los resultados no coinciden")
+            sys.exit(1)
+
+        tiempo_anterior = cronometrar(
+            lambda: busqueda_por_codigo(codigos, grupos), repeticiones
+        )
+        tiempo_nuevo = cronometrar(lambda: automata.ubicar(grupos), repeticiones)
+        print(
+            f"   {cantidad:>8} {tiempo_anterior:>11.2f} {tiempo_nuevo:>9.2f}"
+            f"  (x{tiempo_anterior / tiempo_nuevo:.1f})"
+        )
+    print("✅ Mismos códigos y posiciones en ambas búsquedas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Script para medir la extracción de códigos de aplicación.
+
+Compara las tres implementaciones anteriores (lista con búsqueda lineal,
+expresión recompilada en cada grupo y división por guiones bajos) con los
+extractores de matriz_rol.data.extractor_codigos sobre listas de grupos
+pegadas, con repeticiones, y verifica que den los mismos códigos.
+
+Uso: python scripts/medir_extraccion_codigos.py [repeticiones]
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+# Añadir el directorio src al path para las importaciones
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from matriz_rol.data.extractor_codigos import (
+    PATRON_ALFANUMERICO,
+    PATRON_DELIMITADO,
+    ExtractorCodigos,
+    ExtractorSegmentos,
+)
+
+CANTIDADES = [10, 1000, 10000]
+CODIGOS = 500
+
+
+def alfanumerico_anterior(grupos):
+    """Versión anterior de SolicitudMatrizFrame.extraer_codigos_aplicacion."""
+    codigos = []
+    patron = re.compile(r"[A-Z0-9]{4}")
+    for grupo in grupos:
+        for match in patron.findall(grupo.upper()):
+            if match not in codigos:
+                codigos.append(match)
+    return codigos
+
+
+def delimitado_anterior(grupos):
+    """Versión anterior de extraer_codigos_aplicacion_de_grupos."""
+    codigos = set()
+    for grupo in grupos:
+        import re
+
+        patron = r"_([A-Z]{4})_"
+        for match in re.findall(patron, grupo):
+            codigos.add(match)
+    return sorted(list(codigos))
+
+
+def segmentos_anterior(grupos):
+    """Versión anterior de AplicacionPrincipal.extraer_codigos_aplicacion."""
+    codigos = set()
+    for grupo in grupos:
+        for parte in grupo.split("_"):
+            if len(parte) == 4 and parte.isalpha():
+                codigos.add(parte)
+    return sorted(list(codigos))
+
+
+def generar_grupos(cantidad: int):
+    """Genera grupos de red con códigos repetidos, como en una lista pegada."""
+    codigos = [
+        "".join(chr(65 + (numero // 26**i) % 26) for i in range(4))
+        for numero in range(CODIGOS)
+    ]
+    return [
+        f"GR_{codigos[numero % CODIGOS]}_{codigos[(numero * 7) % CODIGOS]}"
+        f"_CONSULTA_{numero % 3}"
+        for numero in range(cantidad)
+    ]
+
+
+def cronometrar(funcion, grupos, repeticiones: int) -> float:
+    """Milisegundos promedio de una llamada."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion(grupos)
+    return (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def main():
+    """Ejecuta la medición y muestra el resultado."""
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    alfanumerico = ExtractorCodigos(PATRON_ALFANUMERICO, mayusculas=True)
+    delimitado = ExtractorCodigos(PATRON_DELIMITADO, mayusculas=False)
+    segmentos = ExtractorSegmentos()
+    casos = [
+        ("Alfanumérico", alfanumerico_anterior, alfanumerico.extraer),
+        (
+            "Delimitado",
+            delimitado_anterior,
+            lambda grupos: sorted(delimitado.extraer(grupos)),
+        ),
+        (
+            "Segmentos",
+            segmentos_anterior,
+            lambda grupos: sorted(segmentos.extraer(grupos)),
+        ),
+    ]
+
+    print("📏 Milisegundos por lista de grupos")
+    print(f"   {'Extractor':<13} {'Grupos':>7} {'Anterior':>10} {'Nuevo':>9}")
+    for nombre, anterior, nuevo in casos:
+        for cantidad in CANTIDADES:
+            grupos = generar_grupos(cantidad)
+            if anterior(grupos) != nuevo(grupos):
+                print(f"❌ {nombre}: los resultados no coinciden")
+                sys.exit(1)
+
+            tiempo_anterior = cronometrar(anterior, grupos, repeticiones)
+            tiempo_nuevo = cronometrar(nuevo, grupos, repeticiones)
+            print(
+                f"   {nombre:<13} {cantidad:>7} {tiempo_anterior:>10.2f}"
+                f" {tiempo_nuevo:>9.2f}  (x{tiempo_anterior / tiempo_nuevo:.1f})"
+            )
+    print("✅ Mismos códigos que las versiones anteriores")
+
+
+if __name__ == "__main__":
+    main()
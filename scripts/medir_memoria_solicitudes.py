@@ -0,0 +1,100 @@
+"""
+Script para medir la memoria que ocupa cada solicitud cargada.
+
+Compara la representación anterior (objeto con __dict__, lista propia de
+grupos y copia completa de cada autorizador) con SolicitudConformidad, que
+usa __slots__ y comparte grupos y autorizadores internados.
+
+Uso: python scripts/medir_memoria_solicitudes.py [cantidad]
+"""
+
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Añadir el directorio src al path para las importaciones
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from matriz_rol.data.gestor_solicitudes import EstadoSolicitud, SolicitudConformidad
+
+CODIGOS = ["APF2", "QASD", "SSSS", "CASD", "FCVE", "ATLA", "FIEC", "BNKX"]
+ESTADOS = [estado.value for estado in EstadoSolicitud]
+
+
+class SolicitudSinCompactar:
+    """Representación anterior: cada solicitud guarda sus propias copias."""
+
+    def __init__(self, data):
+        self._observador = None
+        self.id_solicitud = data["id_solicitud"]
+        self.fecha_creacion = data["fecha_creacion"]
+        self.grupos_red = data["grupos_red"]
+        self.autorizadores = data["autorizadores"]
+        self._estado = EstadoSolicitud(data["estado"])
+        self._ticket_helpdesk = data.get("ticket_helpdesk")
+        self.fecha_cierre = data.get("fecha_cierre")
+        self.observaciones = data.get("observaciones")
+
+
+def generar_registro(numero: int) -> str:
+    """Genera el JSON de una solicitud, como queda en la BD local."""
+    codigos = [CODIGOS[(numero + i) % len(CODIGOS)] for i in range(3)]
+    registro = {
+        "id_solicitud": f"SOL_20250101_120000_{numero:06d}",
+        "fecha_creacion": f"2025-01-01T12:00:00.{numero:06d}",
+        "grupos_red": [f"GR_{codigo}_CONSULTA_PROD" for codigo in codigos],
+        "autorizadores": [
+            {
+                "codigo": codigo,
+                "autorizador": f"Autorizador de {codigo}",
+                "correo": f"{codigo.lower()}@empresa.com",
+            }
+            for codigo in codigos
+        ],
+        "estado": ESTADOS[numero % len(ESTADOS)],
+        "ticket_helpdesk": None,
+        "fecha_cierre": None,
+        "observaciones": None,
+    }
+    return json.dumps(registro, ensure_ascii=False)
+
+
+def medir(construir, cantidad: int) -> float:
+    """
+    Mide los bytes retenidos por solicitud.
+
+    Cada registro se decodifica por separado, como al leer la BD en
+    streaming, de modo que sus textos no se comparten entre registros.
+
+    Returns:
+        Bytes promedio por solicitud
+    """
+    textos = [generar_registro(numero) for numero in range(cantidad)]
+
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    solicitudes = [construir(json.loads(texto)) for texto in textos]
+    retenidos = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+
+    del solicitudes
+    return retenidos / cantidad
+
+
+def main():
+    """Ejecuta la medición y muestra el resultado."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"📏 Midiendo memoria con {cantidad} solicitudes...")
+
+    antes = medir(SolicitudSinCompactar, cantidad)
+    despues = medir(SolicitudConformidad.from_dict, cantidad)
+
+    print(f"   Antes:   {antes:,.0f} bytes por solicitud")
+    print(f"   Después: {despues:,.0f} bytes por solicitud")
+    print(f"✅ Reducción: {100 * (1 - despues / antes):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
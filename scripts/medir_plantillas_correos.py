@@ -0,0 +1,92 @@
+"""
+Script para medir la velocidad de generación del contenido de los correos.
+
+Genera el HTML y el texto de los correos individuales de una solicitud con
+1 a 500 destinatarios y compara las plantillas con fragmentos compartidos
+contra regenerar los fragmentos en cada correo (caché vaciada antes de cada
+destinatario, como hacía el generador anterior).
+
+Uso: python scripts/medir_plantillas_correos.py [repeticiones]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Añadir el directorio src al path para las importaciones
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from matriz_rol.email import generador_correos_individuales as modulo
+from matriz_rol.email.generador_correos_individuales import (
+    GeneradorCorreosIndividuales,
+)
+
+DESTINATARIOS = [1, 10, 50, 100, 250, 500]
+
+# Fragmentos compartidos entre los destinatarios de una solicitud
+FRAGMENTOS = [
+    modulo._filas_html,
+    modulo._filas_texto,
+    modulo._grupos_html,
+    modulo._grupos_texto,
+]
+
+
+def generar_datos(cantidad: int):
+    """Genera autorizadores y grupos de red de prueba."""
+    autorizadores = [
+        {
+            "codigo": f"C{numero:03d}",
+            "autorizador": f"Autorizador Número {numero}",
+            "correo": f"autorizador{numero}@empresa.com",
+        }
+        for numero in range(cantidad)
+    ]
+    grupos = [f"GR_C{numero:03d}_CONSULTA_PROD" for numero in range(cantidad)]
+    return autorizadores, grupos
+
+
+def medir(generador, autorizadores, grupos, repeticiones: int, compartir: bool):
+    """
+    Mide los correos por segundo que se generan para una solicitud.
+
+    Returns:
+        Correos generados por segundo
+    """
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        for autorizador in autorizadores:
+            if not compartir:
+                for fragmento in FRAGMENTOS:
+                    fragmento.cache_clear()
+            generador._generar_contenido_html_individual(
+                autorizador, autorizadores, grupos, "2025-01-01 12:00"
+            )
+            generador._generar_contenido_texto_individual(
+                autorizador, autorizadores, grupos, "2025-01-01 12:00"
+            )
+    duracion = time.perf_counter() - inicio
+    return repeticiones * len(autorizadores) / duracion
+
+
+def main():
+    """Ejecuta la medición y muestra el resultado."""
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    # Solo se usan los métodos de contenido: no hace falta crear carpetas
+    generador = GeneradorCorreosIndividuales.__new__(GeneradorCorreosIndividuales)
+
+    print("📏 Correos por segundo (HTML + texto)")
+    print(f"   {'Destinatarios':>13}  {'Sin compartir':>14}  {'Compartidos':>12}")
+    for cantidad in DESTINATARIOS:
+        autorizadores, grupos = generar_datos(cantidad)
+        sin_compartir = medir(generador, autorizadores, grupos, repeticiones, False)
+        compartidos = medir(generador, autorizadores, grupos, repeticiones, True)
+        print(
+            f"   {cantidad:>13}  {sin_compartir:>14,.0f}  {compartidos:>12,.0f}"
+            f"  (x{compartidos / sin_compartir:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Prueba de estrés de la generación de IDs de solicitud.
+
+Crea 100.000 solicitudes (por defecto) repartidas entre varios procesos que
+comparten la misma BD local y verifica que ningún ID se repita. Todo se hace
+en un directorio temporal; la BD real no se modifica.
+
+Uso: python scripts/probar_ids_solicitudes.py [cantidad] [procesos]
+"""
+
+import contextlib
+import io
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Añadir el directorio src al path para las importaciones
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from matriz_rol.data.gestor_solicitudes import GestorSolicitudes
+
+
+class GestorTemporal(GestorSolicitudes):
+    """Gestor cuya BD local vive en el directorio indicado."""
+
+    directorio = None
+
+    def _obtener_directorio_bd(self) -> Path:
+        return self.directorio
+
+
+def crear_solicitudes(directorio: str, cantidad: int) -> list:
+    """Crea solicitudes en un proceso y devuelve sus IDs."""
+    GestorTemporal.directorio = Path(directorio)
+
+    # Silenciar los mensajes de cada creación
+    with contextlib.redirect_stdout(io.StringIO()):
+        gestor = GestorTemporal(ventana_escritura=0.5)
+        ids = [
+            gestor.crear_solicitud(["GR_PRUEBA"], []).id_solicitud
+            for _ in range(cantidad)
+        ]
+        gestor.cerrar()
+    return ids
+
+
+def main():
+    """Ejecuta la prueba de estrés."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    procesos = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    print(f"🔧 Creando {cantidad} solicitudes en {procesos} procesos...")
+    inicio = time.perf_counter()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        por_proceso = [cantidad // procesos] * procesos
+        por_proceso[0] += cantidad - sum(por_proceso)
+
+        with multiprocessing.Pool(procesos) as pool:
+            resultados = pool.starmap(
+                crear_solicitudes, [(directorio, n) for n in por_proceso]
+            )
+
+    ids = [id_solicitud for lote in resultados for id_solicitud in lote]
+    duracion = time.perf_counter() - inicio
+
+    print(f"   IDs generados: {len(ids)} en {duracion:.1f} s")
+    print(f"   IDs distintos: {len(set(ids))}")
+
+    if len(ids) != cantidad or len(set(ids)) != len(ids):
+        print("❌ Se generaron IDs repetidos")
+        sys.exit(1)
+    print("✅ Todos los IDs son únicos")
+
+
+if __name__ == "__main__":
+    main()
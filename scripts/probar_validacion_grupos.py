@@ -0,0 +1,71 @@
+"""
+Script para probar la validación de grupos de red sin dominio.
+
+Usa un directorio de grupos respaldado por un archivo temporal, con una
+demora por consulta que simula la red, y muestra el tiempo de validar los
+grupos en paralelo y el de repetir la validación desde la caché.
+
+Uso: python scripts/probar_validacion_grupos.py [grupos] [demora_segundos]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Añadir el directorio src al path para las importaciones
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from matriz_rol.data.directorio_grupos import (
+    CONSULTAS_SIMULTANEAS,
+    DirectorioArchivo,
+    ValidadorGrupos,
+)
+
+
+def main():
+    """Ejecuta la prueba y muestra los tiempos."""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    demora = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+
+    grupos = [f"GR_C{numero:03d}_CONSULTA_PROD" for numero in range(cantidad)]
+    # Uno de cada tres grupos no existe en el directorio
+    existentes = [grupo for numero, grupo in enumerate(grupos) if numero % 3]
+
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo_grupos = Path(directorio) / "grupos.txt"
+        archivo_grupos.write_text("\n".join(existentes), encoding="utf-8")
+        archivo_cache = Path(directorio) / "cache_grupos_red.json"
+
+        print(f"🔍 Validando {cantidad} grupos ({demora} s por consulta)...")
+        print(f"   Uno a uno tardaría unos {cantidad * demora:.1f} s")
+
+        validador = ValidadorGrupos(
+            DirectorioArchivo(archivo_grupos, demora=demora), archivo_cache
+        )
+        inicio = time.perf_counter()
+        validos, invalidos = validador.validar(grupos)
+        duracion = time.perf_counter() - inicio
+        print(
+            f"   En paralelo ({CONSULTAS_SIMULTANEAS} consultas): {duracion:.2f} s"
+            f" - {len(validos)} válidos, {len(invalidos)} no encontrados"
+        )
+
+        # Una nueva sesión lee la caché del disco y no consulta el directorio
+        validador = ValidadorGrupos(
+            DirectorioArchivo(archivo_grupos, demora=demora), archivo_cache
+        )
+        inicio = time.perf_counter()
+        resultado_cache = validador.validar(grupos)
+        duracion = time.perf_counter() - inicio
+        print(f"   Desde la caché de la sesión anterior: {duracion:.3f} s")
+
+    if (validos, invalidos) != resultado_cache or validos != existentes:
+        print("❌ Los resultados no coinciden")
+        sys.exit(1)
+    print("✅ Validación correcta")
+
+
+if __name__ == "__main__":
+    main()
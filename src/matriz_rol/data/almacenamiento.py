@@ -0,0 +1,540 @@
+"""
+Motores de almacenamiento para las solicitudes de conformidad.
+
+Define la interfaz que usa GestorSolicitudes para persistir sus datos y
+las implementaciones disponibles:
+- AlmacenamientoJSON: reescribe el archivo JSON completo en cada guardado
+- AlmacenamientoDiario: diario de solo anexado más un snapshot compactado
+- AlmacenamientoSQLite: BD SQLite indexada (ver almacenamiento_sqlite)
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from .escritura_segura import (
+    ErrorIntegridadDatos,
+    anexar_sincronizado,
+    escribir_json_seguro,
+    existe_alguna_generacion,
+    generaciones_verificadas,
+)
+from .lector_json import iterar_documento, leer_metadata
+
+
+def construir_documento(registros: List[Dict]) -> Dict:
+    """
+    Construye el documento JSON con el formato histórico de la BD local.
+
+    Args:
+        registros: Solicitudes serializadas con to_dict()
+
+    Returns:
+        Diccionario con las secciones metadata y solicitudes
+    """
+    return {
+        "metadata": {
+            "version": "1.0",
+            "ultima_actualizacion": datetime.now().isoformat(),
+            "total_solicitudes": len(registros),
+        },
+        "solicitudes": registros,
+    }
+
+
+def escribir_documento(archivo: Path, registros: List[Dict]) -> None:
+    """
+    Escribe el documento completo de forma atómica y con suma de verificación.
+
+    Args:
+        archivo: Ruta del archivo JSON destino
+        registros: Solicitudes serializadas con to_dict()
+    """
+    escribir_json_seguro(archivo, construir_documento(registros))
+
+
+def leer_documento(archivo: Path) -> List[Dict]:
+    """
+    Lee las solicitudes serializadas de un documento JSON.
+
+    Si el archivo está dañado se recupera la generación anterior.
+
+    Args:
+        archivo: Ruta del archivo JSON
+
+    Returns:
+        Lista de solicitudes serializadas
+    """
+    return list(iterar_documento_seguro(archivo))
+
+
+def iterar_documento_seguro(archivo: Path) -> Iterator[Dict]:
+    """
+    Recorre las solicitudes de la generación válida más reciente del documento.
+
+    El archivo se verifica (suma) y se decodifica por bloques, con memoria
+    constante. Los archivos sin suma, anteriores a la escritura segura, se
+    validan completos antes de emitir el primer registro para poder recurrir
+    a la generación anterior si están dañados.
+
+    Args:
+        archivo: Ruta del archivo JSON
+
+    Yields:
+        Cada solicitud serializada, en orden de creación
+
+    Raises:
+        FileNotFoundError: Si no existe ninguna generación
+        ErrorIntegridadDatos: Si ninguna generación es válida
+    """
+    for generacion, verificada in generaciones_verificadas(archivo):
+        if not verificada:
+            try:
+                for _ in iterar_documento(generacion):
+                    pass
+            except ValueError as e:
+                print(f"⚠️ JSON inválido en {generacion.name}: {e}")
+                continue
+
+        yield from iterar_documento(generacion)
+        return
+
+    raise ErrorIntegridadDatos(f"No hay generaciones válidas de {archivo}")
+
+
+def contar_documento(archivo: Path) -> int:
+    """
+    Verifica un documento completo con memoria constante.
+
+    Args:
+        archivo: Ruta del archivo JSON
+
+    Returns:
+        Cantidad de solicitudes del documento
+    """
+    return sum(1 for _ in iterar_documento_seguro(archivo))
+
+
+def crear_almacenamiento(
+    archivo: Path, motor: Optional[str] = None
+) -> "AlmacenamientoSolicitudes":
+    """
+    Crea el motor de almacenamiento indicado.
+
+    Args:
+        archivo: Ruta del archivo JSON principal de la BD local
+        motor: "diario", "json" o "sqlite". Si no se indica se usa la
+            variable de entorno MATRIZ_ROL_MOTOR_BD o, en su defecto, "diario".
+
+    Returns:
+        Instancia del motor de almacenamiento
+    """
+    motor = (motor or os.environ.get("MATRIZ_ROL_MOTOR_BD") or "diario").lower()
+
+    if motor == "diario":
+        return AlmacenamientoDiario(archivo)
+    if motor == "json":
+        return AlmacenamientoJSON(archivo)
+    if motor == "sqlite":
+        from .almacenamiento_sqlite import AlmacenamientoSQLite
+
+        return AlmacenamientoSQLite(archivo)
+
+    raise ValueError(f"Motor de almacenamiento no reconocido: {motor}")
+
+
+class AlmacenamientoSolicitudes:
+    """Interfaz base de los motores de almacenamiento de solicitudes."""
+
+    # Indica si el motor puede persistir una solicitud sin reescribir todo
+    incremental = False
+    # Indica si el motor resuelve conteos y páginas sin recorrer todo
+    consultas_indexadas = False
+
+    def __init__(self, archivo: Path):
+        """
+        Inicializa el motor de almacenamiento.
+
+        Args:
+            archivo: Ruta del archivo JSON principal de la BD local
+        """
+        self.archivo = Path(archivo)
+        # Firma de los archivos tras la última lectura o escritura propia
+        self._firma_sincronizada: Optional[tuple] = None
+
+    @property
+    def ruta_datos(self) -> Path:
+        """Archivo donde residen los datos del motor."""
+        return self.archivo
+
+    def archivos_datos(self) -> List[Path]:
+        """Archivos cuyo cambio en disco implica datos distintos."""
+        return [self.archivo]
+
+    def firma_disco(self) -> tuple:
+        """
+        Calcula una firma barata (mtime y tamaño) de los archivos de datos.
+
+        Returns:
+            Tupla comparable; cambia cuando cualquier archivo cambia en disco
+        """
+        firma = []
+        for archivo in self.archivos_datos():
+            try:
+                stat = archivo.stat()
+                firma.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                firma.append(None)
+        return tuple(firma)
+
+    def marcar_sincronizado(self) -> None:
+        """Registra que el estado en disco coincide con el conocido."""
+        self._firma_sincronizada = self.firma_disco()
+
+    def modificado_externamente(self) -> bool:
+        """
+        Indica si los archivos cambiaron desde la última lectura o escritura
+        propia, es decir, si otro proceso modificó la BD.
+        """
+        return self.firma_disco() != self._firma_sincronizada
+
+    def sincronizar_sin_leer(self, obtener_registros: Callable[[], List[Dict]]) -> None:
+        """
+        Registra que los datos en disco ya se conocen sin haberlos recorrido
+        (se cargaron desde el snapshot binario).
+
+        Args:
+            obtener_registros: Devuelve las solicitudes serializadas, para los
+                motores que necesitan el estado completo en memoria
+        """
+        self.marcar_sincronizado()
+
+    def existe(self) -> bool:
+        """Indica si ya existen datos persistidos."""
+        return existe_alguna_generacion(self.archivo)
+
+    def es_legible(self) -> bool:
+        """Verifica, con memoria constante, que los datos se puedan leer."""
+        try:
+            contar_documento(self.archivo)
+            return True
+        except Exception:
+            return False
+
+    def cargar(self) -> List[Dict]:
+        """
+        Carga todas las solicitudes persistidas.
+
+        Returns:
+            Lista de solicitudes serializadas, en orden de creación
+        """
+        raise NotImplementedError
+
+    def iterar(self) -> Iterator[Dict]:
+        """
+        Recorre las solicitudes persistidas sin materializarlas todas.
+
+        Los motores que pueden leer por partes lo sobrescriben.
+
+        Yields:
+            Cada solicitud serializada, en orden de creación
+        """
+        yield from self.cargar()
+
+    def total_estimado(self) -> Optional[int]:
+        """
+        Cantidad aproximada de solicitudes, sin leer los datos (para progreso).
+
+        Returns:
+            Cantidad estimada, o None si no se conoce
+        """
+        try:
+            metadata = leer_metadata(self.archivo) or {}
+        except (OSError, ValueError):
+            return None
+        return metadata.get("total_solicitudes")
+
+    def guardar_todo(self, registros: List[Dict]) -> None:
+        """
+        Persiste el estado completo de la BD.
+
+        Args:
+            registros: Todas las solicitudes serializadas
+        """
+        raise NotImplementedError
+
+    def registrar_cambio(self, registro: Dict) -> None:
+        """
+        Persiste una única solicitud creada o modificada.
+
+        Solo está disponible en motores con ``incremental = True``.
+
+        Args:
+            registro: Solicitud serializada con to_dict()
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} no soporta cambios incrementales"
+        )
+
+    def registrar_cambios(self, registros: List[Dict]) -> None:
+        """
+        Persiste un lote de solicitudes creadas o modificadas.
+
+        Los motores pueden sobrescribirlo para escribir el lote de una vez.
+
+        Args:
+            registros: Solicitudes serializadas con to_dict()
+        """
+        for registro in registros:
+            self.registrar_cambio(registro)
+
+    def flush(self) -> None:
+        """Escribe los cambios pendientes (solo en motores con buffer)."""
+
+    def cerrar(self) -> None:
+        """Libera los recursos del motor (hilos, conexiones)."""
+
+
+class AlmacenamientoJSON(AlmacenamientoSolicitudes):
+    """Motor clásico: un único archivo JSON reescrito en cada guardado."""
+
+    def cargar(self) -> List[Dict]:
+        """Carga todas las solicitudes del archivo JSON."""
+        return list(self.iterar())
+
+    def iterar(self) -> Iterator[Dict]:
+        """Recorre las solicitudes del archivo JSON por bloques."""
+        self.marcar_sincronizado()
+        yield from iterar_documento_seguro(self.archivo)
+
+    def guardar_todo(self, registros: List[Dict]) -> None:
+        """Reescribe el archivo JSON completo."""
+        escribir_documento(self.archivo, registros)
+        self.marcar_sincronizado()
+
+
+class AlmacenamientoDiario(AlmacenamientoSolicitudes):
+    """
+    Motor de diario de solo anexado.
+
+    Cada cambio se escribe como una línea JSON al final del diario
+    (``<archivo>.diario``), por lo que su coste no depende del tamaño de la BD.
+    El archivo JSON principal actúa como snapshot compactado con el formato
+    histórico, de modo que las BD existentes se importan sin migración.
+
+    Al cargar se lee el snapshot y se reproducen los registros del diario.
+    Cuando el diario supera ``umbral_compactacion`` registros se compacta en
+    segundo plano: el diario se rota, se fusiona con el snapshot y se escribe
+    un snapshot nuevo.
+    """
+
+    incremental = True
+
+    def __init__(self, archivo: Path, umbral_compactacion: int = 500):
+        """
+        Inicializa el motor de diario.
+
+        Args:
+            archivo: Ruta del snapshot JSON (formato histórico de la BD)
+            umbral_compactacion: Registros en el diario que disparan la compactación
+        """
+        super().__init__(archivo)
+        self.archivo_diario = self.archivo.with_name(self.archivo.name + ".diario")
+        self.archivo_rotado = self.archivo.with_name(
+            self.archivo.name + ".diario.compactando"
+        )
+        self.umbral_compactacion = umbral_compactacion
+
+        self._registros_diario = 0
+        self._lock_diario = threading.Lock()
+        self._lock_compactacion = threading.Lock()
+        self._hilo_compactacion: Optional[threading.Thread] = None
+
+    def archivos_datos(self) -> List[Path]:
+        """Snapshot y diarios."""
+        return [self.archivo, self.archivo_diario, self.archivo_rotado]
+
+    def existe(self) -> bool:
+        """Indica si existe snapshot o diario."""
+        return (
+            existe_alguna_generacion(self.archivo)
+            or self.archivo_diario.exists()
+            or self.archivo_rotado.exists()
+        )
+
+    def cargar(self) -> List[Dict]:
+        """Reconstruye el estado a partir del snapshot y el diario."""
+        return list(self.iterar())
+
+    def iterar(self) -> Iterator[Dict]:
+        """
+        Recorre el estado reconstruido sin materializar el snapshot.
+
+        El diario (acotado por el umbral de compactación) se lee primero; luego
+        se recorre el snapshot por bloques sustituyendo cada registro por su
+        versión del diario, y al final se emiten las solicitudes nuevas.
+        """
+        with self._lock_compactacion, self._lock_diario:
+            cambios: Dict[str, Dict] = {}
+            for diario in (self.archivo_rotado, self.archivo_diario):
+                for registro in self._leer_diario(diario):
+                    cambios[registro["id_solicitud"]] = registro
+            self._registros_diario = self._contar_lineas(self.archivo_diario)
+            self.marcar_sincronizado()
+
+            print(
+                f"📒 Diario reproducido: {self._registros_diario} cambios "
+                f"pendientes de compactar"
+            )
+
+            if existe_alguna_generacion(self.archivo):
+                for registro in iterar_documento_seguro(self.archivo):
+                    # Reemplazar conserva la posición original de la solicitud
+                    yield cambios.pop(registro["id_solicitud"], registro)
+
+            yield from cambios.values()
+
+    def sincronizar_sin_leer(self, obtener_registros: Callable[[], List[Dict]]) -> None:
+        """Recuenta el diario para conservar el umbral de compactación."""
+        with self._lock_diario:
+            self._registros_diario = self._contar_lineas(self.archivo_diario)
+            self.marcar_sincronizado()
+
+    def guardar_todo(self, registros: List[Dict]) -> None:
+        """Escribe un snapshot completo y descarta el diario."""
+        with self._lock_compactacion, self._lock_diario:
+            escribir_documento(self.archivo, registros)
+            for archivo in (self.archivo_rotado, self.archivo_diario):
+                if archivo.exists():
+                    archivo.unlink()
+            self._registros_diario = 0
+            self.marcar_sincronizado()
+
+    def registrar_cambio(self, registro: Dict) -> None:
+        """Anexa una solicitud al final del diario."""
+        self.registrar_cambios([registro])
+
+    def registrar_cambios(self, registros: List[Dict]) -> None:
+        """Anexa un lote de solicitudes al diario con una única escritura."""
+        if not registros:
+            return
+
+        fecha = datetime.now().isoformat()
+        bloque = "".join(
+            json.dumps(
+                {"op": "guardar", "fecha": fecha, "solicitud": registro},
+                ensure_ascii=False,
+            )
+            + "\n"
+            for registro in registros
+        )
+
+        with self._lock_diario:
+            self.archivo_diario.parent.mkdir(parents=True, exist_ok=True)
+            anexar_sincronizado(self.archivo_diario, bloque)
+            self._registros_diario += len(registros)
+            self.marcar_sincronizado()
+            requiere_compactacion = self._registros_diario >= self.umbral_compactacion
+
+        if requiere_compactacion:
+            self.compactar_en_segundo_plano()
+
+    def compactar_en_segundo_plano(self) -> None:
+        """Lanza la compactación en un hilo si no hay otra en curso."""
+        if self._hilo_compactacion and self._hilo_compactacion.is_alive():
+            return
+
+        self._hilo_compactacion = threading.Thread(
+            target=self.compactar, name="compactacion-diario", daemon=True
+        )
+        self._hilo_compactacion.start()
+
+    def compactar(self) -> None:
+        """Fusiona el diario con el snapshot y escribe un snapshot nuevo."""
+        with self._lock_compactacion:
+            # Rotar el diario para que los nuevos cambios no esperen
+            with self._lock_diario:
+                if self.archivo_diario.exists() and not self.archivo_rotado.exists():
+                    os.replace(self.archivo_diario, self.archivo_rotado)
+                    self._registros_diario = 0
+                    self.marcar_sincronizado()
+
+            if not self.archivo_rotado.exists():
+                return
+
+            try:
+                registros = self._fusionar(self.archivo, [self.archivo_rotado])
+                escribir_documento(self.archivo, registros)
+                with self._lock_diario:
+                    self.archivo_rotado.unlink()
+                    self.marcar_sincronizado()
+                print(f"🗜️ Diario compactado: {len(registros)} solicitudes")
+            except Exception as e:
+                # El diario rotado se conserva y se reproducirá en la próxima carga
+                print(f"⚠️ Error compactando diario: {e}")
+
+    def cerrar(self) -> None:
+        """
+        Espera a que termine una compactación en curso y compacta lo que
+        quede en el diario, para que el snapshot JSON quede al día.
+        """
+        if self._hilo_compactacion and self._hilo_compactacion.is_alive():
+            self._hilo_compactacion.join()
+
+        with self._lock_diario:
+            pendiente = self._registros_diario > 0 or self.archivo_rotado.exists()
+        if pendiente:
+            self.compactar()
+
+    def _fusionar(self, snapshot: Path, diarios: Iterable[Path]) -> List[Dict]:
+        """
+        Aplica los registros de los diarios sobre el snapshot.
+
+        Args:
+            snapshot: Archivo JSON con el estado compactado
+            diarios: Archivos de diario en orden cronológico
+
+        Returns:
+            Lista de solicitudes serializadas, en orden de creación
+        """
+        por_id: Dict[str, Dict] = {}
+        if existe_alguna_generacion(snapshot):
+            for registro in leer_documento(snapshot):
+                por_id[registro["id_solicitud"]] = registro
+
+        for diario in diarios:
+            for registro in self._leer_diario(diario):
+                # Reemplazar conserva la posición original de la solicitud
+                por_id[registro["id_solicitud"]] = registro
+
+        return list(por_id.values())
+
+    def _leer_diario(self, diario: Path) -> Iterable[Dict]:
+        """Lee los registros válidos de un diario, ignorando líneas corruptas."""
+        if not diario.exists():
+            return
+
+        with open(diario, "r", encoding="utf-8") as file:
+            for numero, linea in enumerate(file, 1):
+                linea = linea.strip()
+                if not linea:
+                    continue
+                try:
+                    entrada = json.loads(linea)
+                except json.JSONDecodeError:
+                    # Una escritura interrumpida solo puede dañar la última línea
+                    print(f"⚠️ Línea {numero} del diario ilegible, se omite")
+                    continue
+                if entrada.get("op") == "guardar":
+                    yield entrada["solicitud"]
+
+    @staticmethod
+    def _contar_lineas(archivo: Path) -> int:
+        """Cuenta las líneas de un archivo de diario."""
+        if not archivo.exists():
+            return 0
+        with open(archivo, "rb") as file:
+            return sum(1 for _ in file)
@@ -0,0 +1,299 @@
+"""
+Motor de almacenamiento SQLite para las solicitudes de conformidad.
+
+Guarda cada solicitud como una fila indexada por id, estado, fecha de
+creación y ticket, con los grupos de red y autorizadores en tablas hijas.
+Permite resolver estadísticas y paginación directamente en la BD, sin
+recorrer ni materializar todas las solicitudes.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .almacenamiento import AlmacenamientoSolicitudes, leer_documento
+from .escritura_segura import existe_alguna_generacion
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS solicitudes (
+    id_solicitud TEXT PRIMARY KEY,
+    fecha_creacion TEXT NOT NULL,
+    estado TEXT NOT NULL,
+    ticket_helpdesk TEXT,
+    fecha_cierre TEXT,
+    observaciones TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_solicitudes_estado ON solicitudes (estado);
+CREATE INDEX IF NOT EXISTS idx_solicitudes_fecha ON solicitudes (fecha_creacion);
+CREATE INDEX IF NOT EXISTS idx_solicitudes_ticket ON solicitudes (ticket_helpdesk);
+
+CREATE TABLE IF NOT EXISTS solicitud_grupos (
+    id_solicitud TEXT NOT NULL
+        REFERENCES solicitudes (id_solicitud) ON DELETE CASCADE,
+    posicion INTEGER NOT NULL,
+    grupo TEXT NOT NULL,
+    PRIMARY KEY (id_solicitud, posicion)
+);
+
+CREATE TABLE IF NOT EXISTS solicitud_autorizadores (
+    id_solicitud TEXT NOT NULL
+        REFERENCES solicitudes (id_solicitud) ON DELETE CASCADE,
+    posicion INTEGER NOT NULL,
+    codigo TEXT,
+    datos TEXT NOT NULL,
+    PRIMARY KEY (id_solicitud, posicion)
+);
+CREATE INDEX IF NOT EXISTS idx_autorizadores_codigo
+    ON solicitud_autorizadores (codigo);
+"""
+
+_COLUMNAS = (
+    "id_solicitud",
+    "fecha_creacion",
+    "estado",
+    "ticket_helpdesk",
+    "fecha_cierre",
+    "observaciones",
+)
+
+
+class AlmacenamientoSQLite(AlmacenamientoSolicitudes):
+    """
+    Motor SQLite con consultas indexadas.
+
+    La BD se guarda junto al JSON histórico (``<archivo>.sqlite3``). Si aún
+    no existe y hay un JSON previo, este se importa en la primera carga.
+    """
+
+    incremental = True
+    consultas_indexadas = True
+
+    def __init__(self, archivo: Path, ruta_bd: Optional[Path] = None):
+        """
+        Inicializa el motor SQLite.
+
+        Args:
+            archivo: Ruta del JSON histórico de la BD local (para importación)
+            ruta_bd: Ruta del archivo SQLite. Por defecto, junto al JSON.
+        """
+        super().__init__(archivo)
+        self.ruta_bd = (
+            Path(ruta_bd) if ruta_bd else self.archivo.with_suffix(".sqlite3")
+        )
+        self._lock = threading.RLock()
+        self._conexion: Optional[sqlite3.Connection] = None
+
+    @property
+    def ruta_datos(self) -> Path:
+        """Archivo donde residen los datos del motor."""
+        return self.ruta_bd
+
+    def archivos_datos(self) -> List[Path]:
+        """BD SQLite y su registro WAL."""
+        return [self.ruta_bd, self.ruta_bd.with_name(self.ruta_bd.name + "-wal")]
+
+    def existe(self) -> bool:
+        """Indica si existe la BD SQLite o un JSON que importar."""
+        return self.ruta_bd.exists() or existe_alguna_generacion(self.archivo)
+
+    def es_legible(self) -> bool:
+        """Verifica la integridad de la BD SQLite."""
+        try:
+            with self._lock:
+                resultado = (
+                    self._obtener_conexion().execute("PRAGMA quick_check").fetchone()
+                )
+            return resultado is not None and resultado[0] == "ok"
+        except sqlite3.Error:
+            return False
+
+    def total_estimado(self) -> Optional[int]:
+        """Cantidad de solicitudes en la BD (o en el JSON a importar)."""
+        if not self.ruta_bd.exists():
+            return super().total_estimado()
+        return self.contar()
+
+    def cargar(self) -> List[Dict]:
+        """Carga todas las solicitudes, importando el JSON si hace falta."""
+        with self._lock:
+            importar = not self.ruta_bd.exists() and existe_alguna_generacion(
+                self.archivo
+            )
+            conexion = self._obtener_conexion()
+
+            if importar:
+                registros = leer_documento(self.archivo)
+                self.guardar_todo(registros)
+                print(
+                    f"📥 {len(registros)} solicitudes importadas a SQLite: {self.ruta_bd}"
+                )
+
+            filas = conexion.execute(
+                f"SELECT {', '.join(_COLUMNAS)} FROM solicitudes ORDER BY rowid"
+            ).fetchall()
+            self.marcar_sincronizado()
+            return self._construir_registros(filas)
+
+    def guardar_todo(self, registros: List[Dict]) -> None:
+        """Reemplaza todo el contenido de la BD en una sola transacción."""
+        with self._lock:
+            conexion = self._obtener_conexion()
+            with conexion:
+                conexion.execute("DELETE FROM solicitudes")
+                for registro in registros:
+                    self._insertar(conexion, registro)
+            self.marcar_sincronizado()
+
+    def registrar_cambio(self, registro: Dict) -> None:
+        """Inserta o actualiza una única solicitud."""
+        self.registrar_cambios([registro])
+
+    def registrar_cambios(self, registros: List[Dict]) -> None:
+        """Inserta o actualiza un lote de solicitudes en una sola transacción."""
+        with self._lock:
+            conexion = self._obtener_conexion()
+            with conexion:
+                for registro in registros:
+                    self._insertar(conexion, registro)
+            self.marcar_sincronizado()
+
+    def contar_por_estado(self) -> Dict[str, int]:
+        """
+        Cuenta las solicitudes de cada estado con un único GROUP BY.
+
+        Returns:
+            Diccionario {valor_estado: cantidad}
+        """
+        with self._lock:
+            filas = (
+                self._obtener_conexion()
+                .execute("SELECT estado, COUNT(*) FROM solicitudes GROUP BY estado")
+                .fetchall()
+            )
+        return {estado: cantidad for estado, cantidad in filas}
+
+    def contar(self, estado: Optional[str] = None) -> int:
+        """
+        Cuenta las solicitudes, opcionalmente filtradas por estado.
+
+        Args:
+            estado: Valor del estado a filtrar, o None para todas
+        """
+        consulta = "SELECT COUNT(*) FROM solicitudes"
+        parametros: tuple = ()
+        if estado is not None:
+            consulta += " WHERE estado = ?"
+            parametros = (estado,)
+
+        with self._lock:
+            fila = self._obtener_conexion().execute(consulta, parametros).fetchone()
+        return fila[0]
+
+    def cerrar(self) -> None:
+        """Cierra la conexión con la BD."""
+        with self._lock:
+            if self._conexion is not None:
+                self._conexion.close()
+                self._conexion = None
+
+    def _obtener_conexion(self) -> sqlite3.Connection:
+        """Abre la conexión (una sola, protegida por lock) y crea el esquema."""
+        if self._conexion is None:
+            self.ruta_bd.parent.mkdir(parents=True, exist_ok=True)
+            self._conexion = sqlite3.connect(str(self.ruta_bd), check_same_thread=False)
+            self._conexion.execute("PRAGMA foreign_keys = ON")
+            self._conexion.execute("PRAGMA journal_mode = WAL")
+            self._conexion.executescript(_ESQUEMA)
+        return self._conexion
+
+    @staticmethod
+    def _insertar(conexion: sqlite3.Connection, registro: Dict) -> None:
+        """Inserta o actualiza una solicitud y reemplaza sus filas hijas."""
+        id_solicitud = registro["id_solicitud"]
+        conexion.execute(
+            f"INSERT INTO solicitudes ({', '.join(_COLUMNAS)}) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (id_solicitud) DO UPDATE SET "
+            "fecha_creacion = excluded.fecha_creacion, "
+            "estado = excluded.estado, "
+            "ticket_helpdesk = excluded.ticket_helpdesk, "
+            "fecha_cierre = excluded.fecha_cierre, "
+            "observaciones = excluded.observaciones",
+            tuple(registro.get(columna) for columna in _COLUMNAS),
+        )
+
+        conexion.execute(
+            "DELETE FROM solicitud_grupos WHERE id_solicitud = ?", (id_solicitud,)
+        )
+        conexion.executemany(
+            "INSERT INTO solicitud_grupos (id_solicitud, posicion, grupo) "
+            "VALUES (?, ?, ?)",
+            [
+                (id_solicitud, posicion, grupo)
+                for posicion, grupo in enumerate(registro.get("grupos_red", []))
+            ],
+        )
+
+        conexion.execute(
+            "DELETE FROM solicitud_autorizadores WHERE id_solicitud = ?",
+            (id_solicitud,),
+        )
+        conexion.executemany(
+            "INSERT INTO solicitud_autorizadores "
+            "(id_solicitud, posicion, codigo, datos) VALUES (?, ?, ?, ?)",
+            [
+                (
+                    id_solicitud,
+                    posicion,
+                    autorizador.get("codigo"),
+                    json.dumps(autorizador, ensure_ascii=False),
+                )
+                for posicion, autorizador in enumerate(
+                    registro.get("autorizadores", [])
+                )
+            ],
+        )
+
+    def _construir_registros(self, filas: List[tuple]) -> List[Dict]:
+        """Reconstruye los diccionarios de solicitud con sus filas hijas."""
+        registros = [dict(zip(_COLUMNAS, fila)) for fila in filas]
+        if not registros:
+            return registros
+
+        por_id = {registro["id_solicitud"]: registro for registro in registros}
+        for registro in registros:
+            registro["grupos_red"] = []
+            registro["autorizadores"] = []
+
+        conexion = self._obtener_conexion()
+        filtro, parametros = self._filtro_ids(list(por_id))
+
+        for id_solicitud, grupo in conexion.execute(
+            "SELECT id_solicitud, grupo FROM solicitud_grupos"
+            f"{filtro} ORDER BY id_solicitud, posicion",
+            parametros,
+        ):
+            if id_solicitud in por_id:
+                por_id[id_solicitud]["grupos_red"].append(grupo)
+
+        for id_solicitud, datos in conexion.execute(
+            "SELECT id_solicitud, datos FROM solicitud_autorizadores"
+            f"{filtro} ORDER BY id_solicitud, posicion",
+            parametros,
+        ):
+            if id_solicitud in por_id:
+                por_id[id_solicitud]["autorizadores"].append(json.loads(datos))
+
+        return registros
+
+    @staticmethod
+    def _filtro_ids(ids: List[str]) -> tuple:
+        """Construye el WHERE para filas hijas; sin filtro si son muchas."""
+        # SQLite limita los parámetros por consulta: con muchos IDs es más
+        # barato leer las tablas hijas completas
+        if len(ids) > 500:
+            return "", ()
+        marcadores = ", ".join("?" for _ in ids)
+        return f" WHERE id_solicitud IN ({marcadores})", tuple(ids)
@@ -0,0 +1,286 @@
+"""
+Búsqueda de códigos de aplicación conocidos en nombres de grupos de red.
+
+AutomataCodigos es un autómata de Aho-Corasick construido con los códigos de
+la BD de autorizadores: recorre cada nombre una sola vez, sin importar
+cuántos códigos haya, y solo informa códigos que existen, junto con su
+posición. Agregar o quitar un código modifica el trie en el lugar; los
+enlaces de fallo se recalculan en la siguiente búsqueda.
+
+Los nombres se dividen en segmentos alfanuméricos (``GR_APF2_CONSULTA`` tiene
+los segmentos GR, APF2 y CONSULTA). Un código solo cuenta si empieza un
+segmento y este termina con él o sigue solo con dígitos, como el número de
+ambiente de ``QASD1``; así CONS no se encuentra dentro de CONSULTA.
+"""
+
+import string
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .extractor_codigos import EXTRACTOR_CODIGO_NUEVO
+
+# Raíz del trie
+_RAIZ = 0
+
+# Caracteres que forman los segmentos de un nombre de grupo (ya en mayúsculas)
+_ALFANUMERICOS = frozenset(string.ascii_uppercase + string.digits)
+
+
+def _en_limite(texto: str, inicio: int, fin: int) -> bool:
+    """Indica si texto[inicio:fin] empieza un segmento y solo le siguen dígitos."""
+    if inicio > 0 and texto[inicio - 1] in _ALFANUMERICOS:
+        return False
+    for caracter in texto[fin:]:
+        if caracter not in _ALFANUMERICOS:
+            break
+        if not caracter.isdigit():
+            return False
+    return True
+
+
+class AutomataCodigos:
+    """Autómata de Aho-Corasick sobre los códigos de aplicación conocidos."""
+
+    def __init__(self, codigos: Iterable[str] = ()):
+        """
+        Inicializa el autómata.
+
+        Args:
+            codigos: Códigos de aplicación conocidos
+        """
+        self._lock = threading.Lock()
+        self._reiniciar()
+        for codigo in codigos:
+            self._insertar(codigo)
+
+    def _reiniciar(self) -> None:
+        """Deja el trie vacío (llamar con el lock o desde __init__)."""
+        # Por nodo: transiciones, enlace de fallo, código que termina en él
+        # y siguiente nodo con código en la cadena de fallos (0 si no hay)
+        self._hijos: List[Dict[str, int]] = [{}]
+        self._fallo: List[int] = [_RAIZ]
+        self._codigo: List[Optional[str]] = [None]
+        self._salida: List[int] = [_RAIZ]
+        self._cantidad = 0
+        self._enlaces_al_dia = True
+
+    @staticmethod
+    def _normalizar(codigo: str) -> str:
+        return codigo.strip().upper()
+
+    def _insertar(self, codigo: str) -> bool:
+        """Agrega un código al trie (llamar con el lock o desde __init__)."""
+        codigo = self._normalizar(codigo)
+        if not codigo:
+            return False
+
+        nodo = _RAIZ
+        for caracter in codigo:
+            siguiente = self._hijos[nodo].get(caracter)
+            if siguiente is None:
+                siguiente = len(self._hijos)
+                self._hijos[nodo][caracter] = siguiente
+                self._hijos.append({})
+                self._fallo.append(_RAIZ)
+                self._codigo.append(None)
+                self._salida.append(_RAIZ)
+            nodo = siguiente
+
+        if self._codigo[nodo] is not None:
+            return False
+        self._codigo[nodo] = codigo
+        self._cantidad += 1
+        self._enlaces_al_dia = False
+        return True
+
+    def agregar(self, codigo: str) -> bool:
+        """
+        Agrega un código conocido.
+
+        Args:
+            codigo: Código de aplicación
+
+        Returns:
+            True si no estaba
+        """
+        with self._lock:
+            return self._insertar(codigo)
+
+    def quitar(self, codigo: str) -> bool:
+        """
+        Quita un código conocido.
+
+        Sus nodos quedan en el trie sin marcar; reconstruir los descarta.
+
+        Args:
+            codigo: Código de aplicación
+
+        Returns:
+            True si estaba
+        """
+        codigo = self._normalizar(codigo)
+        with self._lock:
+            nodo = _RAIZ
+            for caracter in codigo:
+                nodo = self._hijos[nodo].get(caracter)
+                if nodo is None:
+                    return False
+
+            if self._codigo[nodo] is None:
+                return False
+            self._codigo[nodo] = None
+            self._cantidad -= 1
+            self._enlaces_al_dia = False
+            return True
+
+    def reconstruir(self, codigos: Iterable[str]) -> None:
+        """
+        Reemplaza todos los códigos conocidos.
+
+        Args:
+            codigos: Nuevos códigos de aplicación
+        """
+        with self._lock:
+            self._reiniciar()
+            for codigo in codigos:
+                self._insertar(codigo)
+
+    def _actualizar_enlaces(self) -> None:
+        """Recalcula los enlaces de fallo y de salida (llamar con el lock)."""
+        hijos, fallo, codigo, salida = (
+            self._hijos,
+            self._fallo,
+            self._codigo,
+            self._salida,
+        )
+
+        # Recorrido en anchura: el fallo de un nodo ya está calculado
+        # cuando se procesan sus hijos
+        pendientes = []
+        for hijo in hijos[_RAIZ].values():
+            fallo[hijo] = _RAIZ
+            salida[hijo] = _RAIZ
+            pendientes.append(hijo)
+
+        for nodo in pendientes:
+            for caracter, hijo in hijos[nodo].items():
+                destino = fallo[nodo]
+                while destino != _RAIZ and caracter not in hijos[destino]:
+                    destino = fallo[destino]
+                destino = hijos[destino].get(caracter, _RAIZ)
+
+                fallo[hijo] = destino
+                salida[hijo] = (
+                    destino if codigo[destino] is not None else salida[destino]
+                )
+                pendientes.append(hijo)
+
+        self._enlaces_al_dia = True
+
+    def buscar(self, texto: str) -> List[Tuple[str, int]]:
+        """
+        Busca los códigos conocidos en un texto, en una sola pasada.
+
+        Args:
+            texto: Nombre de un grupo de red (no distingue mayúsculas)
+
+        Returns:
+            Pares (código, posición inicial) en orden de aparición, solo de
+            los códigos que empiezan un segmento (ver el módulo)
+        """
+        texto = texto.upper()
+        with self._lock:
+            if not self._enlaces_al_dia:
+                self._actualizar_enlaces()
+            hijos, fallo, codigo, salida = (
+                self._hijos,
+                self._fallo,
+                self._codigo,
+                self._salida,
+            )
+
+            encontrados = []
+            nodo = _RAIZ
+            for posicion, caracter in enumerate(texto):
+                while nodo != _RAIZ and caracter not in hijos[nodo]:
+                    nodo = fallo[nodo]
+                nodo = hijos[nodo].get(caracter, _RAIZ)
+
+                coincidencia = nodo if codigo[nodo] is not None else salida[nodo]
+                while coincidencia != _RAIZ:
+                    encontrado = codigo[coincidencia]
+                    inicio = posicion - len(encontrado) + 1
+                    if _en_limite(texto, inicio, posicion + 1):
+                        encontrados.append((encontrado, inicio))
+                    coincidencia = salida[coincidencia]
+
+            # Varias coincidencias terminan en la misma posición: ordenar
+            # por inicio deja el resultado en orden de aparición
+            encontrados.sort(key=lambda par: par[1])
+            return encontrados
+
+    def ubicar(self, grupos: Iterable[str]) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Busca los códigos conocidos en cada grupo.
+
+        Args:
+            grupos: Nombres de grupos de red
+
+        Returns:
+            Pares (código, posición) de cada grupo distinto
+        """
+        return {grupo: self.buscar(grupo) for grupo in dict.fromkeys(grupos)}
+
+    def codigos_en(self, grupos: Iterable[str]) -> List[str]:
+        """
+        Obtiene los códigos conocidos presentes en los grupos.
+
+        Args:
+            grupos: Nombres de grupos de red
+
+        Returns:
+            Códigos únicos en orden de aparición
+        """
+        codigos: Dict[str, None] = {}
+        for encontrados in self.ubicar(grupos).values():
+            codigos.update(dict.fromkeys(codigo for codigo, _ in encontrados))
+        return list(codigos)
+
+    def extraer(self, grupos: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """
+        Obtiene los códigos de aplicación de los grupos, separando los
+        conocidos de los candidatos a códigos nuevos.
+
+        Los candidatos son los segmentos con forma de código que da
+        EXTRACTOR_CODIGO_NUEVO y que no empiezan con un código conocido;
+        como no están en la BD, no deben buscarse en ella.
+
+        Args:
+            grupos: Nombres de grupos de red
+
+        Returns:
+            Tupla (conocidos, nuevos), cada lista con códigos únicos en
+            orden de aparición
+        """
+        grupos = list(grupos)
+        conocidos = self.codigos_en(grupos)
+        nuevos = [
+            candidato
+            for candidato in EXTRACTOR_CODIGO_NUEVO.extraer(grupos)
+            if not any(inicio == 0 for _, inicio in self.buscar(candidato))
+        ]
+        return conocidos, nuevos
+
+    def __contains__(self, codigo: str) -> bool:
+        codigo = self._normalizar(codigo)
+        with self._lock:
+            nodo = _RAIZ
+            for caracter in codigo:
+                nodo = self._hijos[nodo].get(caracter)
+                if nodo is None:
+                    return False
+            return self._codigo[nodo] is not None
+
+    def __len__(self) -> int:
+        """Cantidad de códigos conocidos."""
+        return self._cantidad
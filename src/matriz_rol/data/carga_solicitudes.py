@@ -0,0 +1,84 @@
+"""
+Carga de la BD de solicitudes en un hilo de trabajo.
+
+La lectura del archivo y la construcción de las solicitudes se hacen fuera
+del hilo principal; el resultado se aplica al gestor desde el hilo que
+consulta la carga (el de la interfaz), de modo que el gestor y los widgets
+solo se modifican desde ese hilo.
+"""
+
+import queue
+import threading
+from typing import Optional
+
+from .gestor_solicitudes import CargaCancelada, GestorSolicitudes
+
+
+class CargaSolicitudes:
+    """Carga en segundo plano de las solicitudes de un GestorSolicitudes."""
+
+    def __init__(self, gestor: GestorSolicitudes):
+        """
+        Inicializa la carga.
+
+        Args:
+            gestor: Gestor creado con carga_diferida=True
+        """
+        self.gestor = gestor
+        self.construidas = 0
+        self.total: Optional[int] = None
+        self.terminada = False
+        self.error: Optional[Exception] = None
+
+        self._eventos: queue.Queue = queue.Queue()
+        self._hilo: Optional[threading.Thread] = None
+
+    def iniciar(self) -> None:
+        """Arranca el hilo de carga (llamar desde el hilo principal)."""
+        self.gestor.iniciar_carga()
+        self._hilo = threading.Thread(
+            target=self._ejecutar, name="carga-solicitudes", daemon=True
+        )
+        self._hilo.start()
+
+    def procesar_eventos(self) -> bool:
+        """
+        Aplica el progreso acumulado; al terminar, entrega el resultado al gestor.
+
+        Debe llamarse periódicamente desde el hilo principal (p. ej. con after).
+
+        Returns:
+            True cuando la carga terminó y su resultado ya se aplicó
+        """
+        while True:
+            try:
+                tipo, datos = self._eventos.get_nowait()
+            except queue.Empty:
+                return self.terminada
+
+            if tipo == "progreso":
+                self.construidas, self.total = datos
+            elif tipo == "fin":
+                self.terminada = True
+                self.gestor.aplicar_solicitudes_cargadas(datos)
+            elif tipo == "error":
+                self.terminada = True
+                self.error = datos
+                self.gestor.manejar_error_carga(datos)
+
+    def _ejecutar(self) -> None:
+        """Lee y construye las solicitudes (hilo de trabajo)."""
+        try:
+            solicitudes = self.gestor.leer_carga(
+                al_progresar=lambda construidas, total: self._eventos.put(
+                    ("progreso", (construidas, total))
+                )
+            )
+        except CargaCancelada:
+            # El gestor se cerró y ya guardó los cambios hechos durante la carga
+            return
+        except Exception as e:
+            self._eventos.put(("error", e))
+            return
+
+        self._eventos.put(("fin", solicitudes))
@@ -0,0 +1,356 @@
+"""
+Validación de grupos de red contra el directorio del dominio.
+
+Cada grupo se consulta con un directorio intercambiable: el del dominio
+(``net group <grupo> /domain``) o uno respaldado por un archivo de texto,
+útil para probar sin dominio (p. ej. en Linux). ValidadorGrupos consulta
+varios grupos a la vez, con un máximo de consultas simultáneas, y recuerda
+el resultado de cada grupo durante un tiempo (más para los existentes que
+para los inexistentes) en una caché que se conserva entre sesiones.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..rutas import directorio_datos
+from .escritura_segura import (
+    ErrorIntegridadDatos,
+    escribir_json_seguro,
+    existe_alguna_generacion,
+    leer_json_seguro,
+)
+
+# Consultas al directorio que se ejecutan a la vez
+CONSULTAS_SIMULTANEAS = 8
+
+# Segundos máximos de una consulta net group
+TIEMPO_MAXIMO_CONSULTA = 30
+
+# Código de error de NET para "no se encuentra el nombre de grupo"; aparece en
+# la salida ("NET HELPMSG 2220") con cualquier idioma del sistema
+ERROR_NET_GRUPO_NO_ENCONTRADO = "2220"
+
+# Vigencia en segundos de los resultados en caché
+VIGENCIA_EXISTENTES = 7 * 24 * 3600
+VIGENCIA_INEXISTENTES = 3600
+
+# Archivo de la caché dentro del directorio de datos
+ARCHIVO_CACHE_GRUPOS = "cache_grupos_red.json"
+
+
+class ErrorDirectorio(Exception):
+    """No se pudo determinar si un grupo existe (el resultado no se guarda)."""
+
+
+def crear_directorio_grupos(origen: Optional[str] = None) -> "DirectorioGrupos":
+    """
+    Crea el directorio de grupos indicado.
+
+    Args:
+        origen: "dominio" o la ruta de un archivo de grupos. Si no se indica
+            se usa la variable de entorno MATRIZ_ROL_DIRECTORIO_GRUPOS o, en
+            su defecto, "dominio".
+
+    Returns:
+        Instancia del directorio de grupos
+    """
+    origen = origen or os.environ.get("MATRIZ_ROL_DIRECTORIO_GRUPOS") or "dominio"
+
+    if origen.lower() == "dominio":
+        return DirectorioDominio()
+    return DirectorioArchivo(Path(origen))
+
+
+class DirectorioGrupos:
+    """Interfaz base de los directorios de grupos de red."""
+
+    def existe(self, grupo: str) -> bool:
+        """
+        Consulta si un grupo existe.
+
+        Args:
+            grupo: Nombre del grupo de red
+
+        Returns:
+            True si existe, False si el directorio responde que no
+
+        Raises:
+            ErrorDirectorio: Si no se pudo completar la consulta
+        """
+        raise NotImplementedError
+
+
+class DirectorioDominio(DirectorioGrupos):
+    """Directorio del dominio de Windows consultado con ``net group``."""
+
+    def __init__(self, tiempo_maximo: float = TIEMPO_MAXIMO_CONSULTA):
+        """
+        Inicializa el directorio.
+
+        Args:
+            tiempo_maximo: Segundos máximos de cada consulta
+        """
+        self.tiempo_maximo = tiempo_maximo
+
+    def existe(self, grupo: str) -> bool:
+        try:
+            result = subprocess.run(
+                ["net", "group", grupo, "/domain"],
+                capture_output=True,
+                text=True,
+                errors="replace",
+                check=False,
+                timeout=self.tiempo_maximo,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            raise ErrorDirectorio(f"No se pudo consultar {grupo}: {e}") from e
+
+        if result.returncode == 0:
+            return True
+
+        salida = f"{result.stdout}\n{result.stderr}"
+        if f"HELPMSG {ERROR_NET_GRUPO_NO_ENCONTRADO}" in salida.upper():
+            return False
+
+        # Controlador de dominio inaccesible, acceso denegado, etc.: no es
+        # una respuesta sobre el grupo y no debe guardarse en la caché
+        detalle = (result.stderr or result.stdout).strip().splitlines()
+        raise ErrorDirectorio(
+            f"No se pudo consultar {grupo} (código {result.returncode}): "
+            f"{detalle[0] if detalle else 'sin detalle'}"
+        )
+
+
+class DirectorioArchivo(DirectorioGrupos):
+    """
+    Directorio respaldado por un archivo de texto, para pruebas.
+
+    El archivo tiene un grupo por línea; las líneas vacías y las que empiezan
+    con ``#`` se ignoran. Los nombres no distinguen mayúsculas, como en el
+    dominio, y el archivo se vuelve a leer cuando cambia.
+    """
+
+    def __init__(self, archivo: Path, demora: float = 0.0):
+        """
+        Inicializa el directorio.
+
+        Args:
+            archivo: Archivo con los grupos existentes
+            demora: Segundos de espera por consulta (simula la red)
+        """
+        self.archivo = Path(archivo)
+        self.demora = demora
+        self._grupos: Set[str] = set()
+        self._firma: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    def existe(self, grupo: str) -> bool:
+        if self.demora:
+            time.sleep(self.demora)
+        return normalizar_grupo(grupo) in self._leer_grupos()
+
+    def _leer_grupos(self) -> Set[str]:
+        """Obtiene los grupos del archivo, releyéndolo si cambió."""
+        try:
+            estado = self.archivo.stat()
+        except OSError as e:
+            raise ErrorDirectorio(f"No se pudo leer {self.archivo}: {e}") from e
+
+        firma = (estado.st_mtime_ns, estado.st_size)
+        with self._lock:
+            if firma != self._firma:
+                with open(self.archivo, "r", encoding="utf-8") as file:
+                    self._grupos = {
+                        normalizar_grupo(linea)
+                        for linea in file
+                        if linea.strip() and not linea.lstrip().startswith("#")
+                    }
+                self._firma = firma
+            return self._grupos
+
+
+def normalizar_grupo(grupo: str) -> str:
+    """Clave de un grupo: sin espacios alrededor y en mayúsculas."""
+    return grupo.strip().upper()
+
+
+class ValidadorGrupos:
+    """Valida grupos de red en paralelo, con caché persistente."""
+
+    def __init__(
+        self,
+        directorio: Optional[DirectorioGrupos] = None,
+        archivo_cache: Optional[Path] = None,
+        consultas_simultaneas: int = CONSULTAS_SIMULTANEAS,
+        vigencia_existentes: float = VIGENCIA_EXISTENTES,
+        vigencia_inexistentes: float = VIGENCIA_INEXISTENTES,
+    ):
+        """
+        Inicializa el validador.
+
+        Args:
+            directorio: Directorio a consultar (por defecto, el indicado por
+                crear_directorio_grupos)
+            archivo_cache: Archivo de la caché (None para el del directorio
+                de datos)
+            consultas_simultaneas: Máximo de consultas a la vez
+            vigencia_existentes: Segundos que se recuerda un grupo existente
+            vigencia_inexistentes: Segundos que se recuerda un grupo inexistente
+        """
+        self.directorio = directorio or crear_directorio_grupos()
+        self.archivo_cache = archivo_cache or directorio_datos() / ARCHIVO_CACHE_GRUPOS
+        self.consultas_simultaneas = max(1, consultas_simultaneas)
+        self.vigencia_existentes = vigencia_existentes
+        self.vigencia_inexistentes = vigencia_inexistentes
+
+        # grupo normalizado -> {"existe": bool, "fecha": segundos epoch}
+        self._cache: Optional[Dict[str, Dict]] = None
+        self._lock = threading.Lock()
+
+    def validar(self, grupos: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """
+        Clasifica los grupos en existentes e inexistentes.
+
+        Los grupos que no se pudieron consultar se informan como
+        inexistentes pero no se guardan en la caché.
+
+        Args:
+            grupos: Nombres de los grupos de red
+
+        Returns:
+            Tupla (grupos_validos, grupos_invalidos) en el orden recibido
+        """
+        grupos = [grupo.strip() for grupo in grupos if grupo.strip()]
+        resultados = self._resultados_en_cache(grupos)
+
+        pendientes = list(
+            dict.fromkeys(
+                normalizar_grupo(grupo)
+                for grupo in grupos
+                if normalizar_grupo(grupo) not in resultados
+            )
+        )
+        if pendientes:
+            resultados.update(self._consultar(pendientes))
+
+        grupos_validos = []
+        grupos_invalidos = []
+        for grupo in grupos:
+            if resultados.get(normalizar_grupo(grupo)):
+                grupos_validos.append(grupo)
+            else:
+                grupos_invalidos.append(grupo)
+
+        return grupos_validos, grupos_invalidos
+
+    def validar_en_segundo_plano(self, grupos: Iterable[str]) -> Future:
+        """
+        Valida los grupos en un hilo aparte.
+
+        La interfaz puede consultar ``done()`` periódicamente (p. ej. con
+        ``after``) y leer ``result()`` al terminar.
+
+        Args:
+            grupos: Nombres de los grupos de red
+
+        Returns:
+            Future con la tupla (grupos_validos, grupos_invalidos)
+        """
+        futuro: Future = Future()
+        grupos = list(grupos)
+
+        def ejecutar():
+            try:
+                futuro.set_result(self.validar(grupos))
+            except BaseException as e:
+                futuro.set_exception(e)
+
+        threading.Thread(target=ejecutar, name="validacion-grupos", daemon=True).start()
+        return futuro
+
+    def _resultados_en_cache(self, grupos: List[str]) -> Dict[str, bool]:
+        """Resultados vigentes de la caché para los grupos indicados."""
+        ahora = time.time()
+        resultados = {}
+        with self._lock:
+            cache = self._cargar_cache()
+            for grupo in grupos:
+                clave = normalizar_grupo(grupo)
+                entrada = cache.get(clave)
+                if entrada is None:
+                    continue
+                vigencia = (
+                    self.vigencia_existentes
+                    if entrada["existe"]
+                    else self.vigencia_inexistentes
+                )
+                if ahora - entrada["fecha"] < vigencia:
+                    resultados[clave] = entrada["existe"]
+        return resultados
+
+    def _consultar(self, grupos: List[str]) -> Dict[str, bool]:
+        """
+        Consulta los grupos en paralelo y guarda los resultados en la caché.
+
+        Returns:
+            Resultado de cada grupo normalizado (False si falló la consulta)
+        """
+        resultados: Dict[str, bool] = {}
+        confirmados: Dict[str, bool] = {}
+
+        hilos = min(self.consultas_simultaneas, len(grupos))
+        with ThreadPoolExecutor(
+            max_workers=hilos, thread_name_prefix="consulta-grupo"
+        ) as consultas:
+            futuros = {
+                grupo: consultas.submit(self.directorio.existe, grupo)
+                for grupo in grupos
+            }
+            for grupo, futuro in futuros.items():
+                try:
+                    confirmados[grupo] = resultados[grupo] = futuro.result()
+                except Exception as e:
+                    print(f"⚠️ {e}")
+                    resultados[grupo] = False
+
+        if confirmados:
+            self._guardar_en_cache(confirmados)
+        return resultados
+
+    def _guardar_en_cache(self, confirmados: Dict[str, bool]) -> None:
+        """Agrega resultados a la caché y la persiste con una sola escritura."""
+        ahora = time.time()
+        with self._lock:
+            cache = self._cargar_cache()
+            for grupo, existe in confirmados.items():
+                cache[grupo] = {"existe": existe, "fecha": ahora}
+            try:
+                escribir_json_seguro(self.archivo_cache, cache)
+            except OSError as e:
+                print(f"⚠️ No se pudo guardar la caché de grupos: {e}")
+
+    def _cargar_cache(self) -> Dict[str, Dict]:
+        """Carga la caché del disco la primera vez (llamar con el lock)."""
+        if self._cache is None:
+            self._cache = {}
+            try:
+                if existe_alguna_generacion(self.archivo_cache):
+                    self._cache = dict(leer_json_seguro(self.archivo_cache))
+            except (ErrorIntegridadDatos, OSError, ValueError) as e:
+                # Perder la caché solo obliga a consultar de nuevo
+                print(f"⚠️ Caché de grupos ignorada: {e}")
+        return self._cache
+
+    def olvidar(self) -> None:
+        """Vacía la caché (en memoria y en disco)."""
+        with self._lock:
+            self._cache = {}
+            try:
+                escribir_json_seguro(self.archivo_cache, self._cache)
+            except OSError as e:
+                print(f"⚠️ No se pudo vaciar la caché de grupos: {e}")
@@ -0,0 +1,233 @@
+"""
+Escritura diferida (write-behind) para el almacenamiento de solicitudes.
+
+Envuelve cualquier motor de almacenamiento y acumula los cambios en memoria.
+Los cambios sobre una misma solicitud dentro de la ventana configurada se
+combinan y se vuelcan en lote desde un hilo en segundo plano, de modo que
+las ediciones desde la interfaz no esperan a la escritura en disco.
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .almacenamiento import AlmacenamientoSolicitudes
+
+
+class AlmacenamientoDiferido(AlmacenamientoSolicitudes):
+    """
+    Decorador de escritura diferida sobre otro motor de almacenamiento.
+
+    - Motores incrementales: cada volcado escribe el lote con
+      ``registrar_cambios`` (una línea por solicitud en el diario o una
+      única transacción en SQLite).
+    - Motores de reescritura completa: se mantiene una copia serializada del
+      estado y cada volcado reescribe el archivo una sola vez, mediante
+      archivo temporal y renombrado atómico.
+    """
+
+    incremental = True
+
+    def __init__(self, interno: AlmacenamientoSolicitudes, ventana: float = 0.5):
+        """
+        Inicializa la escritura diferida.
+
+        Args:
+            interno: Motor que realiza la escritura real
+            ventana: Segundos durante los que se combinan cambios antes de volcar
+        """
+        super().__init__(interno.archivo)
+        self.interno = interno
+        self.ventana = ventana
+        self.consultas_indexadas = interno.consultas_indexadas
+
+        self._pendientes: Dict[str, Dict] = {}
+        # Estado completo serializado, solo para motores no incrementales
+        # (None mientras no se conozca completo)
+        self._espejo: Optional[Dict[str, Dict]] = None
+
+        self._condicion = threading.Condition()
+        self._lock_volcado = threading.Lock()
+        self._cerrado = False
+        self._hilo: Optional[threading.Thread] = None
+
+    @property
+    def ruta_datos(self) -> Path:
+        """Archivo donde residen los datos del motor interno."""
+        return self.interno.ruta_datos
+
+    def archivos_datos(self) -> List[Path]:
+        """Archivos de datos del motor interno."""
+        return self.interno.archivos_datos()
+
+    def modificado_externamente(self) -> bool:
+        """Los volcados propios actualizan la firma del motor interno."""
+        return self.interno.modificado_externamente()
+
+    @property
+    def hay_pendientes(self) -> bool:
+        """Indica si hay cambios aún no escritos."""
+        with self._condicion:
+            return bool(self._pendientes)
+
+    def existe(self) -> bool:
+        """Indica si ya existen datos persistidos o pendientes."""
+        return self.hay_pendientes or self.interno.existe()
+
+    def es_legible(self) -> bool:
+        """Verifica los datos del motor interno tras volcar lo pendiente."""
+        self.flush()
+        return self.interno.es_legible()
+
+    def cargar(self) -> List[Dict]:
+        """Vuelca lo pendiente y carga desde el motor interno."""
+        return list(self.iterar())
+
+    def iterar(self) -> Iterator[Dict]:
+        """
+        Vuelca lo pendiente y recorre los datos del motor interno.
+
+        El lock de volcado solo se toma para volcar: mantenerlo mientras el
+        llamador consume el recorrido bloquearía flush() y cerrar() durante
+        toda una carga.
+        """
+        with self._lock_volcado:
+            self._volcar_pendientes()
+            if not self.interno.incremental:
+                # Se vuelve a leer: el espejo anterior puede estar desfasado
+                self._espejo = None
+
+        if self.interno.incremental:
+            yield from self.interno.iterar()
+            return
+
+        espejo = {}
+        for registro in self.interno.iterar():
+            espejo[registro["id_solicitud"]] = registro
+            yield registro
+
+        with self._lock_volcado:
+            # Un volcado durante el recorrido ya cargó un espejo más reciente
+            if self._espejo is None:
+                self._espejo = espejo
+
+    def sincronizar_sin_leer(self, obtener_registros: Callable[[], List[Dict]]) -> None:
+        """Reconstruye el espejo si el motor interno reescribe todo el estado."""
+        with self._lock_volcado:
+            if not self.interno.incremental:
+                self._espejo = {r["id_solicitud"]: r for r in obtener_registros()}
+            self.interno.sincronizar_sin_leer(obtener_registros)
+
+    def total_estimado(self) -> Optional[int]:
+        """Cantidad aproximada de solicitudes del motor interno."""
+        return self.interno.total_estimado()
+
+    def guardar_todo(self, registros: List[Dict]) -> None:
+        """Escribe el estado completo de inmediato, descartando lo pendiente."""
+        with self._lock_volcado:
+            with self._condicion:
+                # El estado completo ya incluye los cambios acumulados
+                self._pendientes = {}
+            self.interno.guardar_todo(registros)
+            if not self.interno.incremental:
+                self._espejo = {r["id_solicitud"]: r for r in registros}
+
+    def registrar_cambio(self, registro: Dict) -> None:
+        """Encola un cambio; se escribirá al vencer la ventana."""
+        with self._condicion:
+            if self._cerrado:
+                raise RuntimeError("El almacenamiento diferido está cerrado")
+
+            estaba_vacio = not self._pendientes
+            # Un cambio posterior sobre la misma solicitud reemplaza al anterior
+            self._pendientes[registro["id_solicitud"]] = registro
+            self._asegurar_hilo()
+            if estaba_vacio:
+                self._condicion.notify_all()
+
+    def registrar_cambios(self, registros: List[Dict]) -> None:
+        """Encola un lote de cambios."""
+        for registro in registros:
+            self.registrar_cambio(registro)
+
+    def flush(self) -> None:
+        """Escribe de inmediato todos los cambios pendientes."""
+        with self._lock_volcado:
+            self._volcar_pendientes()
+
+    def cerrar(self) -> None:
+        """Detiene el hilo de volcado, escribe lo pendiente y cierra el motor."""
+        with self._condicion:
+            if self._cerrado:
+                return
+            self._cerrado = True
+            self._condicion.notify_all()
+
+        if self._hilo and self._hilo is not threading.current_thread():
+            self._hilo.join()
+
+        self.flush()
+        self.interno.cerrar()
+
+    # Consultas indexadas: se resuelven sobre datos ya volcados
+
+    def contar_por_estado(self) -> Dict[str, int]:
+        """Cuenta por estado en el motor interno."""
+        self.flush()
+        return self.interno.contar_por_estado()
+
+    def contar(self, estado: Optional[str] = None) -> int:
+        """Cuenta solicitudes en el motor interno."""
+        self.flush()
+        return self.interno.contar(estado)
+
+    def _asegurar_hilo(self) -> None:
+        """Arranca el hilo de volcado si aún no existe (con la condición tomada)."""
+        if self._hilo is None or not self._hilo.is_alive():
+            self._hilo = threading.Thread(
+                target=self._bucle_volcado, name="escritura-diferida", daemon=True
+            )
+            self._hilo.start()
+
+    def _bucle_volcado(self) -> None:
+        """Espera cambios, deja pasar la ventana y los vuelca en lote."""
+        while True:
+            with self._condicion:
+                while not self._pendientes and not self._cerrado:
+                    self._condicion.wait()
+                if self._cerrado:
+                    return
+                # Solo cerrar() interrumpe la ventana de combinación
+                self._condicion.wait(timeout=self.ventana)
+
+            self.flush()
+
+    def _volcar_pendientes(self) -> None:
+        """Escribe el lote pendiente (requiere el lock de volcado)."""
+        with self._condicion:
+            pendientes = self._pendientes
+            self._pendientes = {}
+
+        if not pendientes:
+            return
+
+        try:
+            if self.interno.incremental:
+                self.interno.registrar_cambios(list(pendientes.values()))
+            else:
+                if self._espejo is None:
+                    # Reescribir solo los cambios perdería el resto de la BD
+                    self._espejo = (
+                        {r["id_solicitud"]: r for r in self.interno.iterar()}
+                        if self.interno.existe()
+                        else {}
+                    )
+                self._espejo.update(pendientes)
+                self.interno.guardar_todo(list(self._espejo.values()))
+            print(f"💾 Escritura diferida: {len(pendientes)} cambios volcados")
+        except Exception as e:
+            print(f"❌ Error en escritura diferida, se reintentará: {e}")
+            with self._condicion:
+                # Los cambios más recientes tienen prioridad sobre los fallidos
+                for id_solicitud, registro in pendientes.items():
+                    self._pendientes.setdefault(id_solicitud, registro)
@@ -0,0 +1,268 @@
+"""
+Escritura y lectura duraderas de archivos JSON.
+
+Capa común para todas las BD locales en JSON (solicitudes y autorizadores):
+- Escritura en archivo temporal, fsync y renombrado atómico
+- Suma de verificación SHA-256 del contenido en un archivo ``.sha256``
+- Conservación de la generación anterior (``.anterior``) para recuperarse
+  automáticamente si el archivo actual está truncado o dañado
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Optional, Tuple
+
+# Bytes leídos por bloque al calcular la suma de un archivo
+TAMANO_BLOQUE_SUMA = 1024 * 1024
+
+
+class ErrorIntegridadDatos(Exception):
+    """Ninguna generación del archivo supera la verificación de integridad."""
+
+
+def ruta_suma(archivo: Path) -> Path:
+    """Ruta del archivo con la suma SHA-256 de ``archivo``."""
+    return archivo.with_name(archivo.name + ".sha256")
+
+
+def ruta_anterior(archivo: Path) -> Path:
+    """Ruta de la generación anterior de ``archivo``."""
+    return archivo.with_name(archivo.name + ".anterior")
+
+
+def calcular_suma(contenido: bytes) -> str:
+    """Calcula la suma SHA-256 en hexadecimal de un contenido."""
+    return hashlib.sha256(contenido).hexdigest()
+
+
+def escribir_bytes_seguro(archivo: Path, contenido: bytes) -> None:
+    """
+    Reemplaza un archivo de forma atómica y duradera.
+
+    Args:
+        archivo: Ruta del archivo destino
+        contenido: Contenido completo a escribir
+    """
+    archivo = Path(archivo)
+    archivo.parent.mkdir(parents=True, exist_ok=True)
+
+    temporal = archivo.with_name(archivo.name + ".tmp")
+    suma = ruta_suma(archivo)
+    suma_temporal = suma.with_name(suma.name + ".tmp")
+
+    _escribir_sincronizado(temporal, contenido)
+    _escribir_sincronizado(suma_temporal, calcular_suma(contenido).encode("ascii"))
+
+    # La generación actual pasa a ser la anterior sin dejar de existir
+    if archivo.exists():
+        _conservar_generacion(archivo, ruta_anterior(archivo))
+        if suma.exists():
+            _conservar_generacion(suma, ruta_suma(ruta_anterior(archivo)))
+        else:
+            _eliminar_si_existe(ruta_suma(ruta_anterior(archivo)))
+
+    os.replace(temporal, archivo)
+    os.replace(suma_temporal, suma)
+    _sincronizar_directorio(archivo.parent)
+
+
+def escribir_json_seguro(archivo: Path, datos: Any) -> None:
+    """
+    Escribe un documento JSON con el formato legible de la aplicación.
+
+    Args:
+        archivo: Ruta del archivo JSON destino
+        datos: Objeto serializable a JSON
+    """
+    contenido = json.dumps(datos, indent=2, ensure_ascii=False).encode("utf-8")
+    escribir_bytes_seguro(archivo, contenido)
+
+
+def leer_bytes_seguro(archivo: Path) -> bytes:
+    """
+    Lee el contenido verificado de la generación válida más reciente.
+
+    Args:
+        archivo: Ruta del archivo
+
+    Returns:
+        Contenido del archivo
+
+    Raises:
+        FileNotFoundError: Si no existe ninguna generación
+        ErrorIntegridadDatos: Si ninguna generación supera la verificación
+    """
+    for generacion, _ in generaciones_verificadas(archivo):
+        return generacion.read_bytes()
+    raise ErrorIntegridadDatos(f"No hay generaciones válidas de {archivo}")
+
+
+def leer_json_seguro(archivo: Path) -> Any:
+    """
+    Lee un documento JSON verificando su suma y su sintaxis.
+
+    Si la generación actual está dañada se usa automáticamente la anterior.
+
+    Args:
+        archivo: Ruta del archivo JSON
+
+    Returns:
+        Objeto JSON decodificado
+
+    Raises:
+        FileNotFoundError: Si no existe ninguna generación
+        ErrorIntegridadDatos: Si ninguna generación es válida
+    """
+    for generacion, _ in generaciones_verificadas(archivo):
+        try:
+            return json.loads(generacion.read_bytes().decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            print(f"⚠️ JSON inválido en {generacion.name}: {e}")
+    raise ErrorIntegridadDatos(f"No hay generaciones válidas de {archivo}")
+
+
+def existe_alguna_generacion(archivo: Path) -> bool:
+    """Indica si existe el archivo o su generación anterior."""
+    archivo = Path(archivo)
+    return archivo.exists() or ruta_anterior(archivo).exists()
+
+
+def apartar_generaciones_danadas(archivo: Path) -> Optional[Path]:
+    """
+    Renombra todas las generaciones de un archivo que no se pudo recuperar.
+
+    Evita que el siguiente guardado sobrescriba los datos dañados, que quedan
+    disponibles para una recuperación manual.
+
+    Args:
+        archivo: Ruta del archivo dañado
+
+    Returns:
+        Ruta a la que se movió el archivo principal, o None si no existía
+    """
+    archivo = Path(archivo)
+    sufijo = f".danado_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    apartado = None
+
+    for generacion in (archivo, ruta_anterior(archivo)):
+        for ruta in (generacion, ruta_suma(generacion)):
+            if ruta.exists():
+                destino = ruta.with_name(ruta.name + sufijo)
+                os.replace(ruta, destino)
+                if ruta == archivo:
+                    apartado = destino
+
+    return apartado
+
+
+def anexar_sincronizado(archivo: Path, texto: str) -> None:
+    """
+    Anexa texto al final de un archivo y lo sincroniza con el disco.
+
+    Args:
+        archivo: Ruta del archivo
+        texto: Texto a anexar (UTF-8)
+    """
+    with open(archivo, "a", encoding="utf-8") as file:
+        file.write(texto)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def generaciones_verificadas(archivo: Path) -> Iterator[Tuple[Path, bool]]:
+    """
+    Recorre las generaciones de un archivo cuya suma es correcta.
+
+    La suma se calcula leyendo por bloques, con memoria constante.
+
+    Args:
+        archivo: Ruta del archivo
+
+    Yields:
+        Tuplas (ruta, verificada); verificada es False si la generación no
+        tiene suma guardada (archivos anteriores a la escritura segura)
+
+    Raises:
+        FileNotFoundError: Si no existe ninguna generación
+    """
+    archivo = Path(archivo)
+    existe_alguna = False
+
+    for numero, generacion in enumerate((archivo, ruta_anterior(archivo))):
+        if not generacion.exists():
+            continue
+        existe_alguna = True
+
+        suma_esperada = _leer_suma(ruta_suma(generacion))
+        if suma_esperada is not None and suma_esperada != _calcular_suma_archivo(
+            generacion
+        ):
+            print(f"⚠️ Suma de verificación incorrecta en {generacion.name}")
+            continue
+
+        if numero > 0:
+            print(f"♻️ Recuperando la generación anterior: {generacion.name}")
+        yield generacion, suma_esperada is not None
+
+    if not existe_alguna:
+        raise FileNotFoundError(str(archivo))
+
+
+def _calcular_suma_archivo(archivo: Path) -> str:
+    """Calcula la suma SHA-256 de un archivo leyéndolo por bloques."""
+    suma = hashlib.sha256()
+    with open(archivo, "rb") as file:
+        for bloque in iter(lambda: file.read(TAMANO_BLOQUE_SUMA), b""):
+            suma.update(bloque)
+    return suma.hexdigest()
+
+
+def _leer_suma(archivo: Path) -> Optional[str]:
+    """Lee una suma guardada; None si no existe (archivos anteriores a la capa)."""
+    try:
+        return archivo.read_text(encoding="ascii").strip()
+    except FileNotFoundError:
+        return None
+
+
+def _escribir_sincronizado(archivo: Path, contenido: bytes) -> None:
+    """Escribe un archivo completo y fuerza su contenido al disco."""
+    with open(archivo, "wb") as file:
+        file.write(contenido)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def _conservar_generacion(origen: Path, destino: Path) -> None:
+    """Enlaza (o copia) ``origen`` como ``destino`` de forma atómica."""
+    temporal = destino.with_name(destino.name + ".tmp")
+    _eliminar_si_existe(temporal)
+    try:
+        os.link(origen, temporal)
+    except OSError:
+        # Sistemas de archivos sin enlaces duros
+        shutil.copy2(origen, temporal)
+    os.replace(temporal, destino)
+
+
+def _eliminar_si_existe(archivo: Path) -> None:
+    """Elimina un archivo si existe."""
+    try:
+        archivo.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _sincronizar_directorio(directorio: Path) -> None:
+    """Sincroniza la entrada de directorio tras un renombrado (solo POSIX)."""
+    if os.name != "posix":
+        return
+    descriptor = os.open(directorio, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
@@ -0,0 +1,136 @@
+"""
+Extracción de códigos de aplicación desde nombres de grupos de red.
+
+Los patrones se compilan una sola vez y cada extractor recuerda los códigos
+de los últimos grupos consultados, de modo que una lista pegada con miles de
+grupos (muchos repetidos) solo analiza cada nombre distinto una vez. El
+resultado conserva el orden de aparición y no repite códigos.
+
+Clases:
+    ExtractorCodigos: códigos que coinciden con una expresión regular
+    ExtractorSegmentos: segmentos de una longitud dada al separar el nombre
+
+Extractores disponibles:
+    EXTRACTOR_CODIGO_NUEVO: segmentos alfanuméricos con forma de código
+        (4 caracteres y, opcionalmente, un sufijo numérico como en QASD1),
+        candidatos a códigos de aplicaciones aún no registradas
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+# Grupos distintos cuyos códigos recuerda cada extractor
+TAMANO_CACHE_GRUPOS = 4096
+
+PATRON_ALFANUMERICO = r"[A-Z0-9]{4}"
+PATRON_DELIMITADO = r"_([A-Z]{4})_"
+PATRON_CODIGO_NUEVO = r"(?<![A-Z0-9])([A-Z0-9]{4})[0-9]*(?![A-Z0-9])"
+
+
+class ExtractorCodigos:
+    """Extractor de códigos basado en una expresión regular precompilada."""
+
+    def __init__(
+        self,
+        patron: str = PATRON_ALFANUMERICO,
+        mayusculas: bool = True,
+        tamano_cache: int = TAMANO_CACHE_GRUPOS,
+    ):
+        """
+        Inicializa el extractor.
+
+        Args:
+            patron: Expresión regular; si tiene un grupo, el código es ese grupo
+            mayusculas: Pasar el nombre a mayúsculas antes de buscar
+            tamano_cache: Grupos distintos que se recuerdan (LRU)
+        """
+        self.patron = re.compile(patron)
+        self.mayusculas = mayusculas
+        self.codigos_de_grupo = lru_cache(maxsize=tamano_cache)(self._buscar)
+
+    def _buscar(self, grupo: str) -> Tuple[str, ...]:
+        """Códigos de un grupo, sin repetir y en orden de aparición."""
+        if self.mayusculas:
+            grupo = grupo.upper()
+        return tuple(dict.fromkeys(self.patron.findall(grupo)))
+
+    def extraer(self, grupos: Iterable[str]) -> List[str]:
+        """
+        Extrae los códigos de varios grupos.
+
+        Args:
+            grupos: Nombres de grupos de red
+
+        Returns:
+            Códigos únicos en orden de aparición
+        """
+        codigos_de_grupo = self.codigos_de_grupo
+        codigos: Dict[str, None] = {}
+        # Los grupos repetidos se analizan una sola vez
+        for grupo in dict.fromkeys(grupos):
+            codigos.update(dict.fromkeys(codigos_de_grupo(grupo)))
+        return list(codigos)
+
+    def extraer_por_grupo(self, grupos: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+        """
+        Extrae los códigos de cada grupo por separado.
+
+        Args:
+            grupos: Nombres de grupos de red
+
+        Returns:
+            Códigos de cada grupo distinto, en orden de aparición
+        """
+        return {grupo: self.codigos_de_grupo(grupo) for grupo in dict.fromkeys(grupos)}
+
+    def extraer_de_texto(self, texto: str) -> List[str]:
+        """
+        Extrae los códigos de una lista de grupos pegada como texto.
+
+        Args:
+            texto: Un grupo por línea (se ignoran líneas vacías y espacios)
+
+        Returns:
+            Códigos únicos en orden de aparición
+        """
+        return self.extraer(
+            linea.strip() for linea in texto.splitlines() if linea.strip()
+        )
+
+
+class ExtractorSegmentos(ExtractorCodigos):
+    """Extractor que toma los segmentos alfabéticos de 4 caracteres."""
+
+    def __init__(
+        self,
+        separador: str = "_",
+        longitud: int = 4,
+        tamano_cache: int = TAMANO_CACHE_GRUPOS,
+    ):
+        """
+        Inicializa el extractor.
+
+        Args:
+            separador: Separador de los segmentos del nombre
+            longitud: Longitud de los segmentos que son códigos
+            tamano_cache: Grupos distintos que se recuerdan (LRU)
+        """
+        super().__init__(
+            re.escape(separador), mayusculas=False, tamano_cache=tamano_cache
+        )
+        self.separador = separador
+        self.longitud = longitud
+
+    def _buscar(self, grupo: str) -> Tuple[str, ...]:
+        """Segmentos alfabéticos del grupo, sin repetir y en orden de aparición."""
+        return tuple(
+            dict.fromkeys(
+                parte
+                for parte in self.patron.split(grupo)
+                if len(parte) == self.longitud and parte.isalpha()
+            )
+        )
+
+
+EXTRACTOR_CODIGO_NUEVO = ExtractorCodigos(PATRON_CODIGO_NUEVO, mayusculas=True)
@@ -0,0 +1,135 @@
+"""
+Generación de identificadores únicos de solicitud.
+
+Los IDs combinan la fecha y hora de creación con un número de secuencia
+persistido junto a la BD local (``solicitudes_conformidad.secuencia``). La
+secuencia se reserva por bloques bajo un bloqueo de archivo, de modo que
+varios procesos nunca obtienen el mismo número y cada asignación es O(1):
+no depende de cuántas solicitudes existen ni recorre las existentes.
+"""
+
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+# Números de secuencia reservados en cada acceso al archivo
+TAMANO_BLOQUE_IDS = 64
+
+
+class GeneradorIds:
+    """Asignador monótono de IDs con secuencia persistida."""
+
+    def __init__(
+        self,
+        archivo: Path,
+        prefijo: str = "SOL",
+        tamano_bloque: int = TAMANO_BLOQUE_IDS,
+    ):
+        """
+        Inicializa el generador.
+
+        Args:
+            archivo: Archivo donde se persiste la última secuencia reservada
+            prefijo: Prefijo de los IDs generados
+            tamano_bloque: Números reservados en cada acceso al archivo
+        """
+        self.archivo = Path(archivo)
+        self.prefijo = prefijo
+        self.tamano_bloque = max(1, tamano_bloque)
+
+        # Tramo [_proximo, _limite) ya reservado por este proceso
+        self._proximo = 0
+        self._limite = 0
+        self._lock = threading.Lock()
+
+    def siguiente(self) -> str:
+        """
+        Asigna un ID nuevo.
+
+        Returns:
+            ID con el formato ``SOL_AAAAMMDD_HHMMSS_NNNNNN``
+        """
+        return self.reservar(1)[0]
+
+    def reservar(self, cantidad: int) -> List[str]:
+        """
+        Asigna varios IDs consecutivos con a lo sumo un acceso al archivo.
+
+        Args:
+            cantidad: Cantidad de IDs
+
+        Returns:
+            IDs en orden creciente
+        """
+        with self._lock:
+            if self._limite - self._proximo < cantidad:
+                # El resto del tramo anterior se descarta: los huecos no
+                # afectan a la unicidad y el lote recibe números consecutivos
+                tamano = max(cantidad, self.tamano_bloque)
+                self._proximo = self._reservar_bloque(tamano)
+                self._limite = self._proximo + tamano
+
+            secuencias = range(self._proximo, self._proximo + cantidad)
+            self._proximo += cantidad
+            marca = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        return [f"{self.prefijo}_{marca}_{secuencia:06d}" for secuencia in secuencias]
+
+    def _reservar_bloque(self, cantidad: int) -> int:
+        """
+        Reserva números en el archivo de secuencia bajo bloqueo exclusivo.
+
+        Args:
+            cantidad: Cantidad de números a reservar
+
+        Returns:
+            Primer número reservado
+        """
+        self.archivo.parent.mkdir(parents=True, exist_ok=True)
+        descriptor = os.open(self.archivo, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _bloquear(descriptor)
+            try:
+                contenido = os.read(descriptor, 64).strip()
+                ultima = int(contenido) if contenido else 0
+                nueva = ultima + cantidad
+
+                os.lseek(descriptor, 0, os.SEEK_SET)
+                os.ftruncate(descriptor, 0)
+                os.write(descriptor, str(nueva).encode("ascii"))
+                os.fsync(descriptor)
+            finally:
+                _desbloquear(descriptor)
+        finally:
+            os.close(descriptor)
+
+        return ultima + 1
+
+
+def _bloquear(descriptor: int) -> None:
+    """Toma el bloqueo exclusivo del archivo (espera si otro proceso lo tiene)."""
+    if os.name == "nt":
+        import msvcrt
+
+        os.lseek(descriptor, 0, os.SEEK_SET)
+        msvcrt.locking(descriptor, msvcrt.LK_LOCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(descriptor, fcntl.LOCK_EX)
+    os.lseek(descriptor, 0, os.SEEK_SET)
+
+
+def _desbloquear(descriptor: int) -> None:
+    """Libera el bloqueo tomado con _bloquear."""
+    if os.name == "nt":
+        import msvcrt
+
+        os.lseek(descriptor, 0, os.SEEK_SET)
+        msvcrt.locking(descriptor, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(descriptor, fcntl.LOCK_UN)
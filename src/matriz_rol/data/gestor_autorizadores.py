@@ -5,11 +5,20 @@ Maneja el almacenamiento y consulta de información de autorizadores
 para todas las aplicaciones del sistema.
 """
 
-import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 
+from ..rutas import directorio_datos
+from .automata_codigos import AutomataCodigos
+from .escritura_segura import (
+    ErrorIntegridadDatos,
+    apartar_generaciones_danadas,
+    escribir_json_seguro,
+    existe_alguna_generacion,
+    leer_json_seguro,
+)
+
 
 class GestorAutorizadores:
     """Gestor para la base de datos de autorizadores."""
@@ -18,26 +27,26 @@ class GestorAutorizadores:
         """Inicializa el gestor de autorizadores."""
         self.ruta_bd = self._obtener_ruta_bd()
         self.autorizadores_bd: Dict[str, Dict] = {}
+        # Códigos conocidos, para reconocerlos en los nombres de grupos
+        self.automata = AutomataCodigos()
         self.cargar_autorizadores()
 
     def _obtener_ruta_bd(self) -> Path:
         """Obtiene la ruta del archivo de base de datos de autorizadores."""
-        # Buscar primero en la raíz del proyecto
-        ruta_proyecto = Path(__file__).parents[3] / "data" / "autorizadores_bd.json"
-        if ruta_proyecto.parent.exists():
-            return ruta_proyecto
-
-        # Fallback a ubicación por defecto
-        ruta_proyecto.parent.mkdir(parents=True, exist_ok=True)
-        return ruta_proyecto
+        return directorio_datos() / "autorizadores_bd.json"
 
     def cargar_autorizadores(self) -> bool:
         """Carga la base de datos de autorizadores desde archivo."""
         try:
-            if self.ruta_bd.exists():
-                with open(self.ruta_bd, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.autorizadores_bd = data.get("autorizadores", {})
+            return self._cargar_autorizadores()
+        finally:
+            self.automata.reconstruir(self.autorizadores_bd)
+
+    def _cargar_autorizadores(self) -> bool:
+        try:
+            if existe_alguna_generacion(self.ruta_bd):
+                data = leer_json_seguro(self.ruta_bd)
+                self.autorizadores_bd = data.get("autorizadores", {})
                 print(
                     f"📂 BD Autorizadores cargada: {len(self.autorizadores_bd)} aplicaciones"
                 )
@@ -46,9 +55,16 @@ class GestorAutorizadores:
                 print("📂 BD Autorizadores no existe, creando nueva...")
                 self._crear_bd_inicial()
                 return True
+        except ErrorIntegridadDatos as e:
+            print(f"❌ BD autorizadores dañada y sin generación recuperable: {e}")
+            apartado = apartar_generaciones_danadas(self.ruta_bd)
+            if apartado:
+                print(f"🗃️ Datos dañados conservados en: {apartado.name}")
+            self.autorizadores_bd = {}
+            return False
         except Exception as e:
+            # Se conservan los datos en memoria para no sobrescribir la BD
             print(f"❌ Error cargando BD autorizadores: {e}")
-            self.autorizadores_bd = {}
             return False
 
     def _crear_bd_inicial(self):
@@ -139,8 +155,7 @@ class GestorAutorizadores:
                 "autorizadores": self.autorizadores_bd,
             }
 
-            with open(self.ruta_bd, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            escribir_json_seguro(self.ruta_bd, data)
 
             print(f"💾 BD Autorizadores guardada: {self.ruta_bd}")
             return True
@@ -163,6 +178,47 @@ class GestorAutorizadores:
                 print(f"⚠️ Autorizador no encontrado para código: {codigo}")
         return autorizadores
 
+    def buscar_codigos_conocidos(self, grupos: Iterable[str]) -> List[str]:
+        """
+        Obtiene los códigos de la BD que aparecen en los grupos de red.
+
+        Args:
+            grupos: Nombres de grupos de red
+
+        Returns:
+            Códigos únicos en orden de aparición
+        """
+        return self.automata.codigos_en(grupos)
+
+    def extraer_codigos_aplicacion(
+        self, grupos: Iterable[str]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Obtiene los códigos de los grupos de red: los de la BD y, por
+        separado, los de aplicaciones aún no registradas.
+
+        Args:
+            grupos: Nombres de grupos de red
+
+        Returns:
+            Tupla (conocidos, nuevos); solo los conocidos tienen autorizador
+        """
+        return self.automata.extraer(grupos)
+
+    def ubicar_codigos_conocidos(
+        self, grupos: Iterable[str]
+    ) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Ubica los códigos de la BD dentro de cada grupo de red.
+
+        Args:
+            grupos: Nombres de grupos de red
+
+        Returns:
+            Pares (código, posición) de cada grupo distinto
+        """
+        return self.automata.ubicar(grupos)
+
     def obtener_todos_los_autorizadores(self) -> List[Dict]:
         """Obtiene todos los autorizadores de la base de datos."""
         return list(self.autorizadores_bd.values())
@@ -179,6 +235,7 @@ class GestorAutorizadores:
             datos_autorizador["fecha_actualizacion"] = datetime.now().isoformat()
 
             self.autorizadores_bd[codigo] = datos_autorizador
+            self.automata.agregar(codigo)
             self.guardar_autorizadores()
             print(f"✅ Autorizador agregado: {codigo}")
             return True
@@ -211,6 +268,7 @@ class GestorAutorizadores:
             codigo = codigo.upper()
             if codigo in self.autorizadores_bd:
                 del self.autorizadores_bd[codigo]
+                self.automata.quitar(codigo)
                 self.guardar_autorizadores()
                 print(f"✅ Autorizador eliminado: {codigo}")
                 return True
@@ -4,12 +4,42 @@ Modelo de datos para gestionar solicitudes de conformidad.
 Maneja el ciclo completo: creación, seguimiento, y cierre de solicitudes.
 """
 
-import json
+import os
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from contextlib import closing, contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Dict,
+    FrozenSet,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 from enum import Enum
 
+from ..rutas import directorio_datos
+from .almacenamiento import AlmacenamientoSolicitudes, crear_almacenamiento
+from .escritura_diferida import AlmacenamientoDiferido
+from .escritura_segura import ErrorIntegridadDatos, apartar_generaciones_danadas
+from .generador_ids import GeneradorIds
+from .internado import TABLA_AUTORIZADORES, internar_grupos
+from .snapshot_binario import (
+    ErrorSnapshot,
+    escribir_snapshot,
+    leer_firma_snapshot,
+    leer_snapshot,
+    ruta_snapshot,
+)
+
 
 class EstadoSolicitud(Enum):
     """Estados posibles de una solicitud según el proceso real."""
@@ -20,8 +50,124 @@ class EstadoSolicitud(Enum):
     CERRADO = "Cerrado"
 
 
+# Clave de cada estado en el diccionario de obtener_estadisticas()
+CLAVES_ESTADISTICAS = {
+    EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES: "en_solicitud",
+    EstadoSolicitud.EN_HELPDESK: "en_helpdesk",
+    EstadoSolicitud.ATENDIDO: "atendido",
+    EstadoSolicitud.CERRADO: "cerrado",
+}
+
+# Transiciones de estado permitidas; mantener el mismo estado siempre lo está
+TRANSICIONES_ESTADO: Dict[EstadoSolicitud, FrozenSet[EstadoSolicitud]] = {
+    EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES: frozenset(
+        {
+            EstadoSolicitud.EN_HELPDESK,
+            EstadoSolicitud.ATENDIDO,
+            EstadoSolicitud.CERRADO,
+        }
+    ),
+    EstadoSolicitud.EN_HELPDESK: frozenset(
+        {
+            EstadoSolicitud.ATENDIDO,
+            EstadoSolicitud.CERRADO,
+            EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES,  # Para revertir
+        }
+    ),
+    EstadoSolicitud.ATENDIDO: frozenset(
+        {
+            EstadoSolicitud.CERRADO,
+            EstadoSolicitud.EN_HELPDESK,  # Para revertir
+        }
+    ),
+    EstadoSolicitud.CERRADO: frozenset(
+        {EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES}  # Solo reapertura
+    ),
+}
+
+# Estados que se ofrecen al editar el estado en la grilla (sin reversiones)
+ESTADOS_SIGUIENTES: Dict[EstadoSolicitud, Tuple[EstadoSolicitud, ...]] = {
+    EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES: (
+        EstadoSolicitud.EN_HELPDESK,
+        EstadoSolicitud.ATENDIDO,
+        EstadoSolicitud.CERRADO,
+    ),
+    EstadoSolicitud.EN_HELPDESK: (
+        EstadoSolicitud.ATENDIDO,
+        EstadoSolicitud.CERRADO,
+    ),
+    EstadoSolicitud.ATENDIDO: (EstadoSolicitud.CERRADO,),
+    EstadoSolicitud.CERRADO: (EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES,),
+}
+
+# Solicitudes construidas entre cada aviso de progreso de la carga
+TAMANO_LOTE_CARGA = 500
+
+# Eventos que GestorSolicitudes notifica a sus suscriptores
+EVENTO_CREADA = "creada"
+EVENTO_MODIFICADA = "modificada"
+EVENTO_RECARGADA = "recargada"
+# Varias solicitudes cambiaron a la vez (lote o transacción); sin solicitud
+EVENTO_LOTE = "lote"
+
+
+class CargaCancelada(Exception):
+    """La carga en segundo plano se interrumpió al cerrar el gestor."""
+
+
+def clave_orden(solicitud: "SolicitudConformidad") -> Tuple[str, str]:
+    """
+    Clave de orden por creación: la fecha y, para desempatar, el ID.
+
+    Las solicitudes de un mismo lote comparten fecha; el ID (reservado en
+    orden) las mantiene en orden de creación en todas las vistas.
+    """
+    return (solicitud.fecha_creacion, solicitud.id_solicitud)
+
+
+def validar_transicion_estado(
+    estado_actual: EstadoSolicitud, estado_nuevo: EstadoSolicitud
+) -> Tuple[bool, str]:
+    """
+    Valida si una transición de estado es permitida.
+
+    Args:
+        estado_actual: Estado actual de la solicitud
+        estado_nuevo: Estado al que se quiere cambiar
+
+    Returns:
+        Tupla (es_valida, mensaje_error)
+    """
+    if estado_actual is estado_nuevo or estado_nuevo in TRANSICIONES_ESTADO.get(
+        estado_actual, ()
+    ):
+        return True, ""
+    return (
+        False,
+        f"No se puede cambiar de '{estado_actual.value}' a '{estado_nuevo.value}'",
+    )
+
+
 class SolicitudConformidad:
-    """Representa una solicitud de conformidad."""
+    """
+    Representa una solicitud de conformidad.
+
+    Usa ``__slots__`` y comparte los datos repetidos entre solicitudes: los
+    grupos de red son tuplas de textos internados y los autorizadores son
+    referencias a registros de solo lectura de TABLA_AUTORIZADORES.
+    """
+
+    __slots__ = (
+        "_observador",
+        "id_solicitud",
+        "fecha_creacion",
+        "_grupos_red",
+        "_autorizadores",
+        "_estado",
+        "_ticket_helpdesk",
+        "fecha_cierre",
+        "observaciones",
+    )
 
     def __init__(
         self,
@@ -47,6 +193,11 @@ class SolicitudConformidad:
             fecha_cierre: Fecha de cierre (si está cerrada)
             observaciones: Observaciones adicionales
         """
+        # Función notificada cuando cambia un campo indexado (la fija el gestor)
+        self._observador: Optional[
+            Callable[["SolicitudConformidad", str, Any, Any], None]
+        ] = None
+
         self.id_solicitud = id_solicitud
         self.fecha_creacion = fecha_creacion
         self.grupos_red = grupos_red
@@ -56,13 +207,55 @@ class SolicitudConformidad:
         self.fecha_cierre = fecha_cierre
         self.observaciones = observaciones
 
+    @property
+    def grupos_red(self) -> Tuple[str, ...]:
+        """Grupos de red solicitados (tupla de textos internados)."""
+        return self._grupos_red
+
+    @grupos_red.setter
+    def grupos_red(self, valor: List[str]):
+        self._grupos_red = internar_grupos(valor)
+
+    @property
+    def autorizadores(self) -> Tuple[Mapping[str, Any], ...]:
+        """Autorizadores de la solicitud (registros compartidos, solo lectura)."""
+        return self._autorizadores
+
+    @autorizadores.setter
+    def autorizadores(self, valor: List[Dict[str, str]]):
+        self._autorizadores = TABLA_AUTORIZADORES.internar_lista(valor)
+
+    @property
+    def estado(self) -> EstadoSolicitud:
+        """Estado actual de la solicitud."""
+        return self._estado
+
+    @estado.setter
+    def estado(self, valor: EstadoSolicitud):
+        anterior = getattr(self, "_estado", None)
+        self._estado = valor
+        if self._observador and anterior is not valor:
+            self._observador(self, "estado", anterior, valor)
+
+    @property
+    def ticket_helpdesk(self) -> Optional[str]:
+        """Número de ticket del helpdesk."""
+        return self._ticket_helpdesk
+
+    @ticket_helpdesk.setter
+    def ticket_helpdesk(self, valor: Optional[str]):
+        anterior = getattr(self, "_ticket_helpdesk", None)
+        self._ticket_helpdesk = valor
+        if self._observador and anterior != valor:
+            self._observador(self, "ticket_helpdesk", anterior, valor)
+
     def to_dict(self) -> Dict:
         """Convierte la solicitud a diccionario para persistencia."""
         return {
             "id_solicitud": self.id_solicitud,
             "fecha_creacion": self.fecha_creacion,
-            "grupos_red": self.grupos_red,
-            "autorizadores": self.autorizadores,
+            "grupos_red": list(self._grupos_red),
+            "autorizadores": [dict(registro) for registro in self._autorizadores],
             "estado": self.estado.value,
             "ticket_helpdesk": self.ticket_helpdesk,
             "fecha_cierre": self.fecha_cierre,
@@ -83,6 +276,36 @@ class SolicitudConformidad:
             observaciones=data.get("observaciones"),
         )
 
+    @classmethod
+    def desde_campos_compartidos(
+        cls,
+        id_solicitud: str,
+        fecha_creacion: str,
+        grupos_red: Tuple[str, ...],
+        autorizadores: Tuple[Mapping[str, Any], ...],
+        estado: EstadoSolicitud,
+        ticket_helpdesk: Optional[str],
+        fecha_cierre: Optional[str],
+        observaciones: Optional[str],
+    ) -> "SolicitudConformidad":
+        """
+        Crea una solicitud con grupos y autorizadores ya internados.
+
+        La usa la carga del snapshot binario, que construye cada conjunto
+        distinto una sola vez y lo comparte entre solicitudes.
+        """
+        solicitud = cls.__new__(cls)
+        solicitud._observador = None
+        solicitud.id_solicitud = id_solicitud
+        solicitud.fecha_creacion = fecha_creacion
+        solicitud._grupos_red = grupos_red
+        solicitud._autorizadores = autorizadores
+        solicitud._estado = estado
+        solicitud._ticket_helpdesk = ticket_helpdesk
+        solicitud.fecha_cierre = fecha_cierre
+        solicitud.observaciones = observaciones
+        return solicitud
+
     def cerrar_solicitud(self, ticket_helpdesk: str, observaciones: str = ""):
         """Cierra la solicitud con el ticket del helpdesk."""
         self.estado = EstadoSolicitud.CERRADO
@@ -108,11 +331,107 @@ class SolicitudConformidad:
         self.observaciones = observaciones
 
 
+class CursorSolicitudes:
+    """
+    Cursor sobre el índice de solicitudes ordenado por fecha descendente.
+
+    No copia las solicitudes: cada consulta se resuelve sobre el índice
+    actual del gestor, por lo que refleja creaciones y cambios de estado.
+    """
+
+    def __init__(
+        self, gestor: "GestorSolicitudes", estado: Optional[EstadoSolicitud] = None
+    ):
+        """
+        Inicializa el cursor.
+
+        Args:
+            gestor: Gestor cuyas solicitudes se recorren
+            estado: Estado a filtrar, o None para todas
+        """
+        self.gestor = gestor
+        self.estado = estado
+
+    def __len__(self) -> int:
+        """Cantidad de solicitudes que recorre el cursor."""
+        return self.gestor.contar_solicitudes(self.estado)
+
+    def obtener(self, desplazamiento: int, limite: int) -> List[SolicitudConformidad]:
+        """
+        Obtiene un tramo de solicitudes.
+
+        Args:
+            desplazamiento: Posición de la primera solicitud (0 = más reciente)
+            limite: Cantidad máxima de solicitudes
+
+        Returns:
+            Solicitudes del tramo, más recientes primero
+        """
+        return self.gestor.obtener_pagina_solicitudes(
+            desplazamiento, limite, self.estado
+        )
+
+
+class ResultadoTransiciones:
+    """Resultado de GestorSolicitudes.aplicar_transiciones."""
+
+    def __init__(self):
+        """Inicializa un resultado vacío."""
+        # IDs de las solicitudes actualizadas, en el orden recibido
+        self.aplicadas: List[str] = []
+        # Tuplas (id_solicitud, motivo) de los cambios rechazados
+        self.fallidas: List[Tuple[str, str]] = []
+
+    @property
+    def exitoso(self) -> bool:
+        """Indica si se aplicaron todos los cambios."""
+        return not self.fallidas
+
+    def resumen(self, limite: int = 20) -> str:
+        """
+        Texto con la cantidad de cambios aplicados y el motivo de cada fallo.
+
+        Args:
+            limite: Cantidad máxima de fallos detallados
+        """
+        lineas = [f"✅ {len(self.aplicadas)} solicitudes actualizadas"]
+        if self.fallidas:
+            lineas.append(f"❌ {len(self.fallidas)} cambios rechazados:")
+            lineas.extend(
+                f"   • {id_solicitud}: {motivo}"
+                for id_solicitud, motivo in self.fallidas[:limite]
+            )
+            if len(self.fallidas) > limite:
+                lineas.append(f"   … y {len(self.fallidas) - limite} más")
+        return "\n".join(lineas)
+
+
 class GestorSolicitudes:
     """Gestor para manejar todas las solicitudes de conformidad."""
 
-    def __init__(self):
-        """Inicializa el gestor de solicitudes con BD local robusta."""
+    def __init__(
+        self,
+        almacenamiento: Optional[AlmacenamientoSolicitudes] = None,
+        motor: Optional[str] = None,
+        ventana_escritura: Optional[float] = None,
+        carga_diferida: bool = False,
+        snapshot_binario: Optional[bool] = None,
+    ):
+        """
+        Inicializa el gestor de solicitudes con BD local robusta.
+
+        Args:
+            almacenamiento: Motor de persistencia ya construido (opcional)
+            motor: Nombre del motor a crear si no se pasa uno: "diario"
+                (por defecto), "json" o "sqlite"
+            ventana_escritura: Si se indica, los cambios se acumulan durante
+                esa cantidad de segundos y se escriben en segundo plano
+            carga_diferida: Si es True no se carga la BD al construir el
+                gestor; el llamador la carga después (ver CargaSolicitudes)
+            snapshot_binario: Si es True se mantiene un snapshot binario para
+                acelerar el arranque. Si no se indica se usa la variable de
+                entorno MATRIZ_ROL_SNAPSHOT_BINARIO ("0" lo desactiva).
+        """
         # Estrategia de ubicación múltiple para BD local
         self.directorio_bd = self._obtener_directorio_bd()
         self.directorio_bd.mkdir(parents=True, exist_ok=True)
@@ -123,27 +442,85 @@ class GestorSolicitudes:
             / f"backup_solicitudes_{datetime.now().strftime('%Y%m%d')}.json"
         )
 
+        if snapshot_binario is None:
+            snapshot_binario = os.environ.get("MATRIZ_ROL_SNAPSHOT_BINARIO", "1") != "0"
+        self.archivo_snapshot: Optional[Path] = (
+            ruta_snapshot(self.archivo_solicitudes) if snapshot_binario else None
+        )
+        # Firma de los datos que refleja el snapshot en disco (None = no se sabe)
+        self._firma_snapshot: Optional[tuple] = None
+        self._hilo_snapshot: Optional[threading.Thread] = None
+        self._lock_snapshot = threading.Lock()
+        # Se incrementa con cada cambio persistido (o aplazado)
+        self._cambios_registrados = 0
+
+        self.generador_ids = GeneradorIds(
+            self.archivo_solicitudes.with_suffix(".secuencia")
+        )
+
+        self.almacenamiento = almacenamiento or crear_almacenamiento(
+            self.archivo_solicitudes, motor
+        )
+        if ventana_escritura is not None:
+            self.almacenamiento = AlmacenamientoDiferido(
+                self.almacenamiento, ventana_escritura
+            )
+
         self.solicitudes: List[SolicitudConformidad] = []
 
+        # Índices en memoria, sincronizados con self.solicitudes
+        self._por_id: Dict[str, SolicitudConformidad] = {}
+        self._por_estado: Dict[EstadoSolicitud, Dict[str, SolicitudConformidad]] = {
+            estado: {} for estado in EstadoSolicitud
+        }
+        self._por_ticket: Dict[str, Dict[str, SolicitudConformidad]] = {}
+        self._por_codigo: Dict[str, Dict[str, SolicitudConformidad]] = {}
+        self._conteo_estados: Counter = Counter()
+        # Claves (fecha_creacion, id_solicitud) en orden ascendente, global y
+        # por estado, para paginar por fecha sin ordenar en cada consulta
+        self._orden_fecha: List[tuple] = []
+        self._orden_por_estado: Dict[EstadoSolicitud, List[tuple]] = {
+            estado: [] for estado in EstadoSolicitud
+        }
+
+        # Si es True, obtener_estadisticas() contrasta los contadores
+        self.verificar_estadisticas = False
+
+        # Notificación de cambios: se incrementa con cada cambio en memoria
+        self.version = 0
+        self._suscriptores: List[
+            Callable[[str, Optional[SolicitudConformidad]], None]
+        ] = []
+
+        # Carga en segundo plano: cambios cuya escritura espera al fin de la carga
+        self.cargando = False
+        self._cambios_durante_carga: Dict[str, SolicitudConformidad] = {}
+        self._cancelacion_carga = threading.Event()
+        self._lectura_terminada = threading.Event()
+        self._lectura_terminada.set()
+
+        # Transacción en curso: cambios y avisos que esperan al final
+        self._nivel_transaccion = 0
+        self._cambios_transaccion: Dict[str, SolicitudConformidad] = {}
+        self._aviso_transaccion_pendiente = False
+
         print(f"�️  BD LOCAL INICIALIZADA")
         print(f"📂 Ubicación: {self.archivo_solicitudes}")
         print(f"💾 Backup diario: {self.archivo_backup}")
 
-        self.cargar_solicitudes()
-        self._crear_backup_si_necesario()
+        if not carga_diferida:
+            self.cargar_solicitudes()
+            self._crear_backup_si_necesario()
 
     def _obtener_directorio_bd(self) -> Path:
         """Obtiene el directorio óptimo para la BD local."""
         # Opción 1: Raíz del proyecto (más accesible para desarrollo)
         try:
-            proyecto_root = Path(__file__).parent.parent.parent.parent
-            bd_proyecto = proyecto_root / "data"
-            bd_proyecto.mkdir(parents=True, exist_ok=True)
+            bd_proyecto = directorio_datos()
 
-            # Verificar que podemos escribir en el directorio
-            test_file = bd_proyecto / ".test_write"
-            test_file.write_text("test")
-            test_file.unlink()
+            # Verificar permisos de escritura sin crear archivos de prueba
+            if not os.access(bd_proyecto, os.W_OK | os.X_OK):
+                raise PermissionError(f"Sin permiso de escritura en {bd_proyecto}")
 
             return bd_proyecto
         except Exception as e:
@@ -165,11 +542,17 @@ class GestorSolicitudes:
         return bd_temp
 
     def generar_id_solicitud(self) -> str:
-        """Genera un ID único para una nueva solicitud."""
-        fecha_actual = datetime.now()
-        timestamp = fecha_actual.strftime("%Y%m%d_%H%M%S")
-        numero_solicitud = len(self.solicitudes) + 1
-        return f"SOL_{timestamp}_{numero_solicitud:03d}"
+        """
+        Genera un ID único para una nueva solicitud.
+
+        La secuencia persistida garantiza la unicidad entre procesos y
+        reinicios; la comprobación en el índice solo protege frente a IDs
+        importados de otra BD.
+        """
+        while True:
+            id_solicitud = self.generador_ids.siguiente()
+            if id_solicitud not in self._por_id:
+                return id_solicitud
 
     def crear_solicitud(
         self, grupos_red: List[str], autorizadores: List[Dict[str, str]]
@@ -202,40 +585,188 @@ class GestorSolicitudes:
         print(f"   Solicitudes antes de agregar: {len(self.solicitudes)}")
 
         self.solicitudes.append(solicitud)
+        self._indexar(solicitud)
 
         print(f"   Solicitudes después de agregar: {len(self.solicitudes)}")
 
-        self.guardar_solicitudes()
+        self._persistir_cambio(solicitud)
+        self._notificar(EVENTO_CREADA, solicitud)
 
         print(f"✅ Solicitud creada y guardada: {id_solicitud}")
 
         return solicitud
 
+    def crear_solicitudes_lote(
+        self, datos_solicitudes: Iterable[Dict]
+    ) -> List[SolicitudConformidad]:
+        """
+        Crea muchas solicitudes de una vez, persistiendo una sola vez.
+
+        El lote se valida completo antes de crear nada: si alguna solicitud es
+        inválida no se crea ninguna. Los IDs se reservan en bloque.
+
+        Args:
+            datos_solicitudes: Diccionarios con las claves "grupos_red" y
+                "autorizadores" (mismo formato que crear_solicitud)
+
+        Returns:
+            Las solicitudes creadas, en el orden recibido
+
+        Raises:
+            ValueError: Si alguna solicitud del lote es inválida
+        """
+        datos_solicitudes = list(datos_solicitudes)
+        errores = [
+            f"  #{numero}: {error}"
+            for numero, datos in enumerate(datos_solicitudes, 1)
+            if (error := self._validar_datos_solicitud(datos))
+        ]
+        if errores:
+            raise ValueError(
+                "Lote rechazado, no se creó ninguna solicitud:\n" + "\n".join(errores)
+            )
+
+        ids = self.generador_ids.reservar(len(datos_solicitudes))
+        # Fecha común del lote: clave_orden desempata por ID
+        fecha_creacion = datetime.now().isoformat()
+        creadas = []
+
+        with self.transaccion():
+            for id_solicitud, datos in zip(ids, datos_solicitudes):
+                if id_solicitud in self._por_id:
+                    id_solicitud = self.generar_id_solicitud()
+
+                solicitud = SolicitudConformidad(
+                    id_solicitud=id_solicitud,
+                    fecha_creacion=fecha_creacion,
+                    grupos_red=datos["grupos_red"],
+                    autorizadores=datos["autorizadores"],
+                )
+                self.solicitudes.append(solicitud)
+                self._indexar(solicitud)
+                self._persistir_cambio(solicitud)
+                self._notificar(EVENTO_CREADA, solicitud)
+                creadas.append(solicitud)
+
+        print(f"✅ {len(creadas)} solicitudes creadas en lote")
+        return creadas
+
+    @staticmethod
+    def _validar_datos_solicitud(datos: Any) -> Optional[str]:
+        """
+        Valida los datos de una solicitud a crear.
+
+        Returns:
+            Descripción del error, o None si los datos son válidos
+        """
+        if not isinstance(datos, Mapping):
+            return "se esperaba un diccionario"
+
+        grupos = datos.get("grupos_red")
+        if not isinstance(grupos, (list, tuple)) or not grupos:
+            return "debe indicar al menos un grupo de red"
+        if not all(isinstance(grupo, str) and grupo.strip() for grupo in grupos):
+            return "los grupos de red deben ser textos no vacíos"
+
+        autorizadores = datos.get("autorizadores")
+        if not isinstance(autorizadores, (list, tuple)):
+            return "los autorizadores deben ser una lista"
+        if not all(isinstance(autorizador, Mapping) for autorizador in autorizadores):
+            return "cada autorizador debe ser un diccionario"
+
+        return None
+
+    @contextmanager
+    def transaccion(self) -> Iterator["GestorSolicitudes"]:
+        """
+        Agrupa cambios para persistirlos con una sola escritura.
+
+        Dentro del bloque, crear_solicitud, actualizar_estado_solicitud y el
+        resto de operaciones modifican la memoria como siempre, pero la
+        escritura y los avisos a los suscriptores se aplazan hasta salir del
+        bloque más externo: se escribe una vez y se avisa con EVENTO_LOTE.
+
+        Si el bloque termina con una excepción, los cambios ya aplicados en
+        memoria se persisten igualmente para que memoria y disco coincidan.
+
+        Ejemplo::
+
+            with gestor.transaccion():
+                for grupos, autorizadores in filas:
+                    gestor.crear_solicitud(grupos, autorizadores)
+        """
+        self._nivel_transaccion += 1
+        try:
+            yield self
+        finally:
+            self._nivel_transaccion -= 1
+            if self._nivel_transaccion == 0:
+                self._confirmar_transaccion()
+
+    def _confirmar_transaccion(self):
+        """Persiste y notifica los cambios acumulados en la transacción."""
+        cambios = list(self._cambios_transaccion.values())
+        self._cambios_transaccion = {}
+        avisar = self._aviso_transaccion_pendiente
+        self._aviso_transaccion_pendiente = False
+
+        if cambios:
+            self._persistir_cambios(cambios)
+        if avisar:
+            self._notificar(EVENTO_LOTE)
+
+    def _ruta_backup(self, archivo: Path) -> Path:
+        """
+        Ruta del backup diario de un archivo de datos del motor.
+
+        El JSON principal conserva el nombre histórico
+        (``backup_solicitudes_AAAAMMDD.json``); el resto de archivos (diario,
+        BD SQLite) cambia el prefijo de su nombre por el del backup.
+        """
+        prefijo = self.archivo_solicitudes.stem
+        if archivo.name.startswith(prefijo):
+            sufijo = archivo.name[len(prefijo) :]
+        else:
+            sufijo = f"_{archivo.name}"
+        return self.archivo_backup.with_name(self.archivo_backup.stem + sufijo)
+
     def _crear_backup_si_necesario(self):
-        """Crea un backup diario si no existe."""
-        if self.archivo_solicitudes.exists() and not self.archivo_backup.exists():
-            try:
-                import shutil
+        """Crea un backup diario de los archivos de datos si no existe."""
+        archivos = [
+            archivo
+            for archivo in self.almacenamiento.archivos_datos()
+            if archivo.exists()
+        ]
+        if not archivos or any(
+            self._ruta_backup(archivo).exists() for archivo in archivos
+        ):
+            return
 
-                shutil.copy2(self.archivo_solicitudes, self.archivo_backup)
-                print(f"💾 Backup diario creado: {self.archivo_backup.name}")
-            except Exception as e:
-                print(f"⚠️ No se pudo crear backup: {e}")
+        try:
+            import shutil
+
+            for archivo in archivos:
+                destino = self._ruta_backup(archivo)
+                shutil.copy2(archivo, destino)
+                print(f"💾 Backup diario creado: {destino.name}")
+        except Exception as e:
+            print(f"⚠️ No se pudo crear backup: {e}")
 
     def obtener_info_bd(self) -> dict:
         """Obtiene información detallada de la BD local."""
+        ruta_datos = self.almacenamiento.ruta_datos
         info = {
-            "ubicacion": str(self.archivo_solicitudes),
-            "existe": self.archivo_solicitudes.exists(),
+            "ubicacion": str(ruta_datos),
+            "existe": ruta_datos.exists(),
             "tamaño_kb": 0,
             "total_solicitudes": len(self.solicitudes),
             "ultima_modificacion": None,
-            "backup_diario": self.archivo_backup.exists(),
+            "backup_diario": self._ruta_backup(ruta_datos).exists(),
         }
 
-        if self.archivo_solicitudes.exists():
+        if ruta_datos.exists():
             try:
-                stat = self.archivo_solicitudes.stat()
+                stat = ruta_datos.stat()
                 info["tamaño_kb"] = round(stat.st_size / 1024, 2)
                 info["ultima_modificacion"] = datetime.fromtimestamp(
                     stat.st_mtime
@@ -253,10 +784,19 @@ class GestorSolicitudes:
         self, id_solicitud: str
     ) -> Optional[SolicitudConformidad]:
         """Obtiene una solicitud específica por su ID."""
-        for solicitud in self.solicitudes:
-            if solicitud.id_solicitud == id_solicitud:
-                return solicitud
-        return None
+        return self._por_id.get(id_solicitud)
+
+    def obtener_solicitudes_por_ticket(
+        self, ticket_helpdesk: str
+    ) -> List[SolicitudConformidad]:
+        """Obtiene las solicitudes asociadas a un ticket del helpdesk."""
+        return list(self._por_ticket.get(ticket_helpdesk, {}).values())
+
+    def obtener_solicitudes_por_codigo(
+        self, codigo_aplicacion: str
+    ) -> List[SolicitudConformidad]:
+        """Obtiene las solicitudes que incluyen un código de aplicación."""
+        return list(self._por_codigo.get(codigo_aplicacion.upper(), {}).values())
 
     def actualizar_estado_solicitud(
         self,
@@ -281,50 +821,310 @@ class GestorSolicitudes:
         if not solicitud:
             return False
 
-        if nuevo_estado == EstadoSolicitud.CERRADO:
-            if ticket_helpdesk:
-                solicitud.cerrar_solicitud(ticket_helpdesk, observaciones)
-        else:
-            solicitud.estado = nuevo_estado
+        error = self._aplicar_cambio_estado(
+            solicitud, nuevo_estado, ticket_helpdesk, observaciones
+        )
+        if error:
+            print(f"❌ {id_solicitud}: {error}")
+            return False
+
+        self._persistir_cambio(solicitud)
+        self._notificar(EVENTO_MODIFICADA, solicitud)
+        return True
+
+    def aplicar_transiciones(
+        self,
+        cambios: Iterable[
+            Tuple[str, Union[EstadoSolicitud, str], Optional[str], Optional[str]]
+        ],
+    ) -> ResultadoTransiciones:
+        """
+        Cambia el estado de muchas solicitudes y guarda una sola vez.
+
+        Cada cambio se valida contra TRANSICIONES_ESTADO; los válidos se
+        aplican y los inválidos se informan sin detener el resto.
+
+        Args:
+            cambios: Tuplas (id_solicitud, estado_destino, ticket, observaciones).
+                El estado puede ser un EstadoSolicitud o su valor de texto; el
+                ticket y las observaciones pueden ser None para conservarlos.
+
+        Returns:
+            Resultado con los IDs aplicados y los fallos con su motivo
+        """
+        resultado = ResultadoTransiciones()
+
+        with self.transaccion():
+            for id_solicitud, estado, ticket_helpdesk, observaciones in cambios:
+                solicitud = self._por_id.get(id_solicitud)
+                if solicitud is None:
+                    resultado.fallidas.append((id_solicitud, "Solicitud no encontrada"))
+                    continue
+
+                try:
+                    nuevo_estado = EstadoSolicitud(estado)
+                except ValueError:
+                    resultado.fallidas.append(
+                        (id_solicitud, f"Estado no válido: {estado}")
+                    )
+                    continue
+
+                es_valida, error = validar_transicion_estado(
+                    solicitud.estado, nuevo_estado
+                )
+                if es_valida:
+                    error = self._aplicar_cambio_estado(
+                        solicitud, nuevo_estado, ticket_helpdesk, observaciones
+                    )
+                if error:
+                    resultado.fallidas.append((id_solicitud, error))
+                    continue
+
+                self._persistir_cambio(solicitud)
+                self._notificar(EVENTO_MODIFICADA, solicitud)
+                resultado.aplicadas.append(id_solicitud)
+
+        print(
+            f"🔁 Transiciones en lote: {len(resultado.aplicadas)} aplicadas, "
+            f"{len(resultado.fallidas)} rechazadas"
+        )
+        return resultado
+
+    @staticmethod
+    def _aplicar_cambio_estado(
+        solicitud: SolicitudConformidad,
+        nuevo_estado: EstadoSolicitud,
+        ticket_helpdesk: Optional[str],
+        observaciones: Optional[str],
+    ) -> Optional[str]:
+        """
+        Aplica un cambio de estado, ticket y observaciones en memoria.
+
+        Args:
+            solicitud: Solicitud a modificar
+            nuevo_estado: Estado destino
+            ticket_helpdesk: Nuevo ticket; None lo conserva y "" lo quita
+            observaciones: Nuevas observaciones; vacías las conservan (salvo
+                al cerrar una solicitud abierta, que siempre las reemplaza)
+
+        Returns:
+            Motivo por el que no se aplicó, o None si se aplicó
+        """
+        if ticket_helpdesk is not None:
+            ticket_helpdesk = ticket_helpdesk.strip()
+
+        if nuevo_estado is EstadoSolicitud.CERRADO:
+            ticket = ticket_helpdesk or solicitud.ticket_helpdesk
+            if not ticket:
+                return "Se requiere un ticket de helpdesk para cerrar"
+            if solicitud.estado is not EstadoSolicitud.CERRADO:
+                solicitud.cerrar_solicitud(ticket, observaciones or "")
+                return None
+            # Ya cerrada: se editan ticket u observaciones sin reabrirla
+            solicitud.ticket_helpdesk = ticket
             if observaciones:
                 solicitud.observaciones = observaciones
+            return None
+
+        if solicitud.estado is EstadoSolicitud.CERRADO:
+            # Reapertura
+            solicitud.fecha_cierre = None
+        solicitud.estado = nuevo_estado
+        if ticket_helpdesk is not None:
+            solicitud.ticket_helpdesk = ticket_helpdesk or None
+        if observaciones:
+            solicitud.observaciones = observaciones
+        return None
 
-        self.guardar_solicitudes()
+    def suscribir(
+        self, callback: Callable[[str, Optional[SolicitudConformidad]], None]
+    ) -> None:
+        """
+        Registra una función a la que se avisa de cada cambio.
+
+        El callback recibe el evento (EVENTO_CREADA, EVENTO_MODIFICADA o
+        EVENTO_RECARGADA) y la solicitud afectada (None al recargar).
+
+        Args:
+            callback: Función a llamar tras cada cambio
+        """
+        if callback not in self._suscriptores:
+            self._suscriptores.append(callback)
+
+    def desuscribir(
+        self, callback: Callable[[str, Optional[SolicitudConformidad]], None]
+    ) -> None:
+        """Deja de avisar de cambios a una función registrada."""
+        if callback in self._suscriptores:
+            self._suscriptores.remove(callback)
+
+    def _notificar(
+        self, evento: str, solicitud: Optional[SolicitudConformidad] = None
+    ) -> None:
+        """Incrementa la versión y avisa a los suscriptores."""
+        if self._nivel_transaccion:
+            # Se avisará una sola vez al confirmar la transacción
+            self._aviso_transaccion_pendiente = True
+            return
+
+        self.version += 1
+        for callback in list(self._suscriptores):
+            try:
+                callback(evento, solicitud)
+            except Exception as e:
+                print(f"⚠️ Error notificando cambio ({evento}): {e}")
+
+    def recargar_si_cambio_en_disco(self) -> bool:
+        """
+        Recarga las solicitudes solo si otro proceso modificó la BD.
+
+        La comprobación usa fecha de modificación y tamaño de los archivos,
+        por lo que no lee su contenido.
+
+        Returns:
+            True si se recargó
+        """
+        # Una carga en curso ya traerá el contenido actual; una transacción
+        # abierta se perdería al reemplazar las solicitudes
+        if (
+            self.cargando
+            or self._nivel_transaccion
+            or not self.almacenamiento.modificado_externamente()
+        ):
+            return False
+
+        print("🔄 La BD local cambió en disco, recargando...")
+        self.cargar_solicitudes()
         return True
 
     def filtrar_solicitudes_por_estado(
         self, estado: EstadoSolicitud
     ) -> List[SolicitudConformidad]:
         """Filtra solicitudes por estado."""
-        return [s for s in self.solicitudes if s.estado == estado]
-
-    def obtener_estadisticas(self) -> Dict[str, int]:
-        """Obtiene estadísticas de las solicitudes."""
-        total = len(self.solicitudes)
-        en_solicitud = len(
-            self.filtrar_solicitudes_por_estado(
-                EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES
+        return list(self._por_estado[estado].values())
+
+    def obtener_estadisticas(self, verificar: Optional[bool] = None) -> Dict[str, int]:
+        """
+        Obtiene estadísticas de las solicitudes.
+
+        Los conteos se mantienen en cada transición de estado, por lo que la
+        consulta es O(1).
+
+        Args:
+            verificar: Si es True, contrasta los contadores con un reconteo
+                completo. Por defecto usa el atributo verificar_estadisticas.
+
+        Returns:
+            Diccionario con el total y la cantidad por estado
+        """
+        if verificar is None:
+            verificar = self.verificar_estadisticas
+        if verificar:
+            self._verificar_contadores()
+
+        estadisticas = {"total": len(self.solicitudes)}
+        for estado, clave in CLAVES_ESTADISTICAS.items():
+            estadisticas[clave] = self._conteo_estados[estado]
+        return estadisticas
+
+    def _verificar_contadores(self) -> bool:
+        """
+        Contrasta los contadores por estado con un reconteo completo.
+
+        Si difieren, informa la diferencia y reconstruye índices y contadores.
+
+        Returns:
+            True si los contadores eran correctos
+        """
+        reconteo = Counter(solicitud.estado for solicitud in self.solicitudes)
+        fuentes = {"memoria": reconteo}
+        if self.almacenamiento.consultas_indexadas:
+            # Con BD indexada se contrasta también contra lo persistido
+            conteo_bd = self.almacenamiento.contar_por_estado()
+            fuentes["bd"] = Counter(
+                {
+                    EstadoSolicitud(valor): cantidad
+                    for valor, cantidad in conteo_bd.items()
+                }
             )
-        )
-        en_helpdesk = len(
-            self.filtrar_solicitudes_por_estado(EstadoSolicitud.EN_HELPDESK)
-        )
-        atendido = len(self.filtrar_solicitudes_por_estado(EstadoSolicitud.ATENDIDO))
-        cerrado = len(self.filtrar_solicitudes_por_estado(EstadoSolicitud.CERRADO))
 
-        return {
-            "total": total,
-            "en_solicitud": en_solicitud,
-            "en_helpdesk": en_helpdesk,
-            "atendido": atendido,
-            "cerrado": cerrado,
-        }
+        correctos = True
+        for fuente, conteo in fuentes.items():
+            for estado in EstadoSolicitud:
+                if conteo[estado] != self._conteo_estados[estado]:
+                    correctos = False
+                    print(
+                        f"⚠️ Contador '{estado.value}' = {self._conteo_estados[estado]}, "
+                        f"reconteo en {fuente} = {conteo[estado]}"
+                    )
+
+        if not correctos:
+            self._reemplazar_solicitudes(self.solicitudes)
+        return correctos
+
+    def contar_solicitudes(self, estado: Optional[EstadoSolicitud] = None) -> int:
+        """
+        Cuenta las solicitudes, opcionalmente filtradas por estado.
+
+        Args:
+            estado: Estado a filtrar, o None para todas
+
+        Returns:
+            Cantidad de solicitudes
+        """
+        if estado is None:
+            return len(self.solicitudes)
+        return self._conteo_estados[estado]
+
+    def obtener_pagina_solicitudes(
+        self,
+        desplazamiento: int,
+        limite: int,
+        estado: Optional[EstadoSolicitud] = None,
+    ) -> List[SolicitudConformidad]:
+        """
+        Obtiene una página de solicitudes, más recientes primero.
+
+        Se resuelve sobre el índice ordenado por (fecha, ID), por lo que solo
+        se recorren las solicitudes de la página y los límites de página son
+        estables aunque varias solicitudes compartan fecha.
+
+        Args:
+            desplazamiento: Cantidad de solicitudes a saltar
+            limite: Tamaño máximo de la página
+            estado: Estado a filtrar, o None para todas
+
+        Returns:
+            Solicitudes de la página
+        """
+        orden = self._orden_por_estado[estado] if estado else self._orden_fecha
+        fin = max(0, len(orden) - max(0, desplazamiento))
+        inicio = max(0, fin - max(0, limite))
+        return [
+            self._por_id[id_solicitud]
+            for _, id_solicitud in reversed(orden[inicio:fin])
+        ]
+
+    def obtener_cursor(
+        self, estado: Optional[EstadoSolicitud] = None
+    ) -> "CursorSolicitudes":
+        """
+        Obtiene un cursor sobre las solicitudes ordenadas por fecha descendente.
+
+        Args:
+            estado: Estado a filtrar, o None para todas
+
+        Returns:
+            Cursor que refleja los cambios posteriores del gestor
+        """
+        return CursorSolicitudes(self, estado)
 
     def verificar_bd_local(self) -> Dict[str, any]:
         """Verifica el estado de la BD local."""
+        ruta_datos = self.almacenamiento.ruta_datos
         info = {
-            "archivo_existe": self.archivo_solicitudes.exists(),
-            "ruta_archivo": str(self.archivo_solicitudes),
+            "archivo_existe": ruta_datos.exists(),
+            "ruta_archivo": str(ruta_datos),
             "total_solicitudes": len(self.solicitudes),
             "es_legible": False,
             "tamaño_archivo": 0,
@@ -332,64 +1132,496 @@ class GestorSolicitudes:
 
         if info["archivo_existe"]:
             try:
-                info["tamaño_archivo"] = self.archivo_solicitudes.stat().st_size
-                with open(self.archivo_solicitudes, "r", encoding="utf-8") as f:
-                    json.load(f)
-                info["es_legible"] = True
+                info["tamaño_archivo"] = ruta_datos.stat().st_size
+                info["es_legible"] = self.almacenamiento.es_legible()
             except:
                 info["es_legible"] = False
 
         return info
 
     def cargar_solicitudes(self):
-        """Carga las solicitudes desde el archivo JSON."""
+        """Carga las solicitudes desde el motor de almacenamiento."""
+        try:
+            solicitudes = self.leer_solicitudes_persistidas()
+        except Exception as e:
+            self.manejar_error_carga(e)
+            return
+        self.aplicar_solicitudes_cargadas(solicitudes)
+
+    def leer_solicitudes_persistidas(
+        self,
+        al_progresar: Optional[Callable[[int, int], None]] = None,
+        cancelacion: Optional[threading.Event] = None,
+    ) -> Optional[List[SolicitudConformidad]]:
+        """
+        Lee y construye las solicitudes persistidas sin modificar el gestor.
+
+        Se puede ejecutar en un hilo de trabajo; el resultado se aplica después
+        con aplicar_solicitudes_cargadas() desde el hilo principal.
+
+        Args:
+            al_progresar: Función opcional (construidas, total_estimado)
+                llamada por lotes
+            cancelacion: Evento opcional que interrumpe la lectura
+
+        Returns:
+            Solicitudes construidas, o None si la BD aún no existe
+
+        Raises:
+            CargaCancelada: Si se activó el evento de cancelación
+        """
         print(f"📂 Cargando solicitudes desde: {self.archivo_solicitudes}")
 
-        if self.archivo_solicitudes.exists():
+        if not self.almacenamiento.existe():
+            return None
+
+        solicitudes = self._leer_snapshot_binario()
+        if solicitudes is not None:
+            if al_progresar:
+                al_progresar(len(solicitudes), len(solicitudes))
+            return solicitudes
+
+        firma = self.almacenamiento.firma_disco()
+
+        # Los registros se convierten a medida que se decodifican, sin
+        # mantener a la vez el árbol completo de diccionarios
+        total = self.almacenamiento.total_estimado() if al_progresar else None
+        solicitudes = []
+
+        # closing() libera los locks del motor aunque la lectura se cancele
+        with closing(self.almacenamiento.iterar()) as registros:
+            for solicitud_data in registros:
+                solicitudes.append(SolicitudConformidad.from_dict(solicitud_data))
+                if len(solicitudes) % TAMANO_LOTE_CARGA:
+                    continue
+                if cancelacion is not None and cancelacion.is_set():
+                    raise CargaCancelada()
+                if al_progresar:
+                    al_progresar(len(solicitudes), max(total or 0, len(solicitudes)))
+
+        if al_progresar:
+            al_progresar(len(solicitudes), len(solicitudes))
+
+        # Solo si nadie modificó los datos mientras se leían
+        if self.almacenamiento.firma_disco() == firma:
+            self._programar_snapshot_binario(solicitudes, firma)
+        return solicitudes
+
+    def _leer_snapshot_binario(self) -> Optional[List[SolicitudConformidad]]:
+        """
+        Carga las solicitudes desde el snapshot binario si está al día.
+
+        Returns:
+            Solicitudes del snapshot, o None si hay que leer la BD
+        """
+        if self.archivo_snapshot is None:
+            return None
+
+        firma = self.almacenamiento.firma_disco()
+        try:
+            solicitudes = leer_snapshot(self.archivo_snapshot, firma)
+        except ErrorSnapshot as e:
+            # Sin eliminarlo, su firma haría creer que sigue al día
+            print(f"⚠️ Snapshot binario descartado: {e}")
+            self._descartar_snapshot_binario()
+            return None
+        except OSError as e:
+            print(f"⚠️ Snapshot binario descartado: {e}")
+            return None
+
+        if solicitudes is None:
+            return None
+        self._firma_snapshot = firma
+
+        self.almacenamiento.sincronizar_sin_leer(
+            lambda: [solicitud.to_dict() for solicitud in solicitudes]
+        )
+        print(f"⚡ {len(solicitudes)} solicitudes leídas del snapshot binario")
+        return solicitudes
+
+    def _escribir_snapshot_binario(
+        self, solicitudes: List[SolicitudConformidad], firma: tuple
+    ):
+        """
+        Escribe el snapshot binario de un estado que coincide con el disco.
+
+        Args:
+            solicitudes: Solicitudes en orden de creación
+            firma: Firma de los archivos de datos de ese estado
+        """
+        if self.archivo_snapshot is None:
+            return
+
+        with self._lock_snapshot:
+            if self._firma_snapshot is None:
+                self._firma_snapshot = leer_firma_snapshot(self.archivo_snapshot)
+            if self._firma_snapshot == firma:
+                # El snapshot en disco ya refleja estos datos
+                return
+
             try:
-                with open(self.archivo_solicitudes, "r", encoding="utf-8") as file:
-                    datos = json.load(file)
-                    self.solicitudes = [
-                        SolicitudConformidad.from_dict(solicitud_data)
-                        for solicitud_data in datos.get("solicitudes", [])
-                    ]
-                print(f"✅ {len(self.solicitudes)} solicitudes cargadas exitosamente")
+                escribir_snapshot(self.archivo_snapshot, solicitudes, firma)
+                self._firma_snapshot = firma
             except Exception as e:
-                print(f"❌ Error cargando solicitudes: {e}")
-                self.solicitudes = []
-        else:
+                # El snapshot es opcional: la BD sigue siendo la fuente de verdad
+                self._firma_snapshot = None
+                print(f"⚠️ No se pudo escribir el snapshot binario: {e}")
+
+    def _programar_snapshot_binario(
+        self, solicitudes: List[SolicitudConformidad], firma: tuple
+    ):
+        """
+        Escribe el snapshot binario en un hilo aparte, fuera de la carga.
+
+        Si mientras se escribe se registra algún cambio, el snapshot podría
+        contener una edición que aún no está en disco: se descarta y cerrar()
+        escribirá uno nuevo.
+
+        Args:
+            solicitudes: Solicitudes en orden de creación
+            firma: Firma de los archivos de datos de ese estado
+        """
+        if self.archivo_snapshot is None:
+            return
+
+        solicitudes = list(solicitudes)
+        cambios_iniciales = self._cambios_registrados
+
+        def escribir():
+            if self.almacenamiento.firma_disco() != firma:
+                return
+            self._escribir_snapshot_binario(solicitudes, firma)
+            if self._cambios_registrados != cambios_iniciales:
+                self._descartar_snapshot_binario()
+
+        self._hilo_snapshot = threading.Thread(
+            target=escribir, name="snapshot-binario", daemon=True
+        )
+        self._hilo_snapshot.start()
+
+    def _descartar_snapshot_binario(self):
+        """Elimina el snapshot binario en disco."""
+        with self._lock_snapshot:
+            self._firma_snapshot = None
+            try:
+                self.archivo_snapshot.unlink(missing_ok=True)
+            except OSError as e:
+                print(f"⚠️ No se pudo descartar el snapshot binario: {e}")
+
+    def aplicar_solicitudes_cargadas(
+        self, solicitudes: Optional[List[SolicitudConformidad]]
+    ):
+        """
+        Sustituye las solicitudes en memoria por las leídas de la BD.
+
+        Las solicitudes creadas o modificadas mientras se cargaba se conservan
+        y se persisten ahora.
+
+        Args:
+            solicitudes: Resultado de leer_solicitudes_persistidas()
+        """
+        if solicitudes is None:
             print(
                 f"📁 Archivo no existe, creando BD vacía en: {self.archivo_solicitudes}"
             )
-            self.solicitudes = []
-            # Crear archivo inicial vacío
+            solicitudes = []
+            crear_archivo = True
+        else:
+            print(f"✅ {len(solicitudes)} solicitudes cargadas exitosamente")
+            crear_archivo = False
+
+        cambios = self._finalizar_carga()
+        if cambios:
+            por_id = {
+                solicitud.id_solicitud: i for i, solicitud in enumerate(solicitudes)
+            }
+            for solicitud in cambios:
+                if solicitud.id_solicitud in por_id:
+                    solicitudes[por_id[solicitud.id_solicitud]] = solicitud
+                else:
+                    solicitudes.append(solicitud)
+
+        self._reemplazar_solicitudes(solicitudes)
+
+        if crear_archivo or (cambios and not self.almacenamiento.incremental):
+            # Archivo inicial, o una sola reescritura con todos los cambios
             self.guardar_solicitudes()
+        else:
+            for solicitud in cambios:
+                self._persistir_cambio(solicitud)
 
-    def guardar_solicitudes(self):
-        """Guarda las solicitudes en el archivo JSON."""
+        self._notificar(EVENTO_RECARGADA)
+
+    def manejar_error_carga(self, error: Exception):
+        """
+        Reacciona a un error al leer la BD.
+
+        Args:
+            error: Excepción producida por leer_solicitudes_persistidas()
+        """
+        if isinstance(error, ErrorIntegridadDatos):
+            print(f"❌ BD local dañada y sin generación recuperable: {error}")
+            apartado = apartar_generaciones_danadas(self.almacenamiento.archivo)
+            if apartado:
+                print(f"🗃️ Datos dañados conservados en: {apartado.name}")
+            self.aplicar_solicitudes_cargadas([])
+            return
+
+        # Se conservan los datos en memoria: vaciarlos haría que el
+        # siguiente guardado sobrescribiera la BD
+        print(f"❌ Error cargando solicitudes: {error}")
+        for solicitud in self._finalizar_carga():
+            self._persistir_cambio(solicitud)
+
+    def iniciar_carga(self):
+        """
+        Marca el inicio de una carga en segundo plano.
+
+        Hasta que termine, los cambios se aplican en memoria pero su escritura
+        se aplaza, para no mezclarse con un estado aún no cargado.
+        """
+        self.cargando = True
+        self._cancelacion_carga.clear()
+        self._lectura_terminada.clear()
+
+    def leer_carga(
+        self, al_progresar: Optional[Callable[[int, int], None]] = None
+    ) -> Optional[List[SolicitudConformidad]]:
+        """
+        Lee la BD para la carga iniciada con iniciar_carga() (hilo de trabajo).
+
+        Además crea el backup diario, que es una copia de archivos. cerrar()
+        espera a que esta lectura termine o se cancele.
+
+        Args:
+            al_progresar: Función opcional (construidas, total_estimado)
+
+        Returns:
+            Resultado para aplicar_solicitudes_cargadas()
+
+        Raises:
+            CargaCancelada: Si el gestor se cerró durante la lectura
+        """
         try:
-            print(f"💾 Guardando {len(self.solicitudes)} solicitudes en BD local...")
+            solicitudes = self.leer_solicitudes_persistidas(
+                al_progresar, self._cancelacion_carga
+            )
+            self._crear_backup_si_necesario()
+            return solicitudes
+        finally:
+            self._lectura_terminada.set()
+
+    def _finalizar_carga(self) -> List[SolicitudConformidad]:
+        """Termina la carga y devuelve los cambios hechos durante ella."""
+        self.cargando = False
+        cambios = list(self._cambios_durante_carga.values())
+        self._cambios_durante_carga = {}
+        return cambios
+
+    def _reemplazar_solicitudes(self, solicitudes: List[SolicitudConformidad]):
+        """
+        Sustituye todas las solicitudes en memoria y reconstruye los índices.
 
-            # Crear directorio si no existe
-            self.archivo_solicitudes.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            solicitudes: Nuevas solicitudes, en orden de creación
+        """
+        # Las instancias anteriores dejan de notificar cambios al gestor
+        for solicitud in self.solicitudes:
+            solicitud._observador = None
+        self._conteo_estados = Counter()
+
+        self.solicitudes = solicitudes
+        self._por_id = {}
+        self._por_estado = {estado: {} for estado in EstadoSolicitud}
+        self._por_ticket = {}
+        self._por_codigo = {}
+        self._orden_fecha = []
+        self._orden_por_estado = {estado: [] for estado in EstadoSolicitud}
+
+        for solicitud in solicitudes:
+            self._indexar(solicitud, ordenar=False)
+
+        # Una sola ordenación en lugar de una inserción ordenada por solicitud
+        self._orden_fecha.sort()
+        for orden in self._orden_por_estado.values():
+            orden.sort()
+
+    def _indexar(self, solicitud: SolicitudConformidad, ordenar: bool = True):
+        """
+        Agrega una solicitud a todos los índices y observa sus cambios.
 
-            datos = {
-                "metadata": {
-                    "version": "1.0",
-                    "ultima_actualizacion": datetime.now().isoformat(),
-                    "total_solicitudes": len(self.solicitudes),
-                },
-                "solicitudes": [solicitud.to_dict() for solicitud in self.solicitudes],
-            }
+        Args:
+            solicitud: Solicitud a indexar
+            ordenar: Si es False, la clave de fecha se agrega al final y el
+                llamador debe ordenar los índices por fecha después
+        """
+        id_solicitud = solicitud.id_solicitud
+        self._por_id[id_solicitud] = solicitud
 
-            with open(self.archivo_solicitudes, "w", encoding="utf-8") as file:
-                json.dump(datos, file, indent=2, ensure_ascii=False)
+        clave = clave_orden(solicitud)
+        if ordenar:
+            insort(self._orden_fecha, clave)
+            insort(self._orden_por_estado[solicitud.estado], clave)
+        else:
+            self._orden_fecha.append(clave)
+            self._orden_por_estado[solicitud.estado].append(clave)
+        self._por_estado[solicitud.estado][id_solicitud] = solicitud
+        self._conteo_estados[solicitud.estado] += 1
+        if solicitud.ticket_helpdesk:
+            self._por_ticket.setdefault(solicitud.ticket_helpdesk, {})[
+                id_solicitud
+            ] = solicitud
+        for autorizador in solicitud.autorizadores:
+            codigo = (autorizador.get("codigo") or "").upper()
+            if codigo:
+                self._por_codigo.setdefault(codigo, {})[id_solicitud] = solicitud
+
+        solicitud._observador = self._on_cambio_solicitud
+
+    def _on_cambio_solicitud(
+        self, solicitud: SolicitudConformidad, campo: str, anterior, nuevo
+    ):
+        """Mantiene índices y contadores al cambiar el estado o el ticket."""
+        id_solicitud = solicitud.id_solicitud
+
+        if campo == "estado":
+            clave = clave_orden(solicitud)
+            if anterior is not None:
+                self._por_estado[anterior].pop(id_solicitud, None)
+                self._conteo_estados[anterior] -= 1
+                orden = self._orden_por_estado[anterior]
+                posicion = bisect_left(orden, clave)
+                if posicion < len(orden) and orden[posicion] == clave:
+                    del orden[posicion]
+            self._por_estado[nuevo][id_solicitud] = solicitud
+            self._conteo_estados[nuevo] += 1
+            insort(self._orden_por_estado[nuevo], clave)
+
+        elif campo == "ticket_helpdesk":
+            if anterior:
+                solicitudes_ticket = self._por_ticket.get(anterior, {})
+                solicitudes_ticket.pop(id_solicitud, None)
+                if not solicitudes_ticket:
+                    self._por_ticket.pop(anterior, None)
+            if nuevo:
+                self._por_ticket.setdefault(nuevo, {})[id_solicitud] = solicitud
+
+    def guardar_solicitudes(self):
+        """Guarda el estado completo de las solicitudes."""
+        try:
+            print(f"💾 Guardando {len(self.solicitudes)} solicitudes en BD local...")
+
+            self.almacenamiento.guardar_todo(
+                [solicitud.to_dict() for solicitud in self.solicitudes]
+            )
 
             print(f"✅ BD local actualizada: {self.archivo_solicitudes}")
 
         except Exception as e:
             print(f"❌ Error guardando solicitudes: {e}")
 
+    def _persistir_cambio(self, solicitud: SolicitudConformidad):
+        """
+        Persiste una solicitud creada o modificada.
+
+        Args:
+            solicitud: Solicitud que cambió
+        """
+        self._persistir_cambios([solicitud])
+
+    def _persistir_cambios(self, solicitudes: List[SolicitudConformidad]):
+        """
+        Persiste un grupo de solicitudes creadas o modificadas.
+
+        Los motores incrementales escriben solo los registros afectados, en
+        una única escritura; el resto reescribe la BD completa una vez.
+
+        Args:
+            solicitudes: Solicitudes que cambiaron
+        """
+        self._cambios_registrados += 1
+        if self.cargando or self._nivel_transaccion:
+            pendientes = (
+                self._cambios_durante_carga
+                if self.cargando
+                else self._cambios_transaccion
+            )
+            for solicitud in solicitudes:
+                pendientes[solicitud.id_solicitud] = solicitud
+            return
+
+        if not self.almacenamiento.incremental:
+            self.guardar_solicitudes()
+            return
+
+        try:
+            self.almacenamiento.registrar_cambios(
+                [solicitud.to_dict() for solicitud in solicitudes]
+            )
+            if len(solicitudes) == 1:
+                print(f"✅ Cambio registrado: {solicitudes[0].id_solicitud}")
+            else:
+                print(f"✅ {len(solicitudes)} cambios registrados")
+        except Exception as e:
+            print(f"❌ Error registrando cambio: {e}")
+
+    def flush(self):
+        """Escribe de inmediato los cambios pendientes de la escritura diferida."""
+        self.almacenamiento.flush()
+
+    def cerrar(self):
+        """
+        Escribe lo pendiente y libera los recursos del motor de almacenamiento.
+
+        Si aún se está cargando la BD, la carga se cancela y se persisten los
+        cambios hechos mientras tanto. Al terminar se actualiza el snapshot
+        binario para el próximo arranque (solo si la carga se completó).
+        """
+        carga_interrumpida = self.cargando
+        if carga_interrumpida:
+            self._cancelacion_carga.set()
+            self._lectura_terminada.wait()
+            self._persistir_cambios_durante_carga()
+
+        self.almacenamiento.cerrar()
+        if self._hilo_snapshot is not None:
+            self._hilo_snapshot.join()
+        if not carga_interrumpida:
+            self._escribir_snapshot_binario(
+                self.solicitudes, self.almacenamiento.firma_disco()
+            )
+
+    def _persistir_cambios_durante_carga(self):
+        """
+        Persiste los cambios de una carga que no llegó a aplicarse.
+
+        Las solicitudes en memoria solo son las creadas o modificadas durante
+        la carga, así que los motores que reescriben todo el estado fusionan
+        esos cambios con lo persistido en lugar de guardar la memoria.
+        """
+        cambios = self._finalizar_carga()
+        if not cambios:
+            return
+
+        if self.almacenamiento.incremental:
+            self._persistir_cambios(cambios)
+            return
+
+        try:
+            registros: Dict[str, Dict] = {}
+            if self.almacenamiento.existe():
+                registros = {
+                    registro["id_solicitud"]: registro
+                    for registro in self.almacenamiento.iterar()
+                }
+            for solicitud in cambios:
+                registros[solicitud.id_solicitud] = solicitud.to_dict()
+            self.almacenamiento.guardar_todo(list(registros.values()))
+            print(f"✅ {len(cambios)} cambios hechos durante la carga guardados")
+        except Exception as e:
+            # Sin poder leer la BD, guardar solo la memoria la sobrescribiría
+            print(f"❌ Error guardando los cambios hechos durante la carga: {e}")
+
     def exportar_solicitudes_csv(self, archivo_destino: Path) -> bool:
         """Exporta las solicitudes a un archivo CSV."""
         try:
@@ -0,0 +1,112 @@
+"""
+Tablas compartidas para reducir la memoria de las solicitudes.
+
+Miles de solicitudes repiten los mismos grupos de red y los mismos
+autorizadores. En lugar de que cada solicitud guarde su propia copia, los
+textos se internan y cada autorizador se guarda una sola vez en una tabla
+indexada por código, de la que las solicitudes solo mantienen referencias.
+"""
+
+import sys
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+
+def internar_texto(valor: Any) -> Any:
+    """Interna un texto; cualquier otro valor se devuelve sin cambios."""
+    return sys.intern(valor) if type(valor) is str else valor
+
+
+def internar_grupos(grupos: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Convierte una lista de grupos de red en una tupla de textos internados.
+
+    Args:
+        grupos: Nombres de los grupos de red
+
+    Returns:
+        Tupla inmutable con los nombres internados
+    """
+    return tuple(internar_texto(grupo) for grupo in grupos)
+
+
+class TablaAutorizadores:
+    """
+    Registros de autorizador compartidos, indexados por código.
+
+    Un mismo código puede tener varias variantes (p. ej. solicitudes antiguas
+    con un autorizador anterior); cada contenido distinto se guarda una sola
+    vez. Los registros son de solo lectura porque los comparten muchas
+    solicitudes.
+    """
+
+    def __init__(self):
+        """Inicializa la tabla vacía."""
+        self._por_codigo: Dict[str, List[Mapping[str, Any]]] = {}
+        # La carga en segundo plano interna registros mientras la interfaz
+        # puede estar creando solicitudes
+        self._lock = threading.Lock()
+
+    def internar(self, datos: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        Obtiene el registro compartido con el mismo contenido que ``datos``.
+
+        Args:
+            datos: Datos del autorizador (codigo, autorizador, correo, ...)
+
+        Returns:
+            Registro de solo lectura compartido
+        """
+        codigo = internar_texto(datos.get("codigo", ""))
+
+        with self._lock:
+            variantes = self._por_codigo.setdefault(codigo, [])
+            for registro in variantes:
+                if registro == datos:
+                    return registro
+
+            registro = MappingProxyType(
+                {
+                    internar_texto(clave): internar_texto(valor)
+                    for clave, valor in datos.items()
+                }
+            )
+            variantes.append(registro)
+            return registro
+
+    def internar_lista(
+        self, autorizadores: Iterable[Mapping[str, Any]]
+    ) -> Tuple[Mapping[str, Any], ...]:
+        """
+        Interna una lista de autorizadores.
+
+        Args:
+            autorizadores: Datos de cada autorizador
+
+        Returns:
+            Tupla de registros compartidos, en el mismo orden
+        """
+        return tuple(self.internar(datos) for datos in autorizadores)
+
+    def variantes(self, codigo: str) -> List[Mapping[str, Any]]:
+        """
+        Obtiene los registros internados de un código.
+
+        Args:
+            codigo: Código de aplicación
+
+        Returns:
+            Registros con ese código (vacío si no hay ninguno)
+        """
+        with self._lock:
+            return list(self._por_codigo.get(codigo, ()))
+
+    def __len__(self) -> int:
+        """Cantidad de registros distintos internados."""
+        with self._lock:
+            return sum(len(variantes) for variantes in self._por_codigo.values())
+
+
+# Tabla compartida por todas las solicitudes del proceso
+TABLA_AUTORIZADORES = TablaAutorizadores()
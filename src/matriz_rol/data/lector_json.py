@@ -0,0 +1,158 @@
+"""
+Lectura incremental de documentos JSON de solicitudes.
+
+Recorre el arreglo ``solicitudes`` del documento de la BD local registro a
+registro, leyendo el archivo por bloques. Nunca se mantiene en memoria el
+texto completo ni el árbol completo de diccionarios: solo el bloque actual y
+el registro que se está decodificando.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+# Caracteres leídos del archivo en cada bloque
+TAMANO_BLOQUE = 64 * 1024
+
+_ESPACIOS = re.compile(r"[ \t\n\r]*")
+_DECODIFICADOR = json.JSONDecoder()
+
+
+class _LectorIncremental:
+    """Búfer deslizante sobre un archivo de texto con decodificación JSON."""
+
+    def __init__(self, file):
+        """
+        Inicializa el lector.
+
+        Args:
+            file: Archivo de texto abierto
+        """
+        self.file = file
+        self.buffer = ""
+        self.pos = 0
+        self.fin_archivo = False
+
+    def caracter(self) -> str:
+        """Devuelve el siguiente carácter significativo sin consumirlo."""
+        while True:
+            self.pos = _ESPACIOS.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self._leer_bloque():
+                break
+        return self.buffer[self.pos] if self.pos < len(self.buffer) else ""
+
+    def consumir(self, esperado: str) -> None:
+        """Consume un carácter estructural, fallando si no es el esperado."""
+        if self.caracter() != esperado:
+            raise json.JSONDecodeError(
+                f"Se esperaba '{esperado}'", self.buffer, self.pos
+            )
+        self.pos += 1
+
+    def valor(self) -> Any:
+        """Decodifica el siguiente valor JSON completo."""
+        self.caracter()
+        while True:
+            try:
+                valor, fin = _DECODIFICADOR.raw_decode(self.buffer, self.pos)
+                # Un número al final del búfer podría continuar en el bloque
+                # siguiente
+                if fin < len(self.buffer) or self.fin_archivo:
+                    self.pos = fin
+                    return valor
+            except json.JSONDecodeError:
+                if self.fin_archivo:
+                    raise
+            self._leer_bloque()
+
+    def _leer_bloque(self) -> bool:
+        """Agrega un bloque al búfer descartando lo ya consumido."""
+        bloque = self.file.read(TAMANO_BLOQUE)
+        if not bloque:
+            self.fin_archivo = True
+            return False
+
+        self.buffer = self.buffer[self.pos :] + bloque
+        self.pos = 0
+        return True
+
+
+def iterar_documento(archivo: Path) -> Iterator[Dict]:
+    """
+    Recorre las solicitudes de un documento JSON de la BD local.
+
+    Args:
+        archivo: Ruta del documento (formato con metadata y solicitudes)
+
+    Yields:
+        Cada solicitud serializada, en el orden del archivo
+
+    Raises:
+        json.JSONDecodeError: Si el documento no es JSON válido
+    """
+    with open(archivo, "r", encoding="utf-8") as file:
+        for clave, lector in _recorrer_claves(_LectorIncremental(file)):
+            if clave != "solicitudes":
+                lector.valor()
+                continue
+
+            lector.consumir("[")
+            if lector.caracter() == "]":
+                lector.pos += 1
+                continue
+
+            while True:
+                yield lector.valor()
+                if lector.caracter() == ",":
+                    lector.pos += 1
+                    continue
+                lector.consumir("]")
+                break
+
+
+def leer_metadata(archivo: Path) -> Optional[Dict]:
+    """
+    Lee la sección metadata sin recorrer las solicitudes.
+
+    Args:
+        archivo: Ruta del documento
+
+    Returns:
+        Diccionario de metadata, o None si no aparece antes de las solicitudes
+    """
+    with open(archivo, "r", encoding="utf-8") as file:
+        for clave, lector in _recorrer_claves(_LectorIncremental(file)):
+            if clave == "metadata":
+                return lector.valor()
+            if clave == "solicitudes":
+                return None
+            lector.valor()
+    return None
+
+
+def _recorrer_claves(lector: _LectorIncremental) -> Iterator[tuple]:
+    """
+    Recorre las claves del objeto raíz; el consumidor lee cada valor.
+
+    Yields:
+        Tuplas (clave, lector) posicionadas al inicio del valor
+    """
+    lector.consumir("{")
+    if lector.caracter() == "}":
+        return
+
+    while True:
+        clave = lector.valor()
+        if not isinstance(clave, str):
+            raise json.JSONDecodeError(
+                "Se esperaba una clave de texto", lector.buffer, lector.pos
+            )
+        lector.consumir(":")
+        yield clave, lector
+
+        if lector.caracter() == ",":
+            lector.pos += 1
+            continue
+        lector.consumir("}")
+        return
@@ -5,13 +5,28 @@ Este módulo proporciona funcionalidades para:
 - Guardar y cargar datos de autorizadores desde archivo JSON
 - Mantener configuraciones entre sesiones
 - Actualizar automáticamente los datos guardados
+
+Los datos se leen una vez y se conservan en memoria; se vuelven a leer solo
+si el archivo cambió (fecha de modificación o tamaño), por ejemplo porque lo
+guardó otra instancia.
 """
 
 import json
 import os
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
 from pathlib import Path
 
+from .escritura_segura import (
+    ErrorIntegridadDatos,
+    apartar_generaciones_danadas,
+    escribir_json_seguro,
+    existe_alguna_generacion,
+    leer_json_seguro,
+    ruta_anterior,
+    ruta_suma,
+)
+
 
 class GestorPersistencia:
     """Gestor para la persistencia de datos de autorizadores."""
@@ -27,23 +42,59 @@ class GestorPersistencia:
         self.archivo_datos = self.directorio_datos / archivo_datos
         self._asegurar_directorio()
 
+        # Copia en memoria del archivo y la firma con la que se leyó
+        self._cache: Optional[Dict[str, Dict[str, str]]] = None
+        self._firma: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
     def _asegurar_directorio(self) -> None:
         """Asegura que el directorio de datos exista."""
         self.directorio_datos.mkdir(parents=True, exist_ok=True)
 
+    def _firma_archivo(self) -> Optional[Tuple[int, int]]:
+        """Fecha de modificación y tamaño del archivo (None si no existe)."""
+        try:
+            estado = os.stat(self.archivo_datos)
+        except OSError:
+            return None
+        return (estado.st_mtime_ns, estado.st_size)
+
+    def _datos(self) -> Dict[str, Dict[str, str]]:
+        """Datos en memoria, releídos si el archivo cambió (llamar con el lock)."""
+        firma = self._firma_archivo()
+        if self._cache is None or firma != self._firma:
+            self._cache = self._leer_archivo()
+            self._firma = firma
+        return self._cache
+
+    def _escribir(self, datos: Dict[str, Dict[str, str]]) -> None:
+        """Escribe los datos y los deja en memoria (llamar con el lock)."""
+        escribir_json_seguro(self.archivo_datos, datos)
+        self._cache = datos
+        self._firma = self._firma_archivo()
+
     def cargar_autorizadores(self) -> Dict[str, Dict[str, str]]:
         """
-        Carga los datos de autorizadores desde el archivo.
+        Carga los datos de autorizadores.
 
         Returns:
             Diccionario con códigos de aplicación como claves y datos de autorizadores como valores
         """
+        with self._lock:
+            return {codigo: dict(info) for codigo, info in self._datos().items()}
+
+    def _leer_archivo(self) -> Dict[str, Dict[str, str]]:
+        """Lee los datos de autorizadores desde el archivo."""
         try:
-            if self.archivo_datos.exists():
-                with open(self.archivo_datos, "r", encoding="utf-8") as file:
-                    return json.load(file)
+            if existe_alguna_generacion(self.archivo_datos):
+                return leer_json_seguro(self.archivo_datos)
             else:
                 return {}
+        except ErrorIntegridadDatos as e:
+            print(f"Error al cargar autorizadores, archivo dañado: {e}")
+            # Evita que el próximo guardado sobrescriba los datos dañados
+            apartar_generaciones_danadas(self.archivo_datos)
+            return {}
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error al cargar autorizadores: {e}")
             return {}
@@ -69,8 +120,8 @@ class GestorPersistencia:
                         "correo": dato.get("correo", ""),
                     }
 
-            with open(self.archivo_datos, "w", encoding="utf-8") as file:
-                json.dump(datos_dict, file, indent=2, ensure_ascii=False)
+            with self._lock:
+                self._escribir(datos_dict)
 
             print(f"Datos guardados en: {self.archivo_datos}")
             return True
@@ -89,8 +140,9 @@ class GestorPersistencia:
         Returns:
             Datos del autorizador o None si no existe
         """
-        datos = self.cargar_autorizadores()
-        return datos.get(codigo)
+        with self._lock:
+            info = self._datos().get(codigo)
+            return dict(info) if info is not None else None
 
     def actualizar_autorizador(
         self, codigo: str, autorizador: str, correo: str
@@ -106,21 +158,38 @@ class GestorPersistencia:
         Returns:
             True si se actualizó correctamente
         """
-        datos = self.cargar_autorizadores()
-        datos[codigo] = {"autorizador": autorizador, "correo": correo}
-
-        # Convertir de vuelta a lista para guardar
-        datos_lista = []
-        for cod, info in datos.items():
-            datos_lista.append(
-                {
-                    "codigo": cod,
-                    "autorizador": info["autorizador"],
-                    "correo": info["correo"],
-                }
-            )
-
-        return self.guardar_autorizadores(datos_lista)
+        return self.actualizar_autorizadores([(codigo, autorizador, correo)])
+
+    def actualizar_autorizadores(
+        self, autorizadores: Iterable[Tuple[str, str, str]]
+    ) -> bool:
+        """
+        Actualiza varios autorizadores con una sola escritura.
+
+        Los códigos que no se indican conservan sus datos.
+
+        Args:
+            autorizadores: Tuplas (código, autorizador, correo)
+
+        Returns:
+            True si se guardó correctamente (o no había cambios)
+        """
+        with self._lock:
+            datos = self._datos()
+            nuevos = dict(datos)
+            for codigo, autorizador, correo in autorizadores:
+                if codigo:
+                    nuevos[codigo] = {"autorizador": autorizador, "correo": correo}
+
+            if nuevos == datos:
+                return True
+
+            try:
+                self._escribir(nuevos)
+                return True
+            except IOError as e:
+                print(f"Error al guardar autorizadores: {e}")
+                return False
 
     def limpiar_datos(self) -> bool:
         """
@@ -130,8 +199,13 @@ class GestorPersistencia:
             True si se limpió correctamente
         """
         try:
-            if self.archivo_datos.exists():
-                self.archivo_datos.unlink()
+            with self._lock:
+                self._cache = None
+                self._firma = None
+            for generacion in (self.archivo_datos, ruta_anterior(self.archivo_datos)):
+                for archivo in (generacion, ruta_suma(generacion)):
+                    if archivo.exists():
+                        archivo.unlink()
             return True
         except IOError as e:
             print(f"Error al limpiar datos: {e}")
@@ -0,0 +1,404 @@
+"""
+Snapshot binario columnar de las solicitudes para un arranque rápido.
+
+Se escribe junto a la BD local (``solicitudes_conformidad.bin``) y permite
+cargar las solicitudes sin decodificar el JSON ni construir cada registro
+campo a campo. El JSON sigue siendo la fuente de verdad y la exportación
+legible: el snapshot solo se usa si se escribió a partir de los archivos de
+datos que hay ahora en disco.
+
+Formato (little-endian, versión FORMATO_VERSION):
+- Cabecera: magia, versión, huella del esquema y cantidad de filas
+- Firma (mtime y tamaño) de los archivos de datos al escribir el snapshot
+- Tabla de textos: longitudes y contenido UTF-8 de cada texto distinto
+- Columnas por fila: id, fecha de creación, estado (un byte), ticket,
+  fecha de cierre, observaciones, conjunto de grupos y conjunto de
+  autorizadores
+- Conjuntos de grupos y de autorizadores distintos, y registros de
+  autorizador distintos (JSON en la tabla de textos)
+
+No se usa pickle: el archivo solo contiene números y textos.
+"""
+
+import hashlib
+import json
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .escritura_segura import calcular_suma, escribir_bytes_seguro, ruta_suma
+from .internado import TABLA_AUTORIZADORES, internar_grupos
+
+MAGIA = b"MRSB"
+FORMATO_VERSION = 1
+
+# Columnas en orden de escritura; cualquier cambio altera la huella
+COLUMNAS = (
+    "id_solicitud:texto",
+    "fecha_creacion:texto",
+    "estado:u8",
+    "ticket_helpdesk:texto?",
+    "fecha_cierre:texto?",
+    "observaciones:texto?",
+    "grupos_red:conjunto_grupos",
+    "autorizadores:conjunto_autorizadores",
+)
+
+# Referencia a texto ausente (None)
+NULO = 0xFFFFFFFF
+
+_CABECERA = struct.Struct("<4sH32sI")
+_CUENTA = struct.Struct("<I")
+_ENTRADA_FIRMA = struct.Struct("<Bqq")
+_TIPO_U32 = "I" if array("I").itemsize == 4 else "L"
+
+
+class ErrorSnapshot(ValueError):
+    """El snapshot binario está dañado o no corresponde al esquema actual."""
+
+
+def ruta_snapshot(archivo_json: Path) -> Path:
+    """Ruta del snapshot binario asociado a la BD JSON."""
+    return Path(archivo_json).with_suffix(".bin")
+
+
+def huella_esquema() -> bytes:
+    """
+    Calcula la huella del esquema: columnas y valores de los estados.
+
+    Un snapshot escrito con otras columnas o con otro conjunto de estados
+    se descarta al leerlo.
+    """
+    from .gestor_solicitudes import EstadoSolicitud
+
+    descripcion = "|".join(COLUMNAS) + "#" + "|".join(e.value for e in EstadoSolicitud)
+    return hashlib.sha256(descripcion.encode("utf-8")).digest()
+
+
+def escribir_snapshot(archivo: Path, solicitudes: Sequence, firma: tuple) -> None:
+    """
+    Escribe el snapshot de forma atómica y con suma de verificación.
+
+    Args:
+        archivo: Ruta del snapshot
+        solicitudes: Objetos SolicitudConformidad en orden de creación
+        firma: Firma de los archivos de datos que reflejan estas solicitudes
+    """
+    from .gestor_solicitudes import EstadoSolicitud
+
+    codigos_estado = {estado: i for i, estado in enumerate(EstadoSolicitud)}
+    textos: Dict[str, int] = {}
+
+    def referencia(texto: Optional[str]) -> int:
+        if texto is None:
+            return NULO
+        indice = textos.get(texto)
+        if indice is None:
+            indice = textos[texto] = len(textos)
+        return indice
+
+    # Conjuntos distintos: límites en la lista plana de miembros
+    conjuntos_grupos: Dict[tuple, int] = {}
+    limites_grupos, miembros_grupos = [0], array(_TIPO_U32)
+    # Los registros de autorizador internados son objetos compartidos
+    registros: Dict[int, int] = {}
+    textos_registros = array(_TIPO_U32)
+    conjuntos_autorizadores: Dict[tuple, int] = {}
+    limites_autorizadores, miembros_autorizadores = [0], array(_TIPO_U32)
+
+    ids, fechas, tickets, cierres, observaciones = (array(_TIPO_U32) for _ in range(5))
+    filas_grupos, filas_autorizadores = array(_TIPO_U32), array(_TIPO_U32)
+    estados = bytearray()
+
+    for solicitud in solicitudes:
+        grupos = solicitud.grupos_red
+        conjunto = conjuntos_grupos.get(grupos)
+        if conjunto is None:
+            conjunto = conjuntos_grupos[grupos] = len(conjuntos_grupos)
+            miembros_grupos.extend(referencia(grupo) for grupo in grupos)
+            limites_grupos.append(len(miembros_grupos))
+        filas_grupos.append(conjunto)
+
+        indices = []
+        for registro in solicitud.autorizadores:
+            indice = registros.get(id(registro))
+            if indice is None:
+                indice = registros[id(registro)] = len(textos_registros)
+                textos_registros.append(
+                    referencia(json.dumps(dict(registro), ensure_ascii=False))
+                )
+            indices.append(indice)
+        indices = tuple(indices)
+        conjunto = conjuntos_autorizadores.get(indices)
+        if conjunto is None:
+            conjunto = conjuntos_autorizadores[indices] = len(conjuntos_autorizadores)
+            miembros_autorizadores.extend(indices)
+            limites_autorizadores.append(len(miembros_autorizadores))
+        filas_autorizadores.append(conjunto)
+
+        ids.append(referencia(solicitud.id_solicitud))
+        fechas.append(referencia(solicitud.fecha_creacion))
+        estados.append(codigos_estado[solicitud.estado])
+        tickets.append(referencia(solicitud.ticket_helpdesk))
+        cierres.append(referencia(solicitud.fecha_cierre))
+        observaciones.append(referencia(solicitud.observaciones))
+
+    # Las longitudes se guardan en caracteres para cortar el texto decodificado
+    contenido = "".join(textos).encode("utf-8")
+    partes = [
+        _CABECERA.pack(MAGIA, FORMATO_VERSION, huella_esquema(), len(estados)),
+        _codificar_firma(firma),
+        _codificar_u32(len(texto) for texto in textos),
+        _CUENTA.pack(len(contenido)),
+        contenido,
+        _codificar_u32(ids),
+        _codificar_u32(fechas),
+        _CUENTA.pack(len(estados)),
+        bytes(estados),
+    ]
+    partes.extend(
+        _codificar_u32(columna)
+        for columna in (
+            tickets,
+            cierres,
+            observaciones,
+            filas_grupos,
+            filas_autorizadores,
+            limites_grupos,
+            miembros_grupos,
+            textos_registros,
+            limites_autorizadores,
+            miembros_autorizadores,
+        )
+    )
+
+    escribir_bytes_seguro(archivo, b"".join(partes))
+
+
+def leer_firma_snapshot(archivo: Path) -> Optional[tuple]:
+    """
+    Lee solo la firma guardada en el snapshot, sin leer sus datos.
+
+    Args:
+        archivo: Ruta del snapshot
+
+    Returns:
+        Firma de los archivos de datos con la que se escribió, o None si no
+        hay snapshot o es de otro formato o esquema
+    """
+    try:
+        with open(archivo, "rb") as file:
+            cabecera = file.read(_CABECERA.size + _CUENTA.size)
+            if len(cabecera) < _CABECERA.size + _CUENTA.size:
+                return None
+            magia, version, huella, _ = _CABECERA.unpack_from(cabecera, 0)
+            if (magia, version, huella) != (MAGIA, FORMATO_VERSION, huella_esquema()):
+                return None
+            (cantidad,) = _CUENTA.unpack_from(cabecera, _CABECERA.size)
+            datos = cabecera + file.read(cantidad * _ENTRADA_FIRMA.size)
+    except FileNotFoundError:
+        return None
+
+    try:
+        firma, _ = _decodificar_firma(datos, _CABECERA.size)
+    except ErrorSnapshot:
+        return None
+    return firma
+
+
+def leer_snapshot(archivo: Path, firma: tuple) -> Optional[List]:
+    """
+    Lee el snapshot si corresponde a los archivos de datos actuales.
+
+    Args:
+        archivo: Ruta del snapshot
+        firma: Firma actual de los archivos de datos
+
+    Returns:
+        Lista de SolicitudConformidad, o None si no hay snapshot o si se
+        escribió a partir de otros datos (hay que leer el JSON)
+
+    Raises:
+        ErrorSnapshot: Si el snapshot está dañado o usa otro esquema
+    """
+    from .gestor_solicitudes import EstadoSolicitud, SolicitudConformidad
+
+    try:
+        datos = Path(archivo).read_bytes()
+        suma = ruta_suma(Path(archivo)).read_text(encoding="ascii").strip()
+    except FileNotFoundError:
+        return None
+
+    if len(datos) < _CABECERA.size:
+        raise ErrorSnapshot("Snapshot truncado")
+    magia, version, huella, filas = _CABECERA.unpack_from(datos, 0)
+    if magia != MAGIA or version != FORMATO_VERSION:
+        raise ErrorSnapshot(f"Formato de snapshot no soportado (versión {version})")
+    if huella != huella_esquema():
+        raise ErrorSnapshot("El snapshot usa otro esquema")
+
+    firma_snapshot, posicion = _decodificar_firma(datos, _CABECERA.size)
+    if firma_snapshot != tuple(firma):
+        return None
+    if suma != calcular_suma(datos):
+        raise ErrorSnapshot("Suma de verificación incorrecta")
+
+    try:
+        longitudes, posicion = _decodificar_u32(datos, posicion)
+        (tamano,) = _CUENTA.unpack_from(datos, posicion)
+        posicion += _CUENTA.size
+        contenido = datos[posicion : posicion + tamano].decode("utf-8")
+        posicion += tamano
+        limites = list(accumulate(longitudes, initial=0))
+        textos = [contenido[inicio:fin] for inicio, fin in zip(limites, limites[1:])]
+
+        ids, posicion = _decodificar_u32(datos, posicion)
+        fechas, posicion = _decodificar_u32(datos, posicion)
+        (cantidad,) = _CUENTA.unpack_from(datos, posicion)
+        posicion += _CUENTA.size
+        estados = datos[posicion : posicion + cantidad]
+        posicion += cantidad
+        tickets, posicion = _decodificar_u32(datos, posicion)
+        cierres, posicion = _decodificar_u32(datos, posicion)
+        observaciones, posicion = _decodificar_u32(datos, posicion)
+        filas_grupos, posicion = _decodificar_u32(datos, posicion)
+        filas_autorizadores, posicion = _decodificar_u32(datos, posicion)
+
+        limites_grupos, posicion = _decodificar_u32(datos, posicion)
+        miembros_grupos, posicion = _decodificar_u32(datos, posicion)
+        textos_registros, posicion = _decodificar_u32(datos, posicion)
+        limites_autorizadores, posicion = _decodificar_u32(datos, posicion)
+        miembros_autorizadores, posicion = _decodificar_u32(datos, posicion)
+
+        if posicion != len(datos):
+            raise ErrorSnapshot("Datos sobrantes al final del snapshot")
+        columnas = (
+            ids,
+            fechas,
+            estados,
+            tickets,
+            cierres,
+            observaciones,
+            filas_grupos,
+            filas_autorizadores,
+        )
+        if any(len(columna) != filas for columna in columnas):
+            raise ErrorSnapshot("Columnas de distinto largo")
+
+        # Los conjuntos distintos se construyen una sola vez y se comparten
+        grupos = _construir_conjuntos(
+            limites_grupos,
+            miembros_grupos,
+            lambda miembros: internar_grupos(textos[i] for i in miembros),
+        )
+        registros = [
+            TABLA_AUTORIZADORES.internar(json.loads(textos[i]))
+            for i in textos_registros
+        ]
+        autorizadores = _construir_conjuntos(
+            limites_autorizadores,
+            miembros_autorizadores,
+            lambda miembros: tuple(registros[i] for i in miembros),
+        )
+        valores_estado = tuple(EstadoSolicitud)
+
+        def opcionales(referencias: List[int]) -> List[Optional[str]]:
+            return [None if i == NULO else textos[i] for i in referencias]
+
+        crear = SolicitudConformidad.desde_campos_compartidos
+        return [
+            crear(
+                textos[id_solicitud],
+                textos[fecha],
+                grupos[grupo],
+                autorizadores[autorizador],
+                valores_estado[estado],
+                ticket,
+                cierre,
+                observacion,
+            )
+            for (
+                id_solicitud,
+                fecha,
+                estado,
+                ticket,
+                cierre,
+                observacion,
+                grupo,
+                autorizador,
+            ) in zip(
+                ids,
+                fechas,
+                estados,
+                opcionales(tickets),
+                opcionales(cierres),
+                opcionales(observaciones),
+                filas_grupos,
+                filas_autorizadores,
+            )
+        ]
+    except ErrorSnapshot:
+        raise
+    except (struct.error, IndexError, UnicodeDecodeError, ValueError) as e:
+        raise ErrorSnapshot(f"Snapshot ilegible: {e}") from e
+
+
+def _construir_conjuntos(
+    limites: List[int], miembros: List[int], construir: Callable[[List[int]], Tuple]
+) -> List[Tuple]:
+    """Construye cada conjunto a partir de sus límites en la lista plana."""
+    return [
+        construir(miembros[inicio:fin]) for inicio, fin in zip(limites, limites[1:])
+    ]
+
+
+def _codificar_firma(firma: tuple) -> bytes:
+    """Codifica la firma de los archivos de datos (None = archivo ausente)."""
+    partes = [_CUENTA.pack(len(firma))]
+    for entrada in firma:
+        if entrada is None:
+            partes.append(_ENTRADA_FIRMA.pack(0, 0, 0))
+        else:
+            partes.append(_ENTRADA_FIRMA.pack(1, *entrada))
+    return b"".join(partes)
+
+
+def _decodificar_firma(datos: bytes, posicion: int) -> Tuple[tuple, int]:
+    """Decodifica la firma; devuelve (firma, posición siguiente)."""
+    try:
+        (cantidad,) = _CUENTA.unpack_from(datos, posicion)
+        posicion += _CUENTA.size
+        firma = []
+        for _ in range(cantidad):
+            presente, mtime, tamano = _ENTRADA_FIRMA.unpack_from(datos, posicion)
+            posicion += _ENTRADA_FIRMA.size
+            firma.append((mtime, tamano) if presente else None)
+    except struct.error as e:
+        raise ErrorSnapshot(f"Firma ilegible: {e}") from e
+    return tuple(firma), posicion
+
+
+def _codificar_u32(valores) -> bytes:
+    """Codifica una secuencia de enteros sin signo: cantidad y valores."""
+    columna = array(_TIPO_U32, valores)
+    if sys.byteorder == "big":
+        columna.byteswap()
+    return _CUENTA.pack(len(columna)) + columna.tobytes()
+
+
+def _decodificar_u32(datos: bytes, posicion: int) -> Tuple[List[int], int]:
+    """Decodifica una secuencia escrita con _codificar_u32."""
+    (cantidad,) = _CUENTA.unpack_from(datos, posicion)
+    posicion += _CUENTA.size
+    fin = posicion + 4 * cantidad
+    if fin > len(datos):
+        raise ErrorSnapshot("Columna truncada")
+
+    columna = array(_TIPO_U32)
+    columna.frombytes(datos[posicion:fin])
+    if sys.byteorder == "big":
+        columna.byteswap()
+    return columna.tolist(), fin
@@ -0,0 +1,143 @@
+"""
+Escritura de correos en formato EML (MIME estándar).
+
+Los mensajes se construyen con el paquete ``email`` de la biblioteca
+estándar: cada mensaje recibe un separador MIME propio, los encabezados con
+acentos o emojis se codifican según RFC 2047 y los cuerpos se transfieren en
+quoted-printable o base64 (el que resulte más corto). El mensaje se vuelca
+al archivo parte por parte, sin armar antes el texto completo en memoria.
+"""
+
+from email.generator import BytesGenerator
+from email.headerregistry import Address
+from email.message import EmailMessage
+from email.policy import SMTP
+from email.utils import format_datetime, localtime, make_msgid
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+# Destinatario o remitente: (nombre, correo)
+Contacto = Tuple[str, str]
+
+# Remitente de los correos generados
+REMITENTE: Contacto = ("Gestión de Accesos", "gestion.accesos@empresa.com")
+
+# Dominio de los Message-ID generados
+DOMINIO_MENSAJES = "empresa.com"
+
+# Política MIME: líneas CRLF y solo 7 bits en el archivo final
+POLITICA_EML = SMTP
+
+
+def direcciones(contactos: Iterable[Contacto]) -> List[Address]:
+    """
+    Convierte contactos en direcciones de encabezado.
+
+    El nombre se entrecomilla al escribir el encabezado si hace falta, así que
+    un nombre como "Pérez, Ana" sigue siendo un único destinatario.
+
+    Args:
+        contactos: Pares (nombre, correo)
+
+    Returns:
+        Direcciones en el mismo orden
+    """
+    return [
+        Address(display_name=nombre, addr_spec=correo) for nombre, correo in contactos
+    ]
+
+
+def construir_mensaje(
+    destinatarios: Iterable[Contacto],
+    asunto: str,
+    contenido_texto: str,
+    contenido_html: str,
+    remitente: Contacto = REMITENTE,
+    borrador: bool = True,
+) -> EmailMessage:
+    """
+    Construye un correo multipart/alternative con cuerpo de texto y HTML.
+
+    Args:
+        destinatarios: Pares (nombre, correo) de los destinatarios
+        asunto: Asunto (puede contener acentos y emojis)
+        contenido_texto: Cuerpo en texto plano
+        contenido_html: Cuerpo HTML
+        remitente: Par (nombre, correo) del remitente
+        borrador: Marcar el correo como no enviado, para que Outlook lo
+            abra listo para enviar
+
+    Returns:
+        Mensaje listo para escribir
+    """
+    mensaje = EmailMessage(policy=POLITICA_EML)
+    mensaje["From"] = direcciones([remitente])
+    mensaje["To"] = direcciones(destinatarios)
+    mensaje["Subject"] = asunto
+    mensaje["Date"] = format_datetime(localtime())
+    mensaje["Message-ID"] = make_msgid(domain=DOMINIO_MENSAJES)
+    if borrador:
+        mensaje["X-Unsent"] = "1"
+
+    # Sin cte explícito, la biblioteca elige quoted-printable o base64
+    mensaje.set_content(contenido_texto, subtype="plain", charset="utf-8")
+    mensaje.add_alternative(contenido_html, subtype="html", charset="utf-8")
+    return mensaje
+
+
+def escribir_mensaje(mensaje: EmailMessage, archivo: Path) -> Path:
+    """
+    Escribe un mensaje en un archivo EML.
+
+    Si la escritura falla no queda un archivo a medias.
+
+    Args:
+        mensaje: Mensaje a escribir
+        archivo: Ruta destino
+
+    Returns:
+        Ruta escrita
+    """
+    archivo = Path(archivo)
+    try:
+        with open(archivo, "wb") as file:
+            BytesGenerator(file, policy=POLITICA_EML).flatten(mensaje)
+    except BaseException:
+        try:
+            archivo.unlink()
+        except OSError:
+            pass
+        raise
+    return archivo
+
+
+def escribir_eml(
+    archivo: Path,
+    destinatarios: Iterable[Contacto],
+    asunto: str,
+    contenido_texto: str,
+    contenido_html: str,
+    remitente: Optional[Contacto] = None,
+) -> Path:
+    """
+    Construye un correo y lo escribe en un archivo EML.
+
+    Args:
+        archivo: Ruta destino
+        destinatarios: Pares (nombre, correo) de los destinatarios
+        asunto: Asunto del correo
+        contenido_texto: Cuerpo en texto plano
+        contenido_html: Cuerpo HTML
+        remitente: Remitente (por defecto, REMITENTE)
+
+    Returns:
+        Ruta escrita
+    """
+    mensaje = construir_mensaje(
+        destinatarios,
+        asunto,
+        contenido_texto,
+        contenido_html,
+        remitente=remitente or REMITENTE,
+    )
+    return escribir_mensaje(mensaje, archivo)
@@ -7,111 +7,35 @@ con la solicitud de conformidad para los autorizadores de roles.
 
 import os
 import json
-from pathlib import Path
 from datetime import datetime
+from email.message import EmailMessage
 from typing import List, Dict, Optional
 
-try:
-    import win32com.client
-    import pythoncom
+from ..rutas import directorio_correos
+from .escritor_eml import construir_mensaje, escribir_mensaje
+from .plantillas import Plantilla, clave_autorizadores, compilar_filas, compilar_lista
 
-    OUTLOOK_AVAILABLE = True
-except ImportError:
-    OUTLOOK_AVAILABLE = False
-    print(
-        "Advertencia: pywin32 no está disponible. Se crearán archivos EML en lugar de MSG."
-    )
-
-
-class GeneradorCorreos:
-    """Generador de correos de solicitud de conformidad."""
-
-    def __init__(self):
-        """Inicializa el generador de correos."""
-        self.directorio_salida = Path(__file__).parent.parent / "output" / "correos"
-        self.directorio_salida.mkdir(parents=True, exist_ok=True)
-
-    def generar_correo_conformidad(
-        self, datos_autorizadores: List[Dict[str, str]], grupos_red: List[str]
-    ) -> str:
-        """
-        Genera un archivo de correo para solicitar conformidad.
-
-        Args:
-            datos_autorizadores: Lista con datos de autorizadores
-            grupos_red: Lista de grupos de red seleccionados
-
-        Returns:
-            Ruta del archivo de correo generado
-        """
-        fecha_actual = datetime.now().strftime("%Y-%m-%d %H:%M")
-        fecha_archivo = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        # Generar contenido del correo
-        contenido_html = self._generar_contenido_html(
-            datos_autorizadores, grupos_red, fecha_actual
-        )
-        contenido_texto = self._generar_contenido_texto(
-            datos_autorizadores, grupos_red, fecha_actual
-        )
-
-        # Crear archivo .msg (simulado como .eml para compatibilidad)
-        archivo_nombre = f"Solicitud_Conformidad_Matriz_Roles_{fecha_archivo}.eml"
-        archivo_path = self.directorio_salida / archivo_nombre
-
-        # Generar correo en formato EML (compatible con Outlook)
-        correo_eml = self._crear_archivo_eml(
-            contenido_html, contenido_texto, datos_autorizadores
-        )
-
-        with open(archivo_path, "w", encoding="utf-8") as file:
-            file.write(correo_eml)
-
-        return str(archivo_path)
-
-    def _generar_contenido_html(
-        self,
-        datos_autorizadores: List[Dict[str, str]],
-        grupos_red: List[str],
-        fecha: str,
-    ) -> str:
-        """Genera el contenido HTML del correo."""
-
-        # Construir tabla de autorizadores
-        tabla_autorizadores = ""
-        for dato in datos_autorizadores:
-            tabla_autorizadores += f"""
-                <tr>
-                    <td style="border: 1px solid #ddd; padding: 8px; text-align: center;">{dato['codigo']}</td>
-                    <td style="border: 1px solid #ddd; padding: 8px;">{dato['autorizador']}</td>
-                    <td style="border: 1px solid #ddd; padding: 8px;">{dato['correo']}</td>
-                </tr>"""
-
-        # Construir lista de grupos de red
-        lista_grupos = ""
-        for grupo in grupos_red:
-            lista_grupos += f"<li>{grupo}</li>"
-
-        html_content = f"""
+# Plantillas del correo consolidado (compiladas una sola vez)
+PLANTILLA_HTML = Plantilla("""
         <!DOCTYPE html>
         <html>
         <head>
             <meta charset="UTF-8">
             <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .header {{ background-color: #f4f4f4; padding: 20px; border-radius: 5px; margin-bottom: 20px; }}
-                .content {{ margin-bottom: 20px; }}
-                .table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-                .table th {{ background-color: #4CAF50; color: white; padding: 12px; text-align: left; }}
-                .table td {{ border: 1px solid #ddd; padding: 8px; }}
-                .highlight {{ background-color: #fff3cd; padding: 15px; border-radius: 5px; border-left: 4px solid #ffc107; }}
-                .footer {{ margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; font-size: 12px; color: #666; }}
+                body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+                .header { background-color: #f4f4f4; padding: 20px; border-radius: 5px; margin-bottom: 20px; }
+                .content { margin-bottom: 20px; }
+                .table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+                .table th { background-color: #4CAF50; color: white; padding: 12px; text-align: left; }
+                .table td { border: 1px solid #ddd; padding: 8px; }
+                .highlight { background-color: #fff3cd; padding: 15px; border-radius: 5px; border-left: 4px solid #ffc107; }
+                .footer { margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; font-size: 12px; color: #666; }
             </style>
         </head>
         <body>
             <div class="header">
                 <h2>🔐 Solicitud de Conformidad - Matriz de Roles</h2>
-                <p><strong>Fecha:</strong> {fecha}</p>
+                <p><strong>Fecha:</strong> ${fecha}</p>
             </div>
 
             <div class="content">
@@ -122,7 +46,7 @@ class GeneradorCorreos:
 
                 <h3>📋 Grupos de Red Solicitados:</h3>
                 <ul>
-                    {lista_grupos}
+                    ${lista_grupos}
                 </ul>
 
                 <h3>👥 Matriz de Autorizadores:</h3>
@@ -135,7 +59,7 @@ class GeneradorCorreos:
                         </tr>
                     </thead>
                     <tbody>
-                        {tabla_autorizadores}
+                        ${tabla_autorizadores}
                     </tbody>
                 </table>
 
@@ -164,35 +88,13 @@ class GeneradorCorreos:
             </div>
         </body>
         </html>
-        """
+        """)
 
-        return html_content
-
-    def _generar_contenido_texto(
-        self,
-        datos_autorizadores: List[Dict[str, str]],
-        grupos_red: List[str],
-        fecha: str,
-    ) -> str:
-        """Genera el contenido en texto plano del correo."""
-
-        # Construir lista de autorizadores
-        lista_autorizadores = ""
-        for dato in datos_autorizadores:
-            lista_autorizadores += (
-                f"  • {dato['codigo']} - {dato['autorizador']} ({dato['correo']})\n"
-            )
-
-        # Construir lista de grupos
-        lista_grupos = ""
-        for grupo in grupos_red:
-            lista_grupos += f"  • {grupo}\n"
-
-        texto_content = f"""
+PLANTILLA_TEXTO = Plantilla("""
 SOLICITUD DE CONFORMIDAD - MATRIZ DE ROLES
 ==========================================
 
-Fecha: {fecha}
+Fecha: ${fecha}
 
 Estimado(a) Autorizador(a),
 
@@ -200,10 +102,10 @@ Esperamos que se encuentre bien. Le escribimos para solicitar su CONFORMIDAD
 respecto a la asignación de roles y permisos en los siguientes sistemas:
 
 GRUPOS DE RED SOLICITADOS:
-{lista_grupos}
+${lista_grupos}
 
 MATRIZ DE AUTORIZADORES:
-{lista_autorizadores}
+${lista_autorizadores}
 
 ACCIÓN REQUERIDA:
 Por favor, revise la información anterior y confirme:
@@ -220,50 +122,121 @@ INFORMACIÓN DE CONTACTO:
 ---
 Este correo ha sido generado automáticamente por el Sistema de Gestión de Matriz de Roles.
 Por favor, no responda directamente a este correo. Utilice los datos de contacto proporcionados.
-        """
+        """)
 
-        return texto_content
+_fila_html = Plantilla("""
+                <tr>
+                    <td style="border: 1px solid #ddd; padding: 8px; text-align: center;">${codigo}</td>
+                    <td style="border: 1px solid #ddd; padding: 8px;">${autorizador}</td>
+                    <td style="border: 1px solid #ddd; padding: 8px;">${correo}</td>
+                </tr>""")
+_fila_texto = Plantilla("  • ${codigo} - ${autorizador} (${correo})\n")
 
-    def _crear_archivo_eml(
-        self,
-        contenido_html: str,
-        contenido_texto: str,
-        datos_autorizadores: List[Dict[str, str]],
+# Este correo no destaca filas: ambas variantes son iguales
+_filas_html = compilar_filas(_fila_html, _fila_html)
+_filas_texto = compilar_filas(_fila_texto, _fila_texto)
+_grupos_html = compilar_lista(Plantilla("<li>${valor}</li>"))
+_grupos_texto = compilar_lista(Plantilla("  • ${valor}\n"))
+
+
+class GeneradorCorreos:
+    """Generador de correos de solicitud de conformidad."""
+
+    def __init__(self):
+        """Inicializa el generador de correos."""
+        self.directorio_salida = directorio_correos()
+
+    def generar_correo_conformidad(
+        self, datos_autorizadores: List[Dict[str, str]], grupos_red: List[str]
     ) -> str:
-        """Crea el contenido del archivo EML."""
+        """
+        Genera un archivo de correo para solicitar conformidad.
 
-        # Obtener lista de destinatarios
-        destinatarios = []
-        for dato in datos_autorizadores:
-            if dato["correo"]:
-                destinatarios.append(f"{dato['autorizador']} <{dato['correo']}>")
+        Args:
+            datos_autorizadores: Lista con datos de autorizadores
+            grupos_red: Lista de grupos de red seleccionados
 
-        destinatarios_str = "; ".join(destinatarios)
-        fecha_rfc = datetime.now().strftime("%a, %d %b %Y %H:%M:%S %z")
+        Returns:
+            Ruta del archivo de correo generado
+        """
+        fecha_actual = datetime.now().strftime("%Y-%m-%d %H:%M")
+        fecha_archivo = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        eml_content = f"""From: Gestión de Accesos <gestion.accesos@empresa.com>
-To: {destinatarios_str}
-Subject: 🔐 Solicitud de Conformidad - Matriz de Roles - ACCIÓN REQUERIDA
-Date: {fecha_rfc}
-MIME-Version: 1.0
-Content-Type: multipart/alternative; boundary="boundary123"
+        # Generar contenido del correo
+        contenido_html = self._generar_contenido_html(
+            datos_autorizadores, grupos_red, fecha_actual
+        )
+        contenido_texto = self._generar_contenido_texto(
+            datos_autorizadores, grupos_red, fecha_actual
+        )
 
---boundary123
-Content-Type: text/plain; charset=UTF-8
-Content-Transfer-Encoding: 8bit
+        # Crear archivo .msg (simulado como .eml para compatibilidad)
+        archivo_nombre = f"Solicitud_Conformidad_Matriz_Roles_{fecha_archivo}.eml"
+        archivo_path = self.directorio_salida / archivo_nombre
 
-{contenido_texto}
+        # Generar correo en formato EML (compatible con Outlook)
+        correo_eml = self._crear_archivo_eml(
+            contenido_html, contenido_texto, datos_autorizadores
+        )
+        escribir_mensaje(correo_eml, archivo_path)
 
---boundary123
-Content-Type: text/html; charset=UTF-8
-Content-Transfer-Encoding: 8bit
+        return str(archivo_path)
 
-{contenido_html}
+    def _generar_contenido_html(
+        self,
+        datos_autorizadores: List[Dict[str, str]],
+        grupos_red: List[str],
+        fecha: str,
+    ) -> str:
+        """Genera el contenido HTML del correo."""
+        return PLANTILLA_HTML.renderizar(
+            {
+                "fecha": fecha,
+                "lista_grupos": _grupos_html(tuple(grupos_red)),
+                "tabla_autorizadores": _filas_html(
+                    clave_autorizadores(datos_autorizadores)
+                ).unir(),
+            }
+        )
 
---boundary123--
-"""
+    def _generar_contenido_texto(
+        self,
+        datos_autorizadores: List[Dict[str, str]],
+        grupos_red: List[str],
+        fecha: str,
+    ) -> str:
+        """Genera el contenido en texto plano del correo."""
+        return PLANTILLA_TEXTO.renderizar(
+            {
+                "fecha": fecha,
+                "lista_grupos": _grupos_texto(tuple(grupos_red)),
+                "lista_autorizadores": _filas_texto(
+                    clave_autorizadores(datos_autorizadores)
+                ).unir(),
+            }
+        )
 
-        return eml_content
+    def _crear_archivo_eml(
+        self,
+        contenido_html: str,
+        contenido_texto: str,
+        datos_autorizadores: List[Dict[str, str]],
+    ) -> EmailMessage:
+        """Crea el mensaje MIME del archivo EML."""
+
+        # Obtener lista de destinatarios
+        destinatarios = [
+            (dato["autorizador"], dato["correo"])
+            for dato in datos_autorizadores
+            if dato["correo"]
+        ]
+
+        return construir_mensaje(
+            destinatarios,
+            "🔐 Solicitud de Conformidad - Matriz de Roles - ACCIÓN REQUERIDA",
+            contenido_texto,
+            contenido_html,
+        )
 
 
 def generar_correo_desde_datos(
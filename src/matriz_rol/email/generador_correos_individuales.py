@@ -2,41 +2,232 @@
 Módulo para generar correos MSG individuales de solicitud de conformidad.
 
 Este módulo crea archivos .msg de Outlook separados para cada autorizador
-con la solicitud de conformidad personalizada.
+con la solicitud de conformidad personalizada. Los cuerpos se generan en un
+grupo de hilos y los archivos se escriben en otro, de tamaño acotado, para
+que el disco (o Outlook) no reciba más escrituras simultáneas de las que
+conviene.
 """
 
 import os
 import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple, Union
 
-try:
-    import win32com.client
-    import pythoncom
+from ..rutas import directorio_correos_individuales
+from .motores_correo import (
+    MotorCorreo,
+    MotorEml,
+    MotorOutlook,
+    crear_motor_correo,
+)
+from .plantillas import Plantilla, clave_autorizadores, compilar_filas, compilar_lista
 
-    OUTLOOK_DISPONIBLE = True
-except ImportError:
-    OUTLOOK_DISPONIBLE = False
-    print(
-        "⚠️ Advertencia: pywin32 no está disponible. Se crearán archivos EML en lugar de MSG."
-    )
+# Hilos que generan el contenido HTML y de texto de los correos
+HILOS_RENDERIZADO = min(8, os.cpu_count() or 1)
+
+# Escrituras simultáneas de archivos (el motor Outlook además las atiende
+# de a una en su propio hilo COM)
+HILOS_ESCRITURA = 4
+
+
+# Plantillas del correo de cada autorizador (compiladas una sola vez)
+PLANTILLA_HTML_INDIVIDUAL = Plantilla("""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Solicitud de Conformidad</title>
+</head>
+<body style="font-family: Arial, sans-serif; margin: 20px; color: #333;">
+    <div style="border: 2px solid #007acc; border-radius: 8px; padding: 20px; background-color: #f8f9fa;">
+        <h2 style="color: #007acc; margin-top: 0;">🔐 Solicitud de Conformidad - Código ${codigo}</h2>
+        <p style="color: #666; margin: 5px 0;"><strong>Fecha:</strong> ${fecha}</p>
+        <p style="color: #007acc; font-weight: bold;">Autorizador responsable: ${autorizador}</p>
+    </div>
+
+    <p>Estimado(a) <strong>${autorizador}</strong>,</p>
+
+    <p>Esperamos que se encuentre bien. Le escribimos para solicitar su <strong style="color: #d63384;">CONFORMIDAD</strong> respecto a la asignación de roles y permisos en los siguientes sistemas:</p>
+
+    <div style="background-color: #e7f3ff; padding: 15px; border-left: 4px solid #007acc; margin: 20px 0;">
+        <h3 style="margin-top: 0; color: #007acc;">📋 Grupos de Red Solicitados:</h3>
+        <ul style="margin: 10px 0;">
+            ${lista_grupos}
+        </ul>
+    </div>
+
+    <h3 style="color: #333;">👥 Matriz de Autorizadores:</h3>
+    <p><em>Su código de aplicación aparece destacado en amarillo:</em></p>
+
+    <table style="border-collapse: collapse; width: 100%; margin: 20px 0;">
+        <thead>
+            <tr style="background-color: #007acc; color: white;">
+                <th style="padding: 10px; border: 1px solid #ddd;">Código Aplicación</th>
+                <th style="padding: 10px; border: 1px solid #ddd;">Autorizador Responsable</th>
+                <th style="padding: 10px; border: 1px solid #ddd;">Correo Electrónico</th>
+            </tr>
+        </thead>
+        <tbody>
+            ${tabla_autorizadores}
+        </tbody>
+    </table>
+
+    <div style="background-color: #fff3cd; border: 1px solid #ffeaa7; border-radius: 5px; padding: 20px; margin: 20px 0;">
+        <h3 style="color: #856404; margin-top: 0;">📝 ACCIÓN REQUERIDA PARA EL CÓDIGO ${codigo}:</h3>
+        <p>Por favor, revise la información anterior y confirme específicamente para su código de aplicación <strong style="background-color: #fff2cc; padding: 2px 6px; border-radius: 3px;">${codigo}</strong>:</p>
+        <ul style="color: #856404;">
+            <li>✅ <strong>APRUEBO</strong> - La asignación de roles es correcta</li>
+            <li>❌ <strong>RECHAZO</strong> - Se requieren modificaciones (especificar motivo)</li>
+        </ul>
+        <p style="color: #856404;"><strong>Plazo de respuesta:</strong> 3 días hábiles a partir de la fecha de este correo.</p>
+    </div>
+
+    <div style="border-top: 1px solid #ddd; padding-top: 20px; margin-top: 30px;">
+        <h4 style="color: #007acc;">📞 Información de Contacto:</h4>
+        <p>
+            • <strong>Equipo de Gestión de Accesos</strong><br>
+            • Email: <a href="mailto:gestion.accesos@empresa.com">gestion.accesos@empresa.com</a><br>
+            • Teléfono: +1 (555) 123-4567
+        </p>
+
+        <hr style="border: none; border-top: 1px solid #eee; margin: 20px 0;">
+        <p style="font-size: 12px; color: #666;">
+            Este correo ha sido generado automáticamente por el Sistema de Gestión de Matriz de Roles.<br>
+            Por favor, no responda directamente a este correo. Utilice los datos de contacto proporcionados.
+        </p>
+    </div>
+</body>
+</html>""")
+
+PLANTILLA_TEXTO_INDIVIDUAL = Plantilla("""SOLICITUD DE CONFORMIDAD - CÓDIGO ${codigo}
+=========================================================
+
+Fecha: ${fecha}
+Autorizador responsable: ${autorizador}
+
+Estimado(a) ${autorizador},
+
+Esperamos que se encuentre bien. Le escribimos para solicitar su CONFORMIDAD respecto a la asignación de roles y permisos en los siguientes sistemas:
+
+GRUPOS DE RED SOLICITADOS:
+${lista_grupos}
+
+MATRIZ DE AUTORIZADORES:
+(Su código ${codigo} aparece marcado con ***)
+${lista_autorizadores}
+
+ACCIÓN REQUERIDA ESPECÍFICAMENTE PARA EL CÓDIGO ${codigo}:
+================================================================
+Por favor, revise la información anterior y confirme:
+  ✅ APRUEBO - La asignación de roles es correcta
+  ❌ RECHAZO - Se requieren modificaciones (especificar motivo)
+
+Plazo de respuesta: 3 días hábiles a partir de la fecha de este correo.
+
+INFORMACIÓN DE CONTACTO:
+========================
+  • Equipo de Gestión de Accesos
+  • Email: gestion.accesos@empresa.com
+  • Teléfono: +1 (555) 123-4567
+
+---
+Este correo ha sido generado automáticamente por el Sistema de Gestión de Matriz de Roles.
+Por favor, no responda directamente a este correo. Utilice los datos de contacto proporcionados.
+""")
+
+_FILA_HTML = """
+                <tr ${estilo}>
+                    <td style="padding: 8px; border: 1px solid #ddd;">${codigo}</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">${autorizador}</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">${correo}</td>
+                </tr>"""
+
+# Filas de la tabla; la del código del destinatario va destacada
+_filas_html = compilar_filas(
+    Plantilla(_FILA_HTML.replace("${estilo}", "")),
+    Plantilla(
+        _FILA_HTML.replace(
+            "${estilo}", 'style="background-color: #fff2cc; font-weight: bold;"'
+        )
+    ),
+)
+_filas_texto = compilar_filas(
+    Plantilla("  • ${codigo} - ${autorizador} (${correo})\n"),
+    Plantilla("  • ${codigo} - ${autorizador} (${correo}) *** SU CÓDIGO ***\n"),
+)
+_grupos_html = compilar_lista(Plantilla("<li>${valor}</li>"))
+_grupos_texto = compilar_lista(Plantilla("  • ${valor}"), separador="\n")
+
+
+class ResultadoCorreo:
+    """Resultado de generar el correo de un autorizador."""
+
+    def __init__(
+        self,
+        numero: int,
+        codigo: str,
+        autorizador: str,
+        ruta: Optional[str] = None,
+        error: Optional[str] = None,
+    ):
+        """
+        Inicializa el resultado.
+
+        Args:
+            numero: Posición del autorizador en la lista (desde 1)
+            codigo: Código de aplicación
+            autorizador: Nombre del autorizador
+            ruta: Archivo generado (None si falló)
+            error: Motivo del fallo (None si se generó)
+        """
+        self.numero = numero
+        self.codigo = codigo
+        self.autorizador = autorizador
+        self.ruta = ruta
+        self.error = error
+
+    @property
+    def exitoso(self) -> bool:
+        """Indica si el archivo se generó."""
+        return self.ruta is not None
+
+    def __repr__(self) -> str:
+        detalle = self.ruta if self.exitoso else f"error={self.error!r}"
+        return f"ResultadoCorreo({self.numero:02d}, {self.codigo}, {detalle})"
 
 
 class GeneradorCorreosIndividuales:
     """Generador de correos MSG individuales para cada autorizador."""
 
-    def __init__(self):
-        """Inicializa el generador de correos individuales."""
-        # Buscar la raíz del proyecto (donde está ejecutar_app.py)
-        current_path = Path(__file__).resolve()
-        while current_path.parent != current_path:
-            if (current_path / "ejecutar_app.py").exists():
-                break
-            current_path = current_path.parent
+    def __init__(
+        self,
+        paralelo: bool = True,
+        hilos_renderizado: int = HILOS_RENDERIZADO,
+        hilos_escritura: int = HILOS_ESCRITURA,
+        motor: Optional[MotorCorreo] = None,
+    ):
+        """
+        Inicializa el generador de correos individuales.
 
-        self.directorio_salida = current_path / "output" / "correos_individuales"
-        self.directorio_salida.mkdir(parents=True, exist_ok=True)
+        Args:
+            paralelo: Generar los correos en grupos de hilos
+                (False los genera uno a uno, en el hilo actual)
+            hilos_renderizado: Hilos que generan el contenido de los correos
+            hilos_escritura: Máximo de archivos escribiéndose a la vez
+            motor: Motor que guarda los correos (por defecto, Outlook si
+                está disponible y EML si no)
+        """
+        self.motor = motor or crear_motor_correo()
+        self.paralelo = paralelo
+        self.hilos_renderizado = max(1, hilos_renderizado)
+        self.hilos_escritura = max(1, hilos_escritura)
+
+        # La raíz del proyecto se resuelve una sola vez por proceso
+        self.directorio_salida = directorio_correos_individuales()
 
     def generar_correos_individuales(
         self, datos_autorizadores: List[Dict[str, str]], grupos_red: List[str]
@@ -51,48 +242,171 @@ class GeneradorCorreosIndividuales:
         Returns:
             Lista de rutas de archivos MSG generados
         """
-        archivos_generados = []
+        return [
+            resultado.ruta
+            for resultado in self.generar_correos_con_resultados(
+                datos_autorizadores, grupos_red
+            )
+            if resultado.exitoso
+        ]
+
+    def generar_correos_con_resultados(
+        self, datos_autorizadores: List[Dict[str, str]], grupos_red: List[str]
+    ) -> List[ResultadoCorreo]:
+        """
+        Genera los correos individuales e informa el resultado de cada uno.
+
+        El nombre de cada archivo depende solo de la posición del autorizador
+        en la lista, no del orden en que terminan los hilos.
+
+        Args:
+            datos_autorizadores: Lista con datos de autorizadores
+            grupos_red: Lista de grupos de red seleccionados
+
+        Returns:
+            Un resultado por autorizador, en el orden de la lista
+        """
         fecha_actual = datetime.now().strftime("%Y-%m-%d %H:%M")
         fecha_archivo = datetime.now().strftime("%Y%m%d_%H%M")
+        total = len(datos_autorizadores)
 
         # Crear carpeta específica para esta solicitud
         carpeta_solicitud = self._crear_carpeta_solicitud(fecha_archivo, grupos_red)
 
-        print(
-            f"📧 Generando correos individuales para {len(datos_autorizadores)} autorizadores..."
-        )
+        print(f"📧 Generando correos individuales para {total} autorizadores...")
         print(f"📁 Carpeta de solicitud: {carpeta_solicitud}")
 
-        for i, autorizador in enumerate(datos_autorizadores, 1):
+        resultados = [
+            ResultadoCorreo(
+                i, autorizador.get("codigo", ""), autorizador.get("autorizador", "")
+            )
+            for i, autorizador in enumerate(datos_autorizadores, 1)
+        ]
+        pendientes = []
+        for resultado, autorizador in zip(resultados, datos_autorizadores):
             if autorizador.get("autorizador") and autorizador.get("correo"):
-                try:
-                    archivo_path = self._crear_correo_individual(
-                        autorizador,
-                        datos_autorizadores,
-                        grupos_red,
-                        fecha_actual,
-                        fecha_archivo,
-                        i,
-                        carpeta_solicitud,
-                    )
-                    archivos_generados.append(archivo_path)
-                    print(
-                        f"✅ {i}/{len(datos_autorizadores)} - Correo para {autorizador['autorizador']}"
-                    )
-                except Exception as e:
-                    print(
-                        f"❌ Error generando correo para {autorizador['autorizador']}: {e}"
-                    )
+                pendientes.append((resultado.numero, autorizador))
+            else:
+                resultado.error = "Faltan el autorizador o el correo"
+
+        def preparar(numero: int, autorizador: Dict[str, str]):
+            return self._preparar_correo_individual(
+                autorizador,
+                datos_autorizadores,
+                grupos_red,
+                fecha_actual,
+                fecha_archivo,
+                numero,
+                carpeta_solicitud,
+            )
+
+        rutas = None
+        try:
+            # Una sola sesión del motor (p. ej. una aplicación Outlook) por lote
+            with self.motor.sesion() as motor:
+                rutas = self._generar_lote(pendientes, preparar, motor)
+        except Exception as e:
+            if rutas is None:
+                # Outlook no arrancó: el lote completo se guarda como EML
+                print(f"❌ Error abriendo {type(self.motor).__name__}: {e}")
+                with MotorEml().sesion() as motor:
+                    rutas = self._generar_lote(pendientes, preparar, motor)
+            else:
+                print(f"⚠️ Error cerrando {type(self.motor).__name__}: {e}")
+
+        for (numero, autorizador), ruta in zip(pendientes, rutas):
+            resultado = resultados[numero - 1]
+            if isinstance(ruta, Exception):
+                resultado.error = str(ruta)
+                print(
+                    f"❌ Error generando correo para {autorizador['autorizador']}: {ruta}"
+                )
+            else:
+                resultado.ruta = ruta
+                print(f"✅ {numero}/{total} - Correo para {autorizador['autorizador']}")
 
         # Crear archivo resumen de la solicitud
         self._crear_resumen_solicitud(
-            carpeta_solicitud, datos_autorizadores, grupos_red, fecha_actual
+            carpeta_solicitud, datos_autorizadores, grupos_red, fecha_actual, resultados
         )
 
+        exitosos = sum(1 for resultado in resultados if resultado.exitoso)
         print(f"\n📁 Correos generados en: {carpeta_solicitud}")
-        print(f"📊 Total exitosos: {len(archivos_generados)}")
+        print(f"📊 Total exitosos: {exitosos}")
+
+        return resultados
+
+    def _generar_lote(
+        self,
+        pendientes: List[Tuple[int, Dict[str, str]]],
+        preparar: Callable[[int, Dict[str, str]], Tuple],
+        motor: MotorCorreo,
+    ) -> List[Union[str, Exception]]:
+        """
+        Genera y guarda los correos pendientes con el motor indicado.
+
+        Args:
+            pendientes: Pares (número, autorizador) a generar
+            preparar: Función que devuelve los argumentos de _escribir_correo
+            motor: Motor con la sesión ya abierta
+
+        Returns:
+            La ruta de cada correo o la excepción que lo impidió, en el
+            orden de ``pendientes``
+        """
+        escribir = partial(self._escribir_correo, motor=motor)
+
+        if self.paralelo and len(pendientes) > 1:
+            return self._generar_en_paralelo(pendientes, preparar, escribir)
 
-        return archivos_generados
+        rutas: List[Union[str, Exception]] = []
+        for numero, autorizador in pendientes:
+            try:
+                rutas.append(escribir(*preparar(numero, autorizador)))
+            except Exception as e:
+                rutas.append(e)
+        return rutas
+
+    def _generar_en_paralelo(
+        self,
+        pendientes: List[Tuple[int, Dict[str, str]]],
+        preparar: Callable[[int, Dict[str, str]], Tuple],
+        escribir: Callable[..., str],
+    ) -> List[Union[str, Exception]]:
+        """
+        Genera el contenido en un grupo de hilos y escribe los archivos en
+        otro, acotado a ``hilos_escritura``.
+
+        Args:
+            pendientes: Pares (número, autorizador) a generar
+            preparar: Función que devuelve los argumentos de ``escribir``
+            escribir: Función que guarda un correo y devuelve su ruta
+
+        Returns:
+            La ruta de cada correo o la excepción que lo impidió, en el
+            orden de ``pendientes``
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.hilos_escritura, thread_name_prefix="correos-escritura"
+        ) as escritura, ThreadPoolExecutor(
+            max_workers=self.hilos_renderizado, thread_name_prefix="correos-contenido"
+        ) as renderizado:
+
+            def preparar_y_encolar(numero: int, autorizador: Dict[str, str]) -> Future:
+                return escritura.submit(escribir, *preparar(numero, autorizador))
+
+            futuros = [
+                renderizado.submit(preparar_y_encolar, numero, autorizador)
+                for numero, autorizador in pendientes
+            ]
+
+            rutas: List[Union[str, Exception]] = []
+            for futuro in futuros:
+                try:
+                    rutas.append(futuro.result().result())
+                except Exception as e:
+                    rutas.append(e)
+            return rutas
 
     def _crear_correo_individual(
         self,
@@ -105,7 +419,35 @@ class GeneradorCorreosIndividuales:
         carpeta_solicitud: Path,
     ) -> str:
         """Crea un archivo MSG individual para un autorizador específico."""
+        return self._escribir_correo(
+            *self._preparar_correo_individual(
+                autorizador_principal,
+                todos_autorizadores,
+                grupos_red,
+                fecha_actual,
+                fecha_archivo,
+                numero,
+                carpeta_solicitud,
+            )
+        )
 
+    def _preparar_correo_individual(
+        self,
+        autorizador_principal: Dict[str, str],
+        todos_autorizadores: List[Dict[str, str]],
+        grupos_red: List[str],
+        fecha_actual: str,
+        fecha_archivo: str,
+        numero: int,
+        carpeta_solicitud: Path,
+    ) -> Tuple[Path, Dict[str, str], str, str]:
+        """
+        Genera el contenido y la ruta del correo de un autorizador, sin
+        escribir nada en disco.
+
+        Returns:
+            Tupla (ruta .msg, autorizador, contenido HTML, contenido de texto)
+        """
         # Generar contenido personalizado para este autorizador
         contenido_html = self._generar_contenido_html_individual(
             autorizador_principal, todos_autorizadores, grupos_red, fecha_actual
@@ -124,18 +466,43 @@ class GeneradorCorreosIndividuales:
         )
         archivo_path = carpeta_solicitud / archivo_nombre
 
-        if OUTLOOK_DISPONIBLE:
-            self._crear_archivo_msg_outlook(
-                archivo_path, autorizador_principal, contenido_html, contenido_texto
+        return archivo_path, autorizador_principal, contenido_html, contenido_texto
+
+    def _escribir_correo(
+        self,
+        archivo_path: Path,
+        autorizador: Dict[str, str],
+        contenido_html: str,
+        contenido_texto: str,
+        motor: Optional[MotorCorreo] = None,
+    ) -> str:
+        """
+        Escribe el correo con el motor indicado (por defecto, el del
+        generador); si Outlook falla, lo guarda como EML.
+
+        Returns:
+            Ruta del archivo efectivamente creado
+        """
+        motor = motor or self.motor
+        destinatarios = [(autorizador["autorizador"], autorizador["correo"])]
+        asunto = f"🔐 Solicitud de Conformidad [{autorizador['codigo']}] - Matriz de Roles - ACCIÓN REQUERIDA"
+
+        try:
+            archivo_path = motor.guardar(
+                archivo_path, destinatarios, asunto, contenido_html, contenido_texto
             )
-        else:
-            # Crear archivo EML como alternativa
-            archivo_eml = archivo_path.with_suffix(".eml")
-            self._crear_archivo_eml_individual(
-                archivo_eml, autorizador_principal, contenido_html, contenido_texto
+        except Exception as e:
+            if not isinstance(motor, MotorOutlook):
+                raise
+            print(f"❌ Error creando MSG: {e}")
+            # Crear EML como fallback
+            archivo_path = MotorEml().guardar(
+                archivo_path, destinatarios, asunto, contenido_html, contenido_texto
             )
-            archivo_path = archivo_eml
 
+        print(
+            f"📧 Archivo {archivo_path.suffix[1:].upper()} creado: {archivo_path.name}"
+        )
         return str(archivo_path)
 
     def _crear_carpeta_solicitud(
@@ -151,8 +518,12 @@ class GeneradorCorreosIndividuales:
         nombre_carpeta = f"Solicitud_{timestamp}_{grupos_cortos}"
         carpeta_solicitud = self.directorio_salida / nombre_carpeta
 
-        # Crear la carpeta
-        carpeta_solicitud.mkdir(parents=True, exist_ok=True)
+        # Crear la carpeta (el directorio de salida ya existe, salvo que se
+        # haya borrado mientras la aplicación estaba abierta)
+        try:
+            carpeta_solicitud.mkdir(exist_ok=True)
+        except FileNotFoundError:
+            carpeta_solicitud.mkdir(parents=True, exist_ok=True)
 
         return carpeta_solicitud
 
@@ -162,8 +533,11 @@ class GeneradorCorreosIndividuales:
         datos_autorizadores: List[Dict[str, str]],
         grupos_red: List[str],
         fecha_actual: str,
+        resultados: Optional[List[ResultadoCorreo]] = None,
     ):
         """Crea un archivo resumen de la solicitud."""
+        if resultados is None:
+            resultados = []
         resumen_path = carpeta_solicitud / "RESUMEN_SOLICITUD.txt"
 
         contenido_resumen = f"""RESUMEN DE SOLICITUD DE CONFORMIDAD
@@ -179,7 +553,7 @@ class GeneradorCorreosIndividuales:
 {chr(10).join(f"  • {auth['codigo']} - {auth['autorizador']} ({auth['correo']})" for auth in datos_autorizadores)}
 
 📧 ARCHIVOS GENERADOS:
-{chr(10).join(f"  • {i:02d}_Conformidad_{auth['codigo']}_{self._limpiar_nombre_archivo(auth['autorizador'])}_{carpeta_solicitud.name.split('_')[1]}.msg" for i, auth in enumerate(datos_autorizadores, 1))}
+{chr(10).join(f"  • {Path(r.ruta).name}" if r.exitoso else f"  ✗ {r.numero:02d} {r.codigo} - {r.autorizador}: {r.error}" for r in resultados)}
 
 📋 INSTRUCCIONES:
 1. Revisar cada archivo MSG individual
@@ -198,87 +572,6 @@ Generado automáticamente por el Sistema de Gestión de Matriz de Roles
         except Exception as e:
             print(f"⚠️ Error creando resumen: {e}")
 
-    def _crear_archivo_msg_outlook(
-        self,
-        archivo_path: Path,
-        autorizador: Dict[str, str],
-        contenido_html: str,
-        contenido_texto: str,
-    ):
-        """Crea un archivo MSG usando Outlook COM."""
-        try:
-            # Inicializar COM
-            pythoncom.CoInitialize()
-
-            # Crear aplicación Outlook
-            outlook = win32com.client.Dispatch("Outlook.Application")
-
-            # Crear nuevo elemento de correo
-            mail = outlook.CreateItem(0)  # 0 = olMailItem
-
-            # Configurar correo con código de aplicación en el asunto
-            mail.To = f"{autorizador['autorizador']} <{autorizador['correo']}>"
-            mail.Subject = f"🔐 Solicitud de Conformidad [{autorizador['codigo']}] - Matriz de Roles - ACCIÓN REQUERIDA"
-            mail.HTMLBody = contenido_html
-            mail.Body = contenido_texto
-
-            # Guardar como archivo MSG
-            mail.SaveAs(str(archivo_path), 3)  # 3 = olMSG
-
-            print(f"📧 Archivo MSG creado: {archivo_path.name}")
-
-        except Exception as e:
-            print(f"❌ Error creando MSG: {e}")
-            # Crear EML como fallback
-            archivo_eml = archivo_path.with_suffix(".eml")
-            self._crear_archivo_eml_individual(
-                archivo_eml, autorizador, contenido_html, contenido_texto
-            )
-        finally:
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
-
-    def _crear_archivo_eml_individual(
-        self,
-        archivo_path: Path,
-        autorizador: Dict[str, str],
-        contenido_html: str,
-        contenido_texto: str,
-    ):
-        """Crea un archivo EML como alternativa al MSG."""
-
-        # Codificar asunto con código de aplicación
-        asunto_codificado = f"🔐 Solicitud de Conformidad [{autorizador['codigo']}] - Matriz de Roles - ACCIÓN REQUERIDA"
-
-        eml_content = f"""From: Gestión de Accesos <gestion.accesos@empresa.com>
-To: {autorizador['autorizador']} <{autorizador['correo']}>
-Subject: {asunto_codificado}
-Date: {datetime.now().strftime('%a, %d %b %Y %H:%M:%S %z')}
-MIME-Version: 1.0
-Content-Type: multipart/alternative; boundary="boundary123"
-
---boundary123
-Content-Type: text/plain; charset=UTF-8
-Content-Transfer-Encoding: 8bit
-
-{contenido_texto}
-
---boundary123
-Content-Type: text/html; charset=UTF-8
-Content-Transfer-Encoding: 8bit
-
-{contenido_html}
-
---boundary123--
-"""
-
-        with open(archivo_path, "w", encoding="utf-8") as file:
-            file.write(eml_content)
-
-        print(f"📧 Archivo EML creado: {archivo_path.name}")
-
     def _limpiar_nombre_archivo(self, nombre: str) -> str:
         """Limpia el nombre para usarlo en archivo."""
         # Tomar solo los primeros nombres/apellidos
@@ -300,90 +593,19 @@ Content-Transfer-Encoding: 8bit
         fecha: str,
     ) -> str:
         """Genera contenido HTML personalizado para un autorizador específico."""
-
-        # Destacar el rol del autorizador principal
-        tabla_autorizadores = ""
-        for dato in todos_autorizadores:
-            estilo_fila = ""
-            if dato["codigo"] == autorizador_principal["codigo"]:
-                estilo_fila = 'style="background-color: #fff2cc; font-weight: bold;"'
-
-            tabla_autorizadores += f"""
-                <tr {estilo_fila}>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{dato['codigo']}</td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{dato['autorizador']}</td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{dato['correo']}</td>
-                </tr>"""
-
-        lista_grupos = "".join([f"<li>{grupo}</li>" for grupo in grupos_red])
-
-        return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Solicitud de Conformidad</title>
-</head>
-<body style="font-family: Arial, sans-serif; margin: 20px; color: #333;">
-    <div style="border: 2px solid #007acc; border-radius: 8px; padding: 20px; background-color: #f8f9fa;">
-        <h2 style="color: #007acc; margin-top: 0;">🔐 Solicitud de Conformidad - Código {autorizador_principal['codigo']}</h2>
-        <p style="color: #666; margin: 5px 0;"><strong>Fecha:</strong> {fecha}</p>
-        <p style="color: #007acc; font-weight: bold;">Autorizador responsable: {autorizador_principal['autorizador']}</p>
-    </div>
-
-    <p>Estimado(a) <strong>{autorizador_principal['autorizador']}</strong>,</p>
-
-    <p>Esperamos que se encuentre bien. Le escribimos para solicitar su <strong style="color: #d63384;">CONFORMIDAD</strong> respecto a la asignación de roles y permisos en los siguientes sistemas:</p>
-
-    <div style="background-color: #e7f3ff; padding: 15px; border-left: 4px solid #007acc; margin: 20px 0;">
-        <h3 style="margin-top: 0; color: #007acc;">📋 Grupos de Red Solicitados:</h3>
-        <ul style="margin: 10px 0;">
-            {lista_grupos}
-        </ul>
-    </div>
-
-    <h3 style="color: #333;">👥 Matriz de Autorizadores:</h3>
-    <p><em>Su código de aplicación aparece destacado en amarillo:</em></p>
-
-    <table style="border-collapse: collapse; width: 100%; margin: 20px 0;">
-        <thead>
-            <tr style="background-color: #007acc; color: white;">
-                <th style="padding: 10px; border: 1px solid #ddd;">Código Aplicación</th>
-                <th style="padding: 10px; border: 1px solid #ddd;">Autorizador Responsable</th>
-                <th style="padding: 10px; border: 1px solid #ddd;">Correo Electrónico</th>
-            </tr>
-        </thead>
-        <tbody>
-            {tabla_autorizadores}
-        </tbody>
-    </table>
-
-    <div style="background-color: #fff3cd; border: 1px solid #ffeaa7; border-radius: 5px; padding: 20px; margin: 20px 0;">
-        <h3 style="color: #856404; margin-top: 0;">📝 ACCIÓN REQUERIDA PARA EL CÓDIGO {autorizador_principal['codigo']}:</h3>
-        <p>Por favor, revise la información anterior y confirme específicamente para su código de aplicación <strong style="background-color: #fff2cc; padding: 2px 6px; border-radius: 3px;">{autorizador_principal['codigo']}</strong>:</p>
-        <ul style="color: #856404;">
-            <li>✅ <strong>APRUEBO</strong> - La asignación de roles es correcta</li>
-            <li>❌ <strong>RECHAZO</strong> - Se requieren modificaciones (especificar motivo)</li>
-        </ul>
-        <p style="color: #856404;"><strong>Plazo de respuesta:</strong> 3 días hábiles a partir de la fecha de este correo.</p>
-    </div>
-
-    <div style="border-top: 1px solid #ddd; padding-top: 20px; margin-top: 30px;">
-        <h4 style="color: #007acc;">📞 Información de Contacto:</h4>
-        <p>
-            • <strong>Equipo de Gestión de Accesos</strong><br>
-            • Email: <a href="mailto:gestion.accesos@empresa.com">gestion.accesos@empresa.com</a><br>
-            • Teléfono: +1 (555) 123-4567
-        </p>
-
-        <hr style="border: none; border-top: 1px solid #eee; margin: 20px 0;">
-        <p style="font-size: 12px; color: #666;">
-            Este correo ha sido generado automáticamente por el Sistema de Gestión de Matriz de Roles.<br>
-            Por favor, no responda directamente a este correo. Utilice los datos de contacto proporcionados.
-        </p>
-    </div>
-</body>
-</html>"""
+        # Tabla y grupos se generan una vez por solicitud; aquí solo se
+        # destaca la fila del autorizador principal
+        filas = _filas_html(clave_autorizadores(todos_autorizadores))
+
+        return PLANTILLA_HTML_INDIVIDUAL.renderizar(
+            {
+                "codigo": autorizador_principal["codigo"],
+                "autorizador": autorizador_principal["autorizador"],
+                "fecha": fecha,
+                "lista_grupos": _grupos_html(tuple(grupos_red)),
+                "tabla_autorizadores": filas.unir(autorizador_principal["codigo"]),
+            }
+        )
 
     def _generar_contenido_texto_individual(
         self,
@@ -393,50 +615,35 @@ Content-Transfer-Encoding: 8bit
         fecha: str,
     ) -> str:
         """Genera contenido de texto plano personalizado para un autorizador específico."""
+        filas = _filas_texto(clave_autorizadores(todos_autorizadores))
+
+        return PLANTILLA_TEXTO_INDIVIDUAL.renderizar(
+            {
+                "codigo": autorizador_principal["codigo"],
+                "autorizador": autorizador_principal["autorizador"],
+                "fecha": fecha,
+                "lista_grupos": _grupos_texto(tuple(grupos_red)),
+                "lista_autorizadores": filas.unir(autorizador_principal["codigo"]),
+            }
+        )
 
-        lista_grupos = "\n".join([f"  • {grupo}" for grupo in grupos_red])
-
-        lista_autorizadores = ""
-        for dato in todos_autorizadores:
-            marcador = (
-                " *** SU CÓDIGO ***"
-                if dato["codigo"] == autorizador_principal["codigo"]
-                else ""
-            )
-            lista_autorizadores += f"  • {dato['codigo']} - {dato['autorizador']} ({dato['correo']}){marcador}\n"
-
-        return f"""SOLICITUD DE CONFORMIDAD - CÓDIGO {autorizador_principal['codigo']}
-=========================================================
-
-Fecha: {fecha}
-Autorizador responsable: {autorizador_principal['autorizador']}
-
-Estimado(a) {autorizador_principal['autorizador']},
 
-Esperamos que se encuentre bien. Le escribimos para solicitar su CONFORMIDAD respecto a la asignación de roles y permisos en los siguientes sistemas:
+_generador_compartido: Optional[GeneradorCorreosIndividuales] = None
+_lock_compartido = threading.Lock()
 
-GRUPOS DE RED SOLICITADOS:
-{lista_grupos}
 
-MATRIZ DE AUTORIZADORES:
-(Su código {autorizador_principal['codigo']} aparece marcado con ***)
-{lista_autorizadores}
+def generador_compartido() -> GeneradorCorreosIndividuales:
+    """
+    Obtiene el generador de correos individuales compartido por la aplicación.
 
-ACCIÓN REQUERIDA ESPECÍFICAMENTE PARA EL CÓDIGO {autorizador_principal['codigo']}:
-================================================================
-Por favor, revise la información anterior y confirme:
-  ✅ APRUEBO - La asignación de roles es correcta
-  ❌ RECHAZO - Se requieren modificaciones (especificar motivo)
+    Se crea en el primer uso y se reutiliza en los guardados siguientes.
 
-Plazo de respuesta: 3 días hábiles a partir de la fecha de este correo.
+    Returns:
+        Generador con la configuración por defecto
+    """
+    global _generador_compartido
 
-INFORMACIÓN DE CONTACTO:
-========================
-  • Equipo de Gestión de Accesos
-  • Email: gestion.accesos@empresa.com
-  • Teléfono: +1 (555) 123-4567
-
----
-Este correo ha sido generado automáticamente por el Sistema de Gestión de Matriz de Roles.
-Por favor, no responda directamente a este correo. Utilice los datos de contacto proporcionados.
-"""
+    with _lock_compartido:
+        if _generador_compartido is None:
+            _generador_compartido = GeneradorCorreosIndividuales()
+        return _generador_compartido
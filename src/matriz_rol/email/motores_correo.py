@@ -0,0 +1,245 @@
+"""
+Motores que guardan los correos generados en disco.
+
+Un motor se abre una vez por lote (``sesion``) y guarda todos los correos
+del lote con los mismos recursos: el motor de Outlook crea la aplicación COM
+una sola vez y la reutiliza para cada CreateItem/SaveAs. El motor EML es
+Python puro y permite ejecutar el mismo flujo sin Outlook (p. ej. en Linux).
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional
+
+from .escritor_eml import Contacto, direcciones, escribir_eml
+
+try:
+    import win32com.client
+    import pythoncom
+
+    OUTLOOK_DISPONIBLE = True
+except ImportError:
+    OUTLOOK_DISPONIBLE = False
+    print(
+        "⚠️ Advertencia: pywin32 no está disponible. Se crearán archivos EML en lugar de MSG."
+    )
+
+
+def crear_motor_correo(motor: Optional[str] = None) -> "MotorCorreo":
+    """
+    Crea el motor de correo indicado.
+
+    Args:
+        motor: "outlook" o "eml". Si no se indica se usa la variable de
+            entorno MATRIZ_ROL_MOTOR_CORREO o, en su defecto, "outlook" si
+            pywin32 está disponible y "eml" si no.
+
+    Returns:
+        Instancia del motor de correo
+    """
+    motor = (
+        motor
+        or os.environ.get("MATRIZ_ROL_MOTOR_CORREO")
+        or ("outlook" if OUTLOOK_DISPONIBLE else "eml")
+    ).lower()
+
+    if motor == "outlook":
+        if not OUTLOOK_DISPONIBLE:
+            raise ValueError("El motor 'outlook' requiere pywin32")
+        return MotorOutlook()
+    if motor == "eml":
+        return MotorEml()
+
+    raise ValueError(f"Motor de correo no reconocido: {motor}")
+
+
+class MotorCorreo:
+    """Interfaz base de los motores de correo."""
+
+    # Extensión de los archivos que genera el motor
+    extension = ""
+
+    def __init__(self):
+        """Inicializa el motor sin sesión abierta."""
+        self.sesiones_abiertas = 0
+        self.correos_guardados = 0
+        self._nivel_sesion = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def sesion(self) -> Iterator["MotorCorreo"]:
+        """
+        Mantiene el motor abierto durante un lote de correos.
+
+        Las sesiones anidadas reutilizan la sesión exterior.
+        """
+        with self._lock:
+            self._nivel_sesion += 1
+            if self._nivel_sesion == 1:
+                try:
+                    self._abrir()
+                except Exception:
+                    self._nivel_sesion = 0
+                    raise
+                self.sesiones_abiertas += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._nivel_sesion -= 1
+                if self._nivel_sesion == 0:
+                    self._cerrar()
+
+    def guardar(
+        self,
+        archivo: Path,
+        destinatarios: List[Contacto],
+        asunto: str,
+        contenido_html: str,
+        contenido_texto: str,
+    ) -> Path:
+        """
+        Guarda un correo.
+
+        Fuera de una sesión abre y cierra una solo para este correo.
+
+        Args:
+            archivo: Ruta del archivo (se le aplica la extensión del motor)
+            destinatarios: Pares (nombre, correo) de los destinatarios
+            asunto: Asunto del correo
+            contenido_html: Cuerpo HTML
+            contenido_texto: Cuerpo en texto plano
+
+        Returns:
+            Ruta del archivo creado
+        """
+        archivo = Path(archivo).with_suffix(self.extension)
+        with self.sesion():
+            self._guardar(
+                archivo, destinatarios, asunto, contenido_html, contenido_texto
+            )
+        with self._lock:
+            self.correos_guardados += 1
+        return archivo
+
+    def _abrir(self) -> None:
+        """Prepara los recursos de la sesión."""
+
+    def _cerrar(self) -> None:
+        """Libera los recursos de la sesión."""
+
+    def _guardar(
+        self,
+        archivo: Path,
+        destinatarios: List[Contacto],
+        asunto: str,
+        contenido_html: str,
+        contenido_texto: str,
+    ) -> None:
+        """Escribe el archivo del correo."""
+        raise NotImplementedError
+
+
+class MotorEml(MotorCorreo):
+    """Motor en Python puro que guarda archivos .eml."""
+
+    extension = ".eml"
+
+    def _guardar(
+        self,
+        archivo: Path,
+        destinatarios: List[Contacto],
+        asunto: str,
+        contenido_html: str,
+        contenido_texto: str,
+    ) -> None:
+        escribir_eml(archivo, destinatarios, asunto, contenido_texto, contenido_html)
+
+
+class MotorOutlook(MotorCorreo):
+    """
+    Motor que guarda archivos .msg con Outlook mediante COM.
+
+    COM asocia la aplicación al hilo que la creó, así que todas las llamadas
+    se ejecutan en un hilo propio de la sesión; ``guardar`` puede llamarse
+    desde cualquier hilo.
+    """
+
+    extension = ".msg"
+
+    def __init__(self):
+        """Inicializa el motor sin sesión abierta."""
+        super().__init__()
+        self._hilo_com: Optional[ThreadPoolExecutor] = None
+        self._outlook: Any = None
+
+    def _en_hilo_com(self, funcion: Callable, *args) -> Any:
+        """Ejecuta una función en el hilo COM de la sesión y espera el resultado."""
+        return self._hilo_com.submit(funcion, *args).result()
+
+    def _abrir(self) -> None:
+        self._hilo_com = ThreadPoolExecutor(max_workers=1, thread_name_prefix="outlook")
+        try:
+            self._en_hilo_com(self._iniciar_com)
+        except Exception:
+            self._hilo_com.shutdown()
+            self._hilo_com = None
+            raise
+
+    def _iniciar_com(self) -> None:
+        pythoncom.CoInitialize()
+        try:
+            self._outlook = win32com.client.Dispatch("Outlook.Application")
+        except Exception:
+            pythoncom.CoUninitialize()
+            raise
+
+    def _cerrar(self) -> None:
+        try:
+            self._en_hilo_com(self._finalizar_com)
+        finally:
+            self._hilo_com.shutdown()
+            self._hilo_com = None
+
+    def _finalizar_com(self) -> None:
+        self._outlook = None
+        try:
+            pythoncom.CoUninitialize()
+        except Exception:
+            pass
+
+    def _guardar(
+        self,
+        archivo: Path,
+        destinatarios: List[Contacto],
+        asunto: str,
+        contenido_html: str,
+        contenido_texto: str,
+    ) -> None:
+        self._en_hilo_com(
+            self._guardar_msg,
+            archivo,
+            destinatarios,
+            asunto,
+            contenido_html,
+            contenido_texto,
+        )
+
+    def _guardar_msg(
+        self,
+        archivo: Path,
+        destinatarios: List[Contacto],
+        asunto: str,
+        contenido_html: str,
+        contenido_texto: str,
+    ) -> None:
+        mail = self._outlook.CreateItem(0)  # 0 = olMailItem
+        # Outlook separa los destinatarios con ";" y acepta nombres entre comillas
+        mail.To = "; ".join(str(direccion) for direccion in direcciones(destinatarios))
+        mail.Subject = asunto
+        mail.HTMLBody = contenido_html
+        mail.Body = contenido_texto
+        mail.SaveAs(str(archivo), 3)  # 3 = olMSG
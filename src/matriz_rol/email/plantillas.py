@@ -0,0 +1,174 @@
+"""
+Plantillas precompiladas para el contenido de los correos.
+
+Las plantillas se analizan una sola vez al importar el módulo: el texto se
+divide en tramos fijos y campos ``${nombre}``, y renderizar solo intercala
+los valores. Los fragmentos que comparten todos los destinatarios de una
+solicitud (lista de grupos y filas de la tabla de autorizadores) se generan
+una vez por solicitud; para cada destinatario solo cambian las filas
+destacadas.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Campo de plantilla: ${nombre}
+_PATRON_CAMPO = re.compile(r"\$\{(\w+)\}")
+
+# Solicitudes distintas cuyos fragmentos se conservan
+TAMANO_CACHE_FRAGMENTOS = 8
+
+
+class Plantilla:
+    """Plantilla con campos ``${nombre}`` compilada a tramos fijos."""
+
+    def __init__(self, texto: str):
+        """
+        Compila la plantilla.
+
+        Args:
+            texto: Texto con campos ``${nombre}``
+        """
+        partes = _PATRON_CAMPO.split(texto)
+        # split alterna texto fijo (posiciones pares) y nombres de campo
+        self._tramos: Tuple[str, ...] = tuple(partes[0::2])
+        self.campos: Tuple[str, ...] = tuple(partes[1::2])
+
+    def renderizar(self, valores: Mapping[str, str]) -> str:
+        """
+        Genera el texto con los valores dados.
+
+        Args:
+            valores: Valor de cada campo (KeyError si falta alguno)
+
+        Returns:
+            Texto final
+        """
+        tramos = self._tramos
+        piezas: List[str] = [tramos[0]]
+        for indice, campo in enumerate(self.campos, 1):
+            piezas.append(valores[campo])
+            piezas.append(tramos[indice])
+        return "".join(piezas)
+
+
+class FilasAutorizadores:
+    """
+    Filas de una tabla de autorizadores, generadas una vez por solicitud.
+
+    Cada fila existe en versión normal y destacada; ``unir`` elige la
+    destacada para las filas del código del destinatario.
+    """
+
+    def __init__(
+        self,
+        codigos: Tuple[str, ...],
+        normales: Tuple[str, ...],
+        destacadas: Tuple[str, ...],
+    ):
+        """
+        Inicializa las filas.
+
+        Args:
+            codigos: Código de aplicación de cada fila
+            normales: Fila sin destacar
+            destacadas: Fila destacada
+        """
+        self._normales = normales
+        self._destacadas = destacadas
+        self._todas_normales = "".join(normales)
+
+        self._por_codigo: Dict[str, Tuple[int, ...]] = {}
+        for indice, codigo in enumerate(codigos):
+            self._por_codigo[codigo] = self._por_codigo.get(codigo, ()) + (indice,)
+
+    def unir(self, codigo_destacado: Optional[str] = None) -> str:
+        """
+        Une las filas destacando las del código indicado.
+
+        Args:
+            codigo_destacado: Código a destacar (None para ninguno)
+
+        Returns:
+            Filas concatenadas
+        """
+        indices = self._por_codigo.get(codigo_destacado)
+        if not indices:
+            return self._todas_normales
+
+        filas = list(self._normales)
+        for indice in indices:
+            filas[indice] = self._destacadas[indice]
+        return "".join(filas)
+
+
+def clave_autorizadores(
+    autorizadores: Iterable[Mapping[str, str]],
+) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Convierte los autorizadores en una clave apta para la caché.
+
+    Args:
+        autorizadores: Datos con codigo, autorizador y correo
+
+    Returns:
+        Tupla de (codigo, autorizador, correo)
+    """
+    return tuple(
+        (dato["codigo"], dato["autorizador"], dato["correo"]) for dato in autorizadores
+    )
+
+
+def compilar_filas(
+    fila: Plantilla, fila_destacada: Plantilla
+) -> Callable[[Tuple[Tuple[str, str, str], ...]], FilasAutorizadores]:
+    """
+    Crea una función con caché que genera las filas de una solicitud.
+
+    Args:
+        fila: Plantilla de fila normal (campos codigo, autorizador, correo)
+        fila_destacada: Plantilla de fila destacada (mismos campos)
+
+    Returns:
+        Función que recibe la clave de clave_autorizadores
+    """
+
+    @lru_cache(maxsize=TAMANO_CACHE_FRAGMENTOS)
+    def generar(clave: Tuple[Tuple[str, str, str], ...]) -> FilasAutorizadores:
+        normales = []
+        destacadas = []
+        for codigo, autorizador, correo in clave:
+            valores = {"codigo": codigo, "autorizador": autorizador, "correo": correo}
+            normales.append(fila.renderizar(valores))
+            destacadas.append(fila_destacada.renderizar(valores))
+        return FilasAutorizadores(
+            tuple(codigo for codigo, _, _ in clave),
+            tuple(normales),
+            tuple(destacadas),
+        )
+
+    return generar
+
+
+def compilar_lista(
+    elemento: Plantilla, separador: str = ""
+) -> Callable[[Tuple[str, ...]], str]:
+    """
+    Crea una función con caché que genera una lista de textos.
+
+    Args:
+        elemento: Plantilla de cada elemento (campo ``valor``)
+        separador: Texto entre elementos
+
+    Returns:
+        Función que recibe una tupla de textos
+    """
+
+    @lru_cache(maxsize=TAMANO_CACHE_FRAGMENTOS)
+    def generar(valores: Tuple[str, ...]) -> str:
+        return separador.join(
+            elemento.renderizar({"valor": valor}) for valor in valores
+        )
+
+    return generar
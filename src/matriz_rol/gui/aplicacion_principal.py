@@ -14,11 +14,17 @@ from .solicitud_matriz import SolicitudMatrizFrame
 from .autorizadores_editor import AutorizadoresEditorFrame
 from .gestion_solicitudes.gestion_solicitudes_frame import GestionSolicitudesFrame
 from ..data.gestor_solicitudes import GestorSolicitudes
+from ..data.carga_solicitudes import CargaSolicitudes
 
 
 class AplicacionMatrizRol(ctk.CTk):
     """Aplicación principal con sistema de pestañas."""
 
+    # Segundos durante los que se combinan cambios antes de escribir en disco
+    VENTANA_ESCRITURA_SEGUNDOS = 0.5
+    # Milisegundos entre consultas del progreso de la carga de solicitudes
+    INTERVALO_PROGRESO_CARGA_MS = 50
+
     def __init__(self):
         """Inicializa la aplicación principal."""
         super().__init__()
@@ -31,8 +37,13 @@ class AplicacionMatrizRol(ctk.CTk):
         ctk.set_appearance_mode("light")
         ctk.set_default_color_theme("blue")
 
-        # Inicializar gestor de solicitudes
-        self.gestor_solicitudes = GestorSolicitudes()
+        # Inicializar gestor de solicitudes con escritura diferida para que
+        # las ediciones no bloqueen la interfaz. La BD se carga en segundo
+        # plano una vez visible la ventana.
+        self.gestor_solicitudes = GestorSolicitudes(
+            ventana_escritura=self.VENTANA_ESCRITURA_SEGUNDOS, carga_diferida=True
+        )
+        self.carga_solicitudes = None
 
         # Variables compartidas
         self.grupos_red_actuales = []
@@ -43,8 +54,70 @@ class AplicacionMatrizRol(ctk.CTk):
 
         self.configurar_interfaz()
 
+        # Garantizar que los cambios pendientes se escriban al cerrar
+        self.protocol("WM_DELETE_WINDOW", self.on_cerrar_aplicacion)
+
+        self.after(0, self.iniciar_carga_solicitudes)
+
+    def iniciar_carga_solicitudes(self):
+        """Lanza la carga de la BD de solicitudes en un hilo de trabajo."""
+        self.carga_solicitudes = CargaSolicitudes(self.gestor_solicitudes)
+        self.carga_solicitudes.iniciar()
+        self._revisar_carga_solicitudes()
+
+    def _revisar_carga_solicitudes(self):
+        """Actualiza el indicador de progreso hasta que termina la carga."""
+        carga = self.carga_solicitudes
+        try:
+            terminada = carga.procesar_eventos()
+        except Exception as e:
+            print(f"❌ Error aplicando la carga de solicitudes: {e}")
+            terminada = True
+
+        if not terminada:
+            if carga.total:
+                self.barra_carga.set(carga.construidas / carga.total)
+                self.etiqueta_carga.configure(
+                    text=f"⏳ Cargando solicitudes... {carga.construidas}/{carga.total}"
+                )
+            self.after(
+                self.INTERVALO_PROGRESO_CARGA_MS, self._revisar_carga_solicitudes
+            )
+            return
+
+        self.barra_carga.set(1)
+        if carga.error:
+            self.etiqueta_carga.configure(text="❌ Error cargando solicitudes")
+        else:
+            total = self.gestor_solicitudes.contar_solicitudes()
+            self.etiqueta_carga.configure(text=f"✅ {total} solicitudes cargadas")
+        self.after(3000, self.frame_carga.pack_forget)
+
+    def on_cerrar_aplicacion(self):
+        """Escribe los cambios pendientes y cierra la aplicación."""
+        self.cerrar_gestor_solicitudes()
+        self.destroy()
+
+    def cerrar_gestor_solicitudes(self):
+        """Vuelca los cambios pendientes del gestor de solicitudes."""
+        try:
+            self.gestor_solicitudes.cerrar()
+        except Exception as e:
+            print(f"❌ Error guardando cambios pendientes al cerrar: {e}")
+
     def configurar_interfaz(self):
         """Configura la interfaz con pestañas."""
+        # Indicador de progreso de la carga de solicitudes
+        self.frame_carga = ctk.CTkFrame(self)
+        self.frame_carga.pack(side="bottom", fill="x", padx=10, pady=(0, 10))
+        self.etiqueta_carga = ctk.CTkLabel(
+            self.frame_carga, text="⏳ Cargando solicitudes..."
+        )
+        self.etiqueta_carga.pack(side="left", padx=10)
+        self.barra_carga = ctk.CTkProgressBar(self.frame_carga)
+        self.barra_carga.pack(side="left", fill="x", expand=True, padx=10)
+        self.barra_carga.set(0)
+
         # Crear notebook (pestañas)
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
@@ -96,30 +169,14 @@ class AplicacionMatrizRol(ctk.CTk):
         )
         self.gestion_solicitudes.pack(fill="both", expand=True)
 
-    def ir_a_autorizadores(self):
-        """Cambia a la pestaña de autorizadores y configura los datos."""
-        # Extraer códigos de aplicación de los grupos
-        codigos = self.extraer_codigos_aplicacion()
-
-        if not codigos:
-            messagebox.showerror(
-                "Error", "No se pudieron extraer códigos de aplicación"
-            )
-            return
-
-        # Configurar el editor de autorizadores
-        self.configurar_editor_autorizadores(codigos)
-
-        # No cambiar a pestaña de autorizadores (está oculta)
-        # self.notebook.select(1)
-
     def on_solicitud_confirmada(self, matrices_seleccionadas, grupos_red):
         """Maneja la confirmación de la solicitud desde el primer tab."""
         # Actualizar las variables compartidas
         self.grupos_red_actuales = grupos_red
 
-        # Extraer códigos de aplicación
-        codigos = self.extraer_codigos_aplicacion_de_grupos(grupos_red)
+        # Extraer códigos de aplicación con la misma regla que el formulario
+        conocidos, nuevos = self.solicitud_frame.extraer_codigos_aplicacion(grupos_red)
+        codigos = conocidos + nuevos
 
         if codigos:
             # Configurar el editor de autorizadores
@@ -131,35 +188,6 @@ class AplicacionMatrizRol(ctk.CTk):
                 "Error", "No se pudieron extraer códigos de aplicación de los grupos"
             )
 
-    def extraer_codigos_aplicacion_de_grupos(self, grupos_red):
-        """Extrae códigos de aplicación de una lista de grupos específica."""
-        codigos = set()
-
-        for grupo in grupos_red:
-            # Buscar patrones de aplicación: _XXXX_ (rodeado de guiones bajos)
-            import re
-
-            # Buscar códigos de 4 letras rodeados por guiones bajos
-            patron = r"_([A-Z]{4})_"
-            matches = re.findall(patron, grupo)
-            for match in matches:
-                codigos.add(match)
-
-        return sorted(list(codigos))
-
-    def extraer_codigos_aplicacion(self):
-        """Extrae códigos de aplicación únicos de los grupos de red."""
-        codigos = set()
-
-        for grupo in self.grupos_predefinidos:
-            # Dividir por guiones bajos y tomar elementos de 4 caracteres
-            partes = grupo.split("_")
-            for parte in partes:
-                if len(parte) == 4 and parte.isalpha():
-                    codigos.add(parte)
-
-        return sorted(list(codigos))
-
     def configurar_editor_autorizadores(self, codigos_aplicacion):
         """Configura el editor de autorizadores con los códigos extraídos - ADAPTADO."""
         print(
@@ -207,13 +235,10 @@ class AplicacionMatrizRol(ctk.CTk):
             solicitud = self.gestor_solicitudes.crear_solicitud(
                 grupos_actuales, datos_autorizadores
             )
+            # crear_solicitud ya persiste la solicitud y notifica a la
+            # pestaña de gestión, que la agrega a su lista
             print(f"✅ Solicitud creada: {solicitud.id_solicitud}")
 
-            # Forzar guardado y recarga
-            print("💾 Guardando solicitudes...")
-            self.gestor_solicitudes.guardar_solicitudes()
-            print("✅ Solicitudes guardadas")
-
             # Mostrar mensaje de éxito
             messagebox.showinfo(
                 "Solicitud Creada",
@@ -223,15 +248,6 @@ class AplicacionMatrizRol(ctk.CTk):
                 f"Puede hacer seguimiento en la pestaña 'Gestión de Solicitudes'",
             )
 
-            # Forzar actualización de la pestaña de gestión en el siguiente ciclo
-            if hasattr(self, "gestion_solicitudes"):
-                print("🔄 Programando actualización de gestión tras crear solicitud...")
-                # Usar after() para asegurar que la actualización se ejecute
-                # después de que todo el guardado esté completo
-                self.after(100, self._actualizar_gestion_tras_crear_solicitud)
-            else:
-                print("⚠️ Warning: gestion_solicitudes no está disponible")
-
         except Exception as e:
             print(f"❌ Error en callback: {e}")
             import traceback
@@ -239,18 +255,6 @@ class AplicacionMatrizRol(ctk.CTk):
             traceback.print_exc()
             messagebox.showerror("Error", f"Error creando solicitud: {e}")
 
-    def _actualizar_gestion_tras_crear_solicitud(self):
-        """Actualiza la gestión de solicitudes después de crear una nueva."""
-        try:
-            print("🔄 Ejecutando actualización diferida de gestión...")
-            # Forzar recarga completa
-            self.gestor_solicitudes.cargar_solicitudes()
-            # Actualizar la interfaz
-            self.gestion_solicitudes.actualizar_lista_solicitudes()
-            print("✅ Actualización de gestión completada")
-        except Exception as e:
-            print(f"❌ Error en actualización diferida: {e}")
-
     def on_cambio_pestana(self, event):
         """Maneja el cambio entre pestañas."""
         pestaña_seleccionada = self.notebook.index(self.notebook.select())
@@ -266,10 +270,9 @@ class AplicacionMatrizRol(ctk.CTk):
         """Actualiza la gestión cuando se cambia a la pestaña."""
         try:
             print("🔄 Ejecutando actualización por cambio de pestaña...")
-            # Forzar recarga del gestor desde archivo
-            self.gestor_solicitudes.cargar_solicitudes()
-            # Actualizar la interfaz
-            self.gestion_solicitudes.actualizar_lista_solicitudes()
+            # Los cambios propios ya llegaron por notificación; solo se
+            # recarga si otro proceso modificó la BD
+            self.gestion_solicitudes.sincronizar_con_disco()
             print("✅ Actualización por cambio de pestaña completada")
         except Exception as e:
             print(f"❌ Error en actualización por cambio de pestaña: {e}")
@@ -278,7 +281,11 @@ class AplicacionMatrizRol(ctk.CTk):
 def main():
     """Función principal para ejecutar la aplicación."""
     app = AplicacionMatrizRol()
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        # Cubre cierres que no pasan por WM_DELETE_WINDOW (p. ej. Ctrl+C)
+        app.cerrar_gestor_solicitudes()
 
 
 if __name__ == "__main__":
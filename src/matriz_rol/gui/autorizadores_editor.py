@@ -6,7 +6,7 @@ from typing import List, Dict, Optional
 from customtkinter import CTkFrame, CTkButton
 from ..data import GestorPersistencia
 from ..data.gestor_autorizadores import GestorAutorizadores
-from ..email.generador_correos_individuales import GeneradorCorreosIndividuales
+from ..email.generador_correos_individuales import generador_compartido
 import os
 
 
@@ -22,16 +22,20 @@ class AutorizadoresEditorFrame(CTkFrame):
         master,
         codigos_aplicacion: List[str],
         grupos_red: Optional[List[str]] = None,
+        codigos_nuevos: Optional[List[str]] = None,
     ):
         """Inicializa el editor de autorizadores.
 
         Args:
             master: Widget padre
-            codigos_aplicacion: Lista de códigos de aplicación extraídos
+            codigos_aplicacion: Códigos extraídos registrados en la BD central
             grupos_red: Lista de grupos de red seleccionados (opcional)
+            codigos_nuevos: Códigos extraídos sin registrar (opcional); no se
+                buscan en la BD central
         """
         super().__init__(master)
         self.codigos_aplicacion = codigos_aplicacion
+        self.codigos_nuevos = codigos_nuevos or []
         self.grupos_red = grupos_red or []
         self.datos_autorizadores = []
         self.gestor_persistencia = GestorPersistencia()
@@ -142,11 +146,16 @@ class AutorizadoresEditorFrame(CTkFrame):
     def cargar_datos_iniciales(self):
         """Carga los códigos de aplicación usando la BD central de autorizadores."""
         print(f"🔄 Cargando autorizadores para códigos: {self.codigos_aplicacion}")
-
-        for codigo in self.codigos_aplicacion:
-            # Buscar en la BD central de autorizadores
-            autorizador_bd = self.gestor_autorizadores.obtener_autorizador_por_codigo(
-                codigo
+        if self.codigos_nuevos:
+            print(f"🆕 Códigos sin registrar en BD central: {self.codigos_nuevos}")
+
+        nuevos = set(self.codigos_nuevos)
+        for codigo in self.codigos_aplicacion + self.codigos_nuevos:
+            # Buscar en la BD central de autorizadores (los nuevos no están)
+            autorizador_bd = (
+                None
+                if codigo in nuevos
+                else self.gestor_autorizadores.obtener_autorizador_por_codigo(codigo)
             )
 
             if autorizador_bd:
@@ -156,13 +165,16 @@ class AutorizadoresEditorFrame(CTkFrame):
                 print(f"✅ Autorizador encontrado en BD: {codigo} -> {autorizador}")
             else:
                 # Fallback a datos guardados localmente
-                datos_guardados = self.gestor_persistencia.cargar_autorizadores()
-                datos_previos = datos_guardados.get(codigo, {})
+                datos_previos = (
+                    self.gestor_persistencia.obtener_autorizador_por_codigo(codigo)
+                    or {}
+                )
                 autorizador = datos_previos.get("autorizador", "")
                 correo = datos_previos.get("correo", "")
-                print(
-                    f"⚠️ Autorizador no encontrado en BD central, usando datos locales: {codigo}"
-                )
+                if codigo not in nuevos:
+                    print(
+                        f"⚠️ Autorizador no encontrado en BD central, usando datos locales: {codigo}"
+                    )
 
             # Determinar el tag inicial basado en si tiene datos completos
             tag_inicial = (
@@ -337,8 +349,12 @@ class AutorizadoresEditorFrame(CTkFrame):
             "Confirmar", f"{resumen}¿Desea continuar con estos datos?"
         ):
             try:
-                # Guardar datos en persistencia
-                self.gestor_persistencia.guardar_autorizadores(self.datos_autorizadores)
+                # Guardar datos en persistencia (una sola escritura; los
+                # códigos de otras solicitudes conservan sus datos)
+                self.gestor_persistencia.actualizar_autorizadores(
+                    (dato["codigo"], dato["autorizador"], dato["correo"])
+                    for dato in self.datos_autorizadores
+                )
 
                 # Llamar al callback si existe (para crear solicitud)
                 print(
@@ -353,18 +369,28 @@ class AutorizadoresEditorFrame(CTkFrame):
                     print("❌ DEBUG: callback_guardado no está definido!")
 
                 # Generar archivos de correo individuales
-                generador = GeneradorCorreosIndividuales()
-                archivos_correos = generador.generar_correos_individuales(
+                generador = generador_compartido()
+                resultados = generador.generar_correos_con_resultados(
                     self.datos_autorizadores, self.grupos_red
                 )
+                exitosos = [r for r in resultados if r.exitoso]
+                fallidos = [r for r in resultados if not r.exitoso]
 
                 # Mostrar mensaje de éxito con la cantidad de archivos generados
                 mensaje_exito = (
                     "✅ Datos guardados correctamente.\n\n"
-                    f"📧 {len(archivos_correos)} correos individuales generados\n"
+                    f"📧 {len(exitosos)} correos individuales generados\n"
                     f"📁 Ubicación: {generador.directorio_salida}\n\n"
                     "🔔 Los archivos están listos para revisar y enviar desde Outlook."
                 )
+                if fallidos:
+                    mensaje_exito += (
+                        f"\n\n⚠️ {len(fallidos)} correos no se generaron:\n"
+                        + "\n".join(
+                            f"  • {r.codigo} - {r.autorizador}: {r.error}"
+                            for r in fallidos
+                        )
+                    )
                 messagebox.showinfo("Éxito", mensaje_exito)
 
                 # Abrir la carpeta donde se guardaron los correos
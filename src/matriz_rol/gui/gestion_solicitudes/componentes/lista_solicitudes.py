@@ -6,13 +6,33 @@ Proporciona el TreeView principal y la lógica de visualización de solicitudes.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Callable, Optional
+from typing import Dict, List, Callable, Optional
 from customtkinter import CTkFrame, CTkLabel
-from ....data.gestor_solicitudes import SolicitudConformidad, EstadoSolicitud
+from ....data.gestor_solicitudes import (
+    CursorSolicitudes,
+    EstadoSolicitud,
+    SolicitudConformidad,
+    clave_orden,
+)
 
 
 class ListaSolicitudes(CTkFrame):
-    """TreeView principal para mostrar la lista de solicitudes."""
+    """
+    TreeView principal para mostrar la lista de solicitudes.
+
+    Tiene dos modos:
+    - Completo (actualizar_solicitudes): todas las filas están en el TreeView.
+    - Virtual (mostrar_cursor): solo se materializan las filas visibles más
+      un margen de precarga, leídas de un CursorSolicitudes; la barra de
+      desplazamiento representa el total de solicitudes del cursor.
+    """
+
+    # Filas que se materializan por encima y por debajo de las visibles
+    MARGEN_PRECARGA = 50
+    # Filas que avanza cada paso de la rueda del ratón en modo virtual
+    FILAS_POR_PASO_RUEDA = 3
+    # Filas insertadas por ciclo de eventos al poblar una lista vacía
+    FILAS_POR_LOTE = 200
 
     def __init__(
         self,
@@ -36,6 +56,17 @@ class ListaSolicitudes(CTkFrame):
         self.editando = False
         self.combobox_editor = None
         self.solicitudes_actuales: List[SolicitudConformidad] = []
+        self._solicitudes_por_id: Dict[str, SolicitudConformidad] = {}
+        # Última fila dibujada de cada solicitud: {iid: (valores, tags)}
+        self._filas: Dict[str, tuple] = {}
+
+        # Modo virtual: cursor, primera fila visible y tramo materializado
+        self._cursor: Optional[CursorSolicitudes] = None
+        self._inicio_virtual = 0
+        self._tramo_virtual = (0, 0)
+
+        # Cada sincronización invalida un poblado por lotes en curso
+        self._generacion = 0
 
         self._configurar_interfaz()
 
@@ -73,7 +104,12 @@ class ListaSolicitudes(CTkFrame):
         )
 
         self.tree_solicitudes = ttk.Treeview(
-            self.tree_frame, columns=columnas, show="headings", height=10
+            self.tree_frame,
+            columns=columnas,
+            show="headings",
+            height=10,
+            # Ctrl/Shift + clic seleccionan varias filas para acciones en lote
+            selectmode="extended",
         )
 
         # Configurar encabezados
@@ -82,6 +118,9 @@ class ListaSolicitudes(CTkFrame):
         # Configurar anchos de columna
         self._configurar_columnas()
 
+        # Configurar colores por estado
+        self._configurar_colores_estado()
+
     def _configurar_encabezados(self) -> None:
         """Configura los encabezados del TreeView."""
         encabezados = {
@@ -115,7 +154,7 @@ class ListaSolicitudes(CTkFrame):
     def _configurar_scrollbars(self) -> None:
         """Configura las barras de desplazamiento."""
         # Scrollbar vertical
-        scrollbar_y = ttk.Scrollbar(
+        self.scrollbar_y = scrollbar_y = ttk.Scrollbar(
             self.tree_frame, orient="vertical", command=self.tree_solicitudes.yview
         )
 
@@ -138,6 +177,12 @@ class ListaSolicitudes(CTkFrame):
         self.tree_solicitudes.bind("<<TreeviewSelect>>", self._on_seleccion)
         self.tree_solicitudes.bind("<Double-1>", self._on_doble_clic)
 
+        # En modo virtual la rueda mueve la ventana sobre el cursor
+        self.tree_solicitudes.bind("<MouseWheel>", self._on_rueda_virtual)
+        self.tree_solicitudes.bind("<Button-4>", self._on_rueda_virtual)
+        self.tree_solicitudes.bind("<Button-5>", self._on_rueda_virtual)
+        self.tree_solicitudes.bind("<Configure>", self._on_redimension, add="+")
+
     def _on_seleccion(self, event: tk.Event) -> None:
         """Maneja la selección de una solicitud."""
         seleccion = self.tree_solicitudes.selection()
@@ -167,38 +212,333 @@ class ListaSolicitudes(CTkFrame):
         Returns:
             Solicitud encontrada o None
         """
-        for solicitud in self.solicitudes_actuales:
-            if solicitud.id_solicitud == id_solicitud:
-                return solicitud
-        return None
+        return self._solicitudes_por_id.get(id_solicitud)
 
     def actualizar_solicitudes(self, solicitudes: List[SolicitudConformidad]) -> None:
         """
         Actualiza la lista de solicitudes mostrada.
 
+        Compara con lo que ya muestra el TreeView (cuyo iid es el
+        id_solicitud) y solo elimina, inserta, mueve o reescribe las filas que
+        cambiaron, conservando selección y posición de desplazamiento.
+
         Args:
             solicitudes: Lista de solicitudes a mostrar
         """
+        self._desactivar_modo_virtual()
+
         # Guardar referencia a las solicitudes
-        self.solicitudes_actuales = solicitudes
+        self.solicitudes_actuales = list(solicitudes)
+        self._solicitudes_por_id = {s.id_solicitud: s for s in solicitudes}
+
+        # Mismo orden que el cursor del modo virtual: (fecha, ID) descendente
+        solicitudes_ordenadas = sorted(solicitudes, key=clave_orden, reverse=True)
+        if not self._filas and len(solicitudes_ordenadas) > self.FILAS_POR_LOTE:
+            # Lista vacía (p. ej. carga inicial): las filas se insertan por
+            # lotes para que la ventana siga respondiendo
+            self._generacion += 1
+            self._poblar_por_lotes(solicitudes_ordenadas, 0, self._generacion)
+            return
+
+        desplazamiento = self.tree_solicitudes.yview()[0]
+
+        if self._sincronizar_filas(solicitudes_ordenadas):
+            self.tree_solicitudes.yview_moveto(desplazamiento)
+
+    def _poblar_por_lotes(
+        self,
+        solicitudes_ordenadas: List[SolicitudConformidad],
+        desde: int,
+        generacion: int,
+    ) -> None:
+        """
+        Inserta un lote de filas al final y programa el siguiente con after().
 
-        # Limpiar lista actual
-        for item in self.tree_solicitudes.get_children():
-            self.tree_solicitudes.delete(item)
+        Args:
+            solicitudes_ordenadas: Todas las solicitudes a mostrar, en orden
+            desde: Índice de la primera solicitud del lote
+            generacion: Generación que inició el poblado; si cambió, se abandona
+        """
+        if generacion != self._generacion:
+            return
+
+        hasta = min(desde + self.FILAS_POR_LOTE, len(solicitudes_ordenadas))
+        for solicitud in solicitudes_ordenadas[desde:hasta]:
+            iid = solicitud.id_solicitud
+            # Puede haberse agregado ya por una notificación de cambio
+            if iid in self._filas or iid not in self._solicitudes_por_id:
+                continue
+            fila = self._obtener_fila(solicitud)
+            self.tree_solicitudes.insert(
+                "", "end", iid=iid, values=fila[0], tags=fila[1]
+            )
+            self._filas[iid] = fila
+
+        if hasta < len(solicitudes_ordenadas):
+            self.after(
+                1, self._poblar_por_lotes, solicitudes_ordenadas, hasta, generacion
+            )
+        else:
+            print(f"🧮 Lista poblada: {len(self._filas)} filas")
+
+    def _sincronizar_filas(
+        self, solicitudes_ordenadas: List[SolicitudConformidad]
+    ) -> bool:
+        """
+        Deja el TreeView con exactamente estas filas y en este orden.
+
+        Requiere que _solicitudes_por_id contenga las mismas solicitudes.
+
+        Args:
+            solicitudes_ordenadas: Solicitudes en el orden a mostrar
 
-        # Agregar solicitudes ordenadas por fecha
-        solicitudes_ordenadas = sorted(
-            solicitudes, key=lambda x: x.fecha_creacion, reverse=True
+        Returns:
+            True si se insertaron o eliminaron filas
+        """
+        tree = self.tree_solicitudes
+        self._generacion += 1
+
+        # 1. Eliminar filas que ya no se muestran
+        sobrantes = [
+            iid for iid in tree.get_children() if iid not in self._solicitudes_por_id
+        ]
+        if sobrantes:
+            tree.delete(*sobrantes)
+            for iid in sobrantes:
+                self._filas.pop(iid, None)
+
+        # 2. Recorrer el orden deseado; las primeras ``posicion`` filas del
+        # TreeView ya son definitivas, por lo que solo se mueven las que no
+        # coinciden con la siguiente fila existente
+        actuales = tree.get_children()
+        movidas = set()
+        siguiente = 0
+        insertadas = actualizadas = 0
+
+        for posicion, solicitud in enumerate(solicitudes_ordenadas):
+            iid = solicitud.id_solicitud
+            fila = self._obtener_fila(solicitud)
+
+            if iid not in self._filas:
+                tree.insert("", posicion, iid=iid, values=fila[0], tags=fila[1])
+                self._filas[iid] = fila
+                insertadas += 1
+                continue
+
+            while siguiente < len(actuales) and actuales[siguiente] in movidas:
+                siguiente += 1
+            if siguiente < len(actuales) and actuales[siguiente] == iid:
+                siguiente += 1
+            else:
+                tree.move(iid, "", posicion)
+                movidas.add(iid)
+
+            if self._filas[iid] != fila:
+                tree.item(iid, values=fila[0], tags=fila[1])
+                self._filas[iid] = fila
+                actualizadas += 1
+
+        print(
+            f"🧮 Lista: {insertadas} insertadas, {actualizadas} actualizadas, "
+            f"{len(sobrantes)} eliminadas, {len(movidas)} movidas"
         )
+        return bool(insertadas or sobrantes)
 
-        for solicitud in solicitudes_ordenadas:
-            self._agregar_solicitud_a_tree(solicitud)
+    def mostrar_cursor(self, cursor: CursorSolicitudes) -> None:
+        """
+        Muestra las solicitudes de un cursor en modo virtual.
 
-        # Configurar colores por estado
-        self._configurar_colores_estado()
+        Solo se crean las filas visibles más MARGEN_PRECARGA por cada lado;
+        al desplazarse se reutilizan las filas del tramo ya materializado.
+
+        Args:
+            cursor: Cursor sobre las solicitudes ordenadas
+        """
+        if self._cursor is None:
+            self.scrollbar_y.configure(command=self._on_scroll_virtual)
+            self.tree_solicitudes.configure(yscrollcommand=lambda *args: None)
+            self._inicio_virtual = 0
+        elif cursor.estado != self._cursor.estado:
+            self._inicio_virtual = 0
+
+        self._cursor = cursor
+        self._materializar_tramo(forzar=True)
+
+    @property
+    def modo_virtual(self) -> bool:
+        """Indica si la lista está en modo virtual."""
+        return self._cursor is not None
+
+    def _desactivar_modo_virtual(self) -> None:
+        """Vuelve al modo completo, con el scroll nativo del TreeView."""
+        if self._cursor is None:
+            return
+        self._cursor = None
+        self._tramo_virtual = (0, 0)
+        self.scrollbar_y.configure(command=self.tree_solicitudes.yview)
+        self.tree_solicitudes.configure(yscrollcommand=self.scrollbar_y.set)
+
+    def _filas_visibles(self) -> int:
+        """Cantidad de filas que caben en el TreeView."""
+        altura = self.tree_solicitudes.winfo_height()
+        if altura <= 1:
+            return int(self.tree_solicitudes.cget("height"))
+
+        alto_fila = ttk.Style().lookup("Treeview", "rowheight")
+        alto_fila = int(alto_fila) if alto_fila else 20
+        # Se descuenta la fila de encabezados
+        return max(1, altura // alto_fila - 1)
+
+    def _materializar_tramo(self, forzar: bool = False) -> None:
+        """
+        Asegura que la ventana visible esté materializada y posicionada.
+
+        Args:
+            forzar: Si es True, vuelve a leer el tramo del cursor aunque la
+                ventana visible ya esté dentro del tramo actual
+        """
+        total = len(self._cursor)
+        visibles = self._filas_visibles()
+        self._inicio_virtual = max(0, min(self._inicio_virtual, total - visibles))
+
+        inicio_tramo, fin_tramo = self._tramo_virtual
+        dentro = (
+            inicio_tramo <= self._inicio_virtual
+            and min(total, self._inicio_virtual + visibles) <= fin_tramo
+        )
+
+        if forzar or not dentro:
+            seleccion = self.tree_solicitudes.selection()
+
+            inicio_tramo = max(0, self._inicio_virtual - self.MARGEN_PRECARGA)
+            fin_tramo = min(
+                total, self._inicio_virtual + visibles + self.MARGEN_PRECARGA
+            )
+            solicitudes = self._cursor.obtener(inicio_tramo, fin_tramo - inicio_tramo)
+
+            self.solicitudes_actuales = solicitudes
+            self._solicitudes_por_id = {s.id_solicitud: s for s in solicitudes}
+            self._sincronizar_filas(solicitudes)
+            self._tramo_virtual = (inicio_tramo, inicio_tramo + len(solicitudes))
+
+            # Recuperar la selección si la fila sigue materializada
+            conservadas = [iid for iid in seleccion if iid in self._filas]
+            if conservadas and tuple(conservadas) != self.tree_solicitudes.selection():
+                self.tree_solicitudes.selection_set(conservadas)
+
+        inicio_tramo, fin_tramo = self._tramo_virtual
+        if fin_tramo > inicio_tramo:
+            self.tree_solicitudes.yview_moveto(
+                (self._inicio_virtual - inicio_tramo) / (fin_tramo - inicio_tramo)
+            )
+
+        if total:
+            self.scrollbar_y.set(
+                self._inicio_virtual / total,
+                min(1.0, (self._inicio_virtual + visibles) / total),
+            )
+        else:
+            self.scrollbar_y.set(0.0, 1.0)
+
+    def _on_scroll_virtual(self, *args) -> None:
+        """Traduce los comandos de la barra de desplazamiento en modo virtual."""
+        if self._cursor is None:
+            return
+
+        if args[0] == "moveto":
+            self._inicio_virtual = int(float(args[1]) * len(self._cursor))
+        elif args[0] == "scroll":
+            pasos = int(args[1])
+            if args[2] == "pages":
+                pasos *= self._filas_visibles()
+            self._inicio_virtual += pasos
+
+        self._materializar_tramo()
+
+    def _on_rueda_virtual(self, event: tk.Event) -> Optional[str]:
+        """Desplaza la ventana virtual con la rueda del ratón."""
+        if self._cursor is None:
+            # Modo completo: se deja actuar al scroll nativo
+            return None
+
+        if event.num == 4:
+            direccion = -1
+        elif event.num == 5:
+            direccion = 1
+        else:
+            direccion = -1 if event.delta > 0 else 1
+
+        self._inicio_virtual += direccion * self.FILAS_POR_PASO_RUEDA
+        self._materializar_tramo()
+        return "break"
+
+    def _on_redimension(self, event: tk.Event) -> None:
+        """Ajusta el tramo materializado a la nueva altura."""
+        if self._cursor is not None:
+            self._materializar_tramo()
+
+    def aplicar_cambio(self, solicitud: SolicitudConformidad, visible: bool) -> None:
+        """
+        Refleja en la lista una solicitud creada o modificada, sin reconstruirla.
+
+        Args:
+            solicitud: Solicitud que cambió
+            visible: Si la solicitud cumple los filtros actuales
+        """
+        if self._cursor is not None:
+            # El cursor ya refleja el cambio: basta con releer el tramo
+            self._materializar_tramo(forzar=True)
+            return
+
+        iid = solicitud.id_solicitud
+        mostrada = iid in self._filas
+
+        if not visible:
+            if mostrada:
+                self.tree_solicitudes.delete(iid)
+                del self._filas[iid]
+                del self._solicitudes_por_id[iid]
+                self.solicitudes_actuales.remove(solicitud)
+            return
+
+        fila = self._obtener_fila(solicitud)
+        if mostrada:
+            if self._filas[iid] != fila:
+                self.tree_solicitudes.item(iid, values=fila[0], tags=fila[1])
+                self._filas[iid] = fila
+            return
+
+        self.solicitudes_actuales.append(solicitud)
+        self._solicitudes_por_id[iid] = solicitud
+        self.tree_solicitudes.insert(
+            "",
+            self._posicion_por_fecha(solicitud),
+            iid=iid,
+            values=fila[0],
+            tags=fila[1],
+        )
+        self._filas[iid] = fila
+
+    def _posicion_por_fecha(self, solicitud: SolicitudConformidad) -> int:
+        """Posición que mantiene el orden descendente por (fecha, ID)."""
+        # Las solicitudes nuevas suelen ser las más recientes: se busca
+        # desde el principio. Con la misma clave que el ordenamiento completo,
+        # las solicitudes de un lote (misma fecha) quedan en su lugar final
+        clave = clave_orden(solicitud)
+        hijos = self.tree_solicitudes.get_children()
+        for posicion, iid in enumerate(hijos):
+            existente = self._solicitudes_por_id.get(iid)
+            if existente and clave_orden(existente) < clave:
+                return posicion
+        return len(hijos)
+
+    def _obtener_fila(self, solicitud: SolicitudConformidad) -> tuple:
+        """
+        Calcula los valores y tags de la fila de una solicitud.
 
-    def _agregar_solicitud_a_tree(self, solicitud: SolicitudConformidad) -> None:
-        """Agrega una solicitud al TreeView."""
+        Returns:
+            Tupla (valores, tags), comparable con la fila ya dibujada
+        """
         fecha_corta = (
             solicitud.fecha_creacion.split("T")[0]
             if "T" in solicitud.fecha_creacion
@@ -214,22 +554,18 @@ class ListaSolicitudes(CTkFrame):
         )
 
         # Determinar tags para colores
-        tags = [self._obtener_tag_estado(solicitud.estado)]
-
-        self.tree_solicitudes.insert(
-            "",
-            "end",
-            values=(
-                solicitud.id_solicitud,
-                fecha_corta,
-                solicitud.estado.value.title(),
-                grupos_texto,
-                len(solicitud.autorizadores),
-                solicitud.ticket_helpdesk or "",
-                observaciones_cortas,
-            ),
-            tags=tags,
+        tags = (self._obtener_tag_estado(solicitud.estado),)
+
+        valores = (
+            solicitud.id_solicitud,
+            fecha_corta,
+            solicitud.estado.value.title(),
+            grupos_texto,
+            len(solicitud.autorizadores),
+            solicitud.ticket_helpdesk or "",
+            observaciones_cortas,
         )
+        return valores, tags
 
     def _obtener_tag_estado(self, estado: EstadoSolicitud) -> str:
         """Obtiene el tag de color para un estado."""
@@ -263,6 +599,22 @@ class ListaSolicitudes(CTkFrame):
                 return self._buscar_solicitud_por_id(valores[0])
         return None
 
+    def obtener_solicitudes_seleccionadas(self) -> List[SolicitudConformidad]:
+        """
+        Obtiene todas las solicitudes seleccionadas, en el orden de la grilla.
+
+        Returns:
+            Solicitudes seleccionadas (vacía si no hay selección)
+        """
+        # El iid de cada fila es el ID de su solicitud
+        return [
+            solicitud
+            for solicitud in map(
+                self._buscar_solicitud_por_id, self.tree_solicitudes.selection()
+            )
+            if solicitud is not None
+        ]
+
     def limpiar_seleccion(self) -> None:
         """Limpia la selección actual."""
         self.tree_solicitudes.selection_remove(self.tree_solicitudes.selection())
@@ -42,25 +42,41 @@ class PanelEstadisticas(CTkFrame):
         try:
             stats = self.gestor.obtener_estadisticas()
 
-            # Limpiar labels anteriores
-            for widget in self.frame_contadores.winfo_children():
-                widget.destroy()
-
-            # Crear nuevos labels con las estadísticas actualizadas
             info_stats = [
-                (f"📊 Total: {stats['total']}", "#2196F3"),
-                (f"🔄 En solicitud: {stats['en_solicitud']}", "#4CAF50"),
-                (f"🎫 En Helpdesk: {stats['en_helpdesk']}", "#FF9800"),
-                (f"✅ Atendido: {stats['atendido']}", "#9C27B0"),
-                (f"🏁 Cerrado: {stats['cerrado']}", "#9E9E9E"),
+                ("total", f"📊 Total: {stats['total']}", "#2196F3"),
+                (
+                    "en_solicitud",
+                    f"🔄 En solicitud: {stats['en_solicitud']}",
+                    "#4CAF50",
+                ),
+                ("en_helpdesk", f"🎫 En Helpdesk: {stats['en_helpdesk']}", "#FF9800"),
+                ("atendido", f"✅ Atendido: {stats['atendido']}", "#9C27B0"),
+                ("cerrado", f"🏁 Cerrado: {stats['cerrado']}", "#9E9E9E"),
             ]
 
-            for i, (texto, color) in enumerate(info_stats):
-                label = CTkLabel(self.frame_contadores, text=texto, text_color=color)
-                label.pack(side="left", padx=10, pady=2)
+            # Tras un error se recrean los labels desde cero
+            if len(self.labels_stats) != len(info_stats):
+                for widget in self.frame_contadores.winfo_children():
+                    widget.destroy()
+                self.labels_stats = {}
+
+            for clave, texto, color in info_stats:
+                label = self.labels_stats.get(clave)
+                if label is None:
+                    # Los labels se crean una sola vez y luego solo cambia el texto
+                    label = CTkLabel(
+                        self.frame_contadores, text=texto, text_color=color
+                    )
+                    label.pack(side="left", padx=10, pady=2)
+                    self.labels_stats[clave] = label
+                else:
+                    label.configure(text=texto)
 
         except Exception as e:
             print(f"❌ Error actualizando estadísticas: {e}")
+            for widget in self.frame_contadores.winfo_children():
+                widget.destroy()
+            self.labels_stats = {}
             # Mostrar mensaje de error en caso de fallo
             error_label = CTkLabel(
                 self.frame_contadores,
@@ -149,14 +149,8 @@ class EditorEstado:
                 nuevo_estado,
                 observaciones=f"Estado cambiado a {nuevo_estado.value} via edición inline",
             ):
-                # Actualizar el item en el tree
-                valores = list(self.tree_actual.item(self.item_actual, "values"))
-                valores[2] = nuevo_estado.value.title()  # Columna Estado
-                self.tree_actual.item(self.item_actual, values=valores)
-
-                # Actualizar color según nuevo estado
-                self._actualizar_color_item(nuevo_estado)
-
+                # La fila (valores y color) se actualiza con la notificación
+                # de cambio del gestor
                 messagebox.showinfo(
                     "Éxito", f"✅ Estado actualizado a: {nuevo_estado.value}"
                 )
@@ -176,27 +170,6 @@ class EditorEstado:
         """Cancela la edición actual."""
         self.finalizar_edicion()
 
-    def _actualizar_color_item(self, nuevo_estado: EstadoSolicitud) -> None:
-        """
-        Actualiza el color del item según el nuevo estado.
-
-        Args:
-            nuevo_estado: Nuevo estado de la solicitud
-        """
-        if not self.tree_actual or not self.item_actual:
-            return
-
-        # Mapeo de estados a tags
-        mapeo_tags = {
-            EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES: "en_solicitud",
-            EstadoSolicitud.EN_HELPDESK: "en_helpdesk",
-            EstadoSolicitud.ATENDIDO: "atendido",
-            EstadoSolicitud.CERRADO: "cerrado",
-        }
-
-        tag = mapeo_tags.get(nuevo_estado, "default")
-        self.tree_actual.item(self.item_actual, tags=[tag])
-
     def finalizar_edicion(self) -> None:
         """Finaliza la edición y limpia recursos."""
         if self.combobox_editor:
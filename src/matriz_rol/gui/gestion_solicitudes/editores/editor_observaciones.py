@@ -140,17 +140,7 @@ class EditorObservaciones:
                 self.solicitud_actual.estado,  # Mantener mismo estado
                 observaciones=nuevas_observaciones,
             ):
-                # Actualizar el item en el tree (version truncada)
-                observaciones_cortas = (
-                    nuevas_observaciones[:50] + "..."
-                    if len(nuevas_observaciones) > 50
-                    else nuevas_observaciones
-                )
-
-                valores = list(self.tree_actual.item(self.item_actual, "values"))
-                valores[6] = observaciones_cortas  # Columna Observaciones
-                self.tree_actual.item(self.item_actual, values=valores)
-
+                # La fila se actualiza con la notificación de cambio del gestor
                 messagebox.showinfo("Éxito", "✅ Observaciones actualizadas")
 
                 # Callback para actualizar otras partes de la UI
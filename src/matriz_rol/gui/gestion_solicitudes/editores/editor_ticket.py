@@ -122,11 +122,7 @@ class EditorTicket:
                     else "Ticket removido"
                 ),
             ):
-                # Actualizar el item en el tree
-                valores = list(self.tree_actual.item(self.item_actual, "values"))
-                valores[5] = nuevo_ticket  # Columna Ticket
-                self.tree_actual.item(self.item_actual, values=valores)
-
+                # La fila se actualiza con la notificación de cambio del gestor
                 mensaje = (
                     f"✅ Ticket actualizado: {nuevo_ticket}"
                     if nuevo_ticket
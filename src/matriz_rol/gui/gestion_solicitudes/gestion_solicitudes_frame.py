@@ -6,17 +6,27 @@ la interfaz principal para la gestión de solicitudes.
 """
 
 from typing import Optional
-from customtkinter import CTkFrame, CTkLabel, CTkButton
-from ...data.gestor_solicitudes import GestorSolicitudes, SolicitudConformidad
+from customtkinter import CTkFrame, CTkLabel, CTkButton, CTkOptionMenu
+from ...data.gestor_solicitudes import (
+    EVENTO_LOTE,
+    EVENTO_RECARGADA,
+    EstadoSolicitud,
+    GestorSolicitudes,
+    SolicitudConformidad,
+)
 from .componentes.panel_estadisticas import PanelEstadisticas
 from .componentes.panel_filtros import PanelFiltros
 from .componentes.lista_solicitudes import ListaSolicitudes
+from .manejadores.acciones_solicitud import AccionesSolicitud
 from .manejadores.eventos_grilla import EventosGrilla
 
 
 class GestionSolicitudesFrame(CTkFrame):
     """Frame principal refactorizado para gestionar solicitudes de conformidad."""
 
+    # A partir de esta cantidad de solicitudes la lista usa el modo virtual
+    UMBRAL_MODO_VIRTUAL = 2000
+
     def __init__(self, master, gestor_solicitudes: GestorSolicitudes):
         """
         Inicializa el frame de gestión de solicitudes.
@@ -38,11 +48,16 @@ class GestionSolicitudesFrame(CTkFrame):
 
         # Manejadores de lógica de negocio
         self.eventos_grilla: Optional[EventosGrilla] = None
+        self.acciones: Optional[AccionesSolicitud] = None
 
         self._configurar_interfaz()
         self._inicializar_manejadores()
         self.actualizar_lista_solicitudes()
 
+        # Los cambios del gestor se aplican como deltas sobre la lista
+        self.gestor.suscribir(self._on_cambio_gestor)
+        self.bind("<Destroy>", self._on_destroy, add="+")
+
     def _configurar_interfaz(self) -> None:
         """Configura la interfaz completa del frame."""
         # Título principal
@@ -132,12 +147,76 @@ class GestionSolicitudesFrame(CTkFrame):
         )
         btn_actualizar.pack(side="left", padx=10)
 
+        # Acción en lote sobre las filas seleccionadas
+        btn_lote = CTkButton(
+            botones_frame,
+            text="⚡ Aplicar a Seleccionadas",
+            command=self._aplicar_estado_lote,
+            font=("Arial", 12),
+            height=40,
+            width=200,
+        )
+        btn_lote.pack(side="right", padx=10)
+
+        self.menu_estado_lote = CTkOptionMenu(
+            botones_frame,
+            values=[estado.value for estado in EstadoSolicitud],
+            width=220,
+        )
+        self.menu_estado_lote.set(EstadoSolicitud.EN_HELPDESK.value)
+        self.menu_estado_lote.pack(side="right", padx=5)
+
+        CTkLabel(botones_frame, text="Cambiar selección a:").pack(side="right")
+
     def _inicializar_manejadores(self) -> None:
         """Inicializa los manejadores de lógica de negocio."""
+        # Las ediciones llegan a la lista por notificación del gestor; tras
+        # ellas solo se comprueba si otro proceso modificó la BD
         self.eventos_grilla = EventosGrilla(
-            self.gestor, callback_actualizar=self.actualizar_lista_solicitudes
+            self.gestor, callback_actualizar=self.sincronizar_con_disco
+        )
+        self.acciones = AccionesSolicitud(
+            self.gestor, callback_actualizar=self.sincronizar_con_disco
         )
 
+    def _on_destroy(self, event) -> None:
+        """Deja de recibir notificaciones al destruir el frame."""
+        if event.widget is self:
+            self.gestor.desuscribir(self._on_cambio_gestor)
+
+    def _on_cambio_gestor(
+        self, evento: str, solicitud: Optional[SolicitudConformidad]
+    ) -> None:
+        """
+        Aplica un cambio notificado por el gestor.
+
+        Args:
+            evento: Tipo de cambio notificado
+            solicitud: Solicitud afectada (None si se recargó todo)
+        """
+        if evento in (EVENTO_RECARGADA, EVENTO_LOTE) or solicitud is None:
+            self.actualizar_lista_solicitudes()
+            return
+
+        if self.lista_solicitudes:
+            if self.lista_solicitudes.modo_virtual == self._requiere_modo_virtual():
+                self.lista_solicitudes.aplicar_cambio(
+                    solicitud, self._cumple_filtros(solicitud)
+                )
+            else:
+                # Se cruzó el umbral: cambiar de modo
+                self.actualizar_lista_solicitudes()
+        if self.panel_estadisticas:
+            self.panel_estadisticas.actualizar_estadisticas()
+
+    def sincronizar_con_disco(self) -> None:
+        """Recarga solo si la BD cambió en disco; si no, no hace nada."""
+        try:
+            # La recarga notifica EVENTO_RECARGADA, que actualiza la lista
+            self.gestor.recargar_si_cambio_en_disco()
+        except Exception as e:
+            print(f"❌ Error comprobando cambios en la BD local: {e}")
+
     def _on_solicitud_seleccionada(
         self, solicitud: Optional[SolicitudConformidad]
     ) -> None:
@@ -161,28 +240,43 @@ class GestionSolicitudesFrame(CTkFrame):
                 event, self.lista_solicitudes.tree_solicitudes
             )
 
+    def _aplicar_estado_lote(self) -> None:
+        """Cambia al estado elegido todas las solicitudes seleccionadas."""
+        if not self.acciones or not self.lista_solicitudes:
+            return
+
+        self.acciones.aplicar_transicion_lote(
+            self.lista_solicitudes.obtener_solicitudes_seleccionadas(),
+            EstadoSolicitud(self.menu_estado_lote.get()),
+        )
+
     def actualizar_lista_solicitudes(self) -> None:
         """Actualiza la lista de solicitudes mostrada."""
         try:
             print("🔄 Actualizando lista de solicitudes en UI...")
 
-            # Forzar recarga desde archivo
-            self.gestor.cargar_solicitudes()
-            solicitudes = self.gestor.obtener_solicitudes()
-
-            # Aplicar filtros
-            solicitudes_filtradas = self._aplicar_filtros_actuales(solicitudes)
+            estado_filtro = self._obtener_estado_filtro()
+            total = self.gestor.contar_solicitudes(estado_filtro)
 
             # Actualizar componentes
             if self.lista_solicitudes:
-                self.lista_solicitudes.actualizar_solicitudes(solicitudes_filtradas)
+                if self._requiere_modo_virtual():
+                    # Historiales grandes: solo se materializan las filas visibles
+                    self.lista_solicitudes.mostrar_cursor(
+                        self.gestor.obtener_cursor(estado_filtro)
+                    )
+                else:
+                    # Los datos en memoria ya reflejan los cambios propios
+                    self.lista_solicitudes.actualizar_solicitudes(
+                        self._aplicar_filtros_actuales(
+                            self.gestor.obtener_solicitudes()
+                        )
+                    )
 
             if self.panel_estadisticas:
                 self.panel_estadisticas.actualizar_estadisticas()
 
-            print(
-                f"✅ {len(solicitudes_filtradas)} solicitudes mostradas en la interfaz"
-            )
+            print(f"✅ {total} solicitudes disponibles en la interfaz")
 
         except Exception as e:
             print(f"❌ Error actualizando lista de solicitudes: {e}")
@@ -207,6 +301,25 @@ class GestionSolicitudesFrame(CTkFrame):
 
         return solicitudes
 
+    def _obtener_estado_filtro(self):
+        """Estado seleccionado en el filtro, o None para todas."""
+        if not self.panel_filtros:
+            return None
+        return self.panel_filtros.obtener_estado_filtro()
+
+    def _requiere_modo_virtual(self) -> bool:
+        """Indica si las solicitudes filtradas superan el umbral del modo virtual."""
+        total = self.gestor.contar_solicitudes(self._obtener_estado_filtro())
+        return total > self.UMBRAL_MODO_VIRTUAL
+
+    def _cumple_filtros(self, solicitud: SolicitudConformidad) -> bool:
+        """Indica si una solicitud debe mostrarse con los filtros actuales."""
+        if not self.panel_filtros:
+            return True
+
+        estado_filtro = self.panel_filtros.obtener_estado_filtro()
+        return not estado_filtro or solicitud.estado == estado_filtro
+
     def aplicar_filtros(self) -> None:
         """Aplica los filtros seleccionados."""
         self.actualizar_lista_solicitudes()
@@ -223,8 +336,9 @@ class GestionSolicitudesFrame(CTkFrame):
                 "Actualizando", "⏳ Recargando solicitudes desde BD local..."
             )
 
-            # Forzar recarga completa
-            self.actualizar_lista_solicitudes()
+            # Recargar solo si la BD cambió en disco; si no, refrescar la vista
+            if not self.gestor.recargar_si_cambio_en_disco():
+                self.actualizar_lista_solicitudes()
 
             # Mostrar mensaje de confirmación
             info_bd = self.gestor.obtener_info_bd()
@@ -247,8 +361,8 @@ class GestionSolicitudesFrame(CTkFrame):
         from tkinter import messagebox
 
         try:
-            # Obtener datos del gestor
-            self.gestor.cargar_solicitudes()
+            # Escribir los cambios pendientes de la escritura diferida
+            self.gestor.flush()
             solicitudes = self.gestor.obtener_solicitudes()
 
             # Simular guardado de datos
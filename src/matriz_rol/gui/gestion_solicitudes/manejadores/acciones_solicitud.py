@@ -5,7 +5,7 @@ Este módulo contiene la lógica de negocio para todas las acciones
 que se pueden realizar sobre las solicitudes.
 """
 
-from typing import Callable
+from typing import Callable, List
 from tkinter import messagebox, simpledialog
 from ....data.gestor_solicitudes import (
     GestorSolicitudes,
@@ -14,6 +14,7 @@ from ....data.gestor_solicitudes import (
 )
 from ..ventanas.ventana_detalles import VentanaDetalles
 from ..ventanas.ventana_cierre import VentanaCierre
+from .validadores import Validadores
 
 
 class AccionesSolicitud:
@@ -201,6 +202,77 @@ class AccionesSolicitud:
             print(f"❌ Error marcando en proceso: {e}")
             messagebox.showerror("Error", f"❌ Error marcando en proceso:\\n{e}")
 
+    def aplicar_transicion_lote(
+        self, solicitudes: List[SolicitudConformidad], nuevo_estado: EstadoSolicitud
+    ) -> None:
+        """
+        Cambia el estado de varias solicitudes con una sola escritura.
+
+        Las solicitudes cuya transición no está permitida se informan al
+        final; el resto se actualiza igualmente.
+
+        Args:
+            solicitudes: Solicitudes seleccionadas en la grilla
+            nuevo_estado: Estado destino
+        """
+        try:
+            if not solicitudes:
+                messagebox.showinfo(
+                    "Información",
+                    "Seleccione una o más solicitudes (Ctrl/Shift + clic)",
+                )
+                return
+
+            cantidad = len(solicitudes)
+            ticket = None
+            if nuevo_estado in (EstadoSolicitud.EN_HELPDESK, EstadoSolicitud.CERRADO):
+                ticket = simpledialog.askstring(
+                    f"{nuevo_estado.value} ({cantidad})",
+                    f"Ticket de helpdesk para {cantidad} solicitudes\n"
+                    "(vacío para conservar el ticket de cada una):",
+                )
+                if ticket is None:
+                    return
+                ticket = ticket.strip() or None
+                if ticket:
+                    es_valido, mensaje_error = Validadores.validar_ticket_helpdesk(
+                        ticket
+                    )
+                    if not es_valido:
+                        messagebox.showerror("Error", mensaje_error)
+                        return
+
+            observaciones = simpledialog.askstring(
+                f"{nuevo_estado.value} ({cantidad})",
+                "Observaciones:",
+                initialvalue=f"Estado cambiado a {nuevo_estado.value} en lote",
+            )
+            if observaciones is None:
+                return
+
+            if not messagebox.askyesno(
+                "Confirmar",
+                f"¿Cambiar {cantidad} solicitudes a '{nuevo_estado.value}'?",
+            ):
+                return
+
+            resultado = self.gestor.aplicar_transiciones(
+                [
+                    (solicitud.id_solicitud, nuevo_estado, ticket, observaciones)
+                    for solicitud in solicitudes
+                ]
+            )
+
+            if resultado.exitoso:
+                messagebox.showinfo("Éxito", resultado.resumen())
+            else:
+                messagebox.showwarning("Cambios parciales", resultado.resumen())
+            self.callback_actualizar()
+
+        except Exception as e:
+            print(f"❌ Error aplicando cambios en lote: {e}")
+            messagebox.showerror("Error", f"❌ Error aplicando cambios en lote:\n{e}")
+
     def ver_detalles_solicitud(self, solicitud: SolicitudConformidad) -> None:
         """
         Muestra los detalles completos de una solicitud.
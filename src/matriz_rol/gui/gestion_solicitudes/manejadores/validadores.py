@@ -6,7 +6,12 @@ sobre solicitudes de conformidad.
 """
 
 from typing import List, Optional, Tuple
-from ....data.gestor_solicitudes import SolicitudConformidad, EstadoSolicitud
+from ....data.gestor_solicitudes import (
+    ESTADOS_SIGUIENTES,
+    SolicitudConformidad,
+    EstadoSolicitud,
+    validar_transicion_estado,
+)
 
 
 class Validadores:
@@ -26,41 +31,8 @@ class Validadores:
         Returns:
             Tupla (es_valida, mensaje_error)
         """
-        # Definir transiciones válidas
-        transiciones_validas = {
-            EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES: [
-                EstadoSolicitud.EN_HELPDESK,
-                EstadoSolicitud.ATENDIDO,
-                EstadoSolicitud.CERRADO,
-            ],
-            EstadoSolicitud.EN_HELPDESK: [
-                EstadoSolicitud.ATENDIDO,
-                EstadoSolicitud.CERRADO,
-                EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES,  # Para revertir
-            ],
-            EstadoSolicitud.ATENDIDO: [
-                EstadoSolicitud.CERRADO,
-                EstadoSolicitud.EN_HELPDESK,  # Para revertir
-            ],
-            EstadoSolicitud.CERRADO: [
-                EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES  # Solo reapertura
-            ],
-        }
-
-        # Si es el mismo estado, siempre es válido (para actualizaciones)
-        if estado_actual == estado_nuevo:
-            return True, ""
-
-        # Verificar si la transición es válida
-        estados_permitidos = transiciones_validas.get(estado_actual, [])
-
-        if estado_nuevo in estados_permitidos:
-            return True, ""
-        else:
-            return (
-                False,
-                f"No se puede cambiar de '{estado_actual.value}' a '{estado_nuevo.value}'",
-            )
+        # La tabla de transiciones vive en la capa de datos, precalculada
+        return validar_transicion_estado(estado_actual, estado_nuevo)
 
     @staticmethod
     def validar_ticket_helpdesk(ticket: str) -> Tuple[bool, str]:
@@ -174,21 +146,7 @@ class Validadores:
         Returns:
             Lista de estados permitidos
         """
-        transiciones_validas = {
-            EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES: [
-                EstadoSolicitud.EN_HELPDESK,
-                EstadoSolicitud.ATENDIDO,
-                EstadoSolicitud.CERRADO,
-            ],
-            EstadoSolicitud.EN_HELPDESK: [
-                EstadoSolicitud.ATENDIDO,
-                EstadoSolicitud.CERRADO,
-            ],
-            EstadoSolicitud.ATENDIDO: [EstadoSolicitud.CERRADO],
-            EstadoSolicitud.CERRADO: [EstadoSolicitud.EN_SOLICITUD_CONFORMIDADES],
-        }
-
-        return transiciones_validas.get(estado_actual, [])
+        return list(ESTADOS_SIGUIENTES.get(estado_actual, ()))
 
     @staticmethod
     def validar_edicion_inline(
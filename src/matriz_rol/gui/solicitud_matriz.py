@@ -14,16 +14,18 @@ Ejemplo:
     >>> main()
 """
 
-import re
-import subprocess
 import tkinter as tk
-from pathlib import Path
+from concurrent.futures import Future
 from tkinter import messagebox, ttk
 from typing import Dict, List, Optional, Tuple, Any
 
 import yaml
 from customtkinter import CTkCheckBox, CTkFrame, CTkTextbox, CTkButton
 
+from ..data.directorio_grupos import ValidadorGrupos
+from ..data.gestor_autorizadores import GestorAutorizadores
+from ..rutas import directorio_config
+
 
 class SolicitudMatrizFrame(CTkFrame):
     """Frame principal para la solicitud de matrices de rol.
@@ -43,6 +45,9 @@ class SolicitudMatrizFrame(CTkFrame):
     # Grupos predefinidos que siempre deben estar disponibles
     GRUPOS_PREDEFINIDOS = ["APF2_QASD1_SSSS_CASD1_", "FCVE2_ATLA_FIEC_CASD1_"]
 
+    # Cada cuánto se revisa si terminó la validación de grupos
+    INTERVALO_VALIDACION_MS = 100
+
     def __init__(self, master=None, callback_autorizadores=None):
         """Inicializa el frame de solicitud.
 
@@ -58,6 +63,13 @@ class SolicitudMatrizFrame(CTkFrame):
         # Callback para cuando se confirma la selección
         self.callback_confirmacion = None
 
+        # Las consultas al dominio corren fuera del hilo de la interfaz
+        self.validador_grupos = ValidadorGrupos()
+        self._validacion: Optional[Future] = None
+
+        # Reconoce en los grupos los códigos que ya tienen autorizador
+        self.gestor_autorizadores = GestorAutorizadores()
+
         self.setup_ui()
         self.cargar_matrices()
         self.precargar_grupos_temporales()
@@ -86,7 +98,7 @@ class SolicitudMatrizFrame(CTkFrame):
     def cargar_matrices(self):
         """Carga las matrices desde el archivo de configuración."""
         try:
-            config_path = Path(__file__).parents[3] / "config" / "matrices.yaml"
+            config_path = directorio_config() / "matrices.yaml"
             with open(config_path, "r", encoding="utf-8") as f:
                 config = yaml.safe_load(f)
 
@@ -115,57 +127,30 @@ class SolicitudMatrizFrame(CTkFrame):
     def validar_grupos_red(self):
         """Valida la existencia de los grupos de red ingresados.
 
+        Las consultas se hacen en paralelo y con caché, pero la llamada
+        espera a que terminen; desde la interfaz usar validar_grupos.
+
         Returns:
             tuple: (grupos_validos, grupos_invalidos)
         """
-        grupos_validos = []
-        grupos_invalidos = []
-
-        for grupo in self.grupos_red:
-            if not grupo.strip():
-                continue
-
-            try:
-                # Ejecutar comando net group
-                result = subprocess.run(
-                    ["net", "group", grupo, "/domain"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-
-                if result.returncode == 0:
-                    grupos_validos.append(grupo)
-                else:
-                    grupos_invalidos.append(grupo)
+        return self.validador_grupos.validar(self.grupos_red)
 
-            except Exception:
-                grupos_invalidos.append(grupo)
-
-        return grupos_validos, grupos_invalidos
-
-    def extraer_codigos_aplicacion(self, grupos_red: List[str]) -> List[str]:
+    def extraer_codigos_aplicacion(
+        self, grupos_red: List[str]
+    ) -> Tuple[List[str], List[str]]:
         """Extrae códigos de aplicación de los grupos de red.
 
-        Busca patrones de 4 dígitos alfanuméricos en los nombres de grupos.
+        Los códigos registrados en la BD de autorizadores se devuelven aparte
+        de los segmentos con forma de código que no están registrados
+        (p. ej. QASD1 → QASD), que son aplicaciones nuevas.
 
         Args:
             grupos_red: Lista de nombres de grupos de red
 
         Returns:
-            Lista de códigos de aplicación únicos encontrados
+            tuple: (codigos_conocidos, codigos_nuevos)
         """
-        codigos = []
-        patron = re.compile(r"[A-Z0-9]{4}")  # 4 caracteres alfanuméricos
-
-        for grupo in grupos_red:
-            # Encontrar todos los patrones de 4 caracteres alfanuméricos
-            matches = patron.findall(grupo.upper())
-            for match in matches:
-                if match not in codigos:
-                    codigos.append(match)
-
-        return codigos
+        return self.gestor_autorizadores.extraer_codigos_aplicacion(grupos_red)
 
     def confirmar_seleccion(self):
         """Valida y confirma la selección de matrices y grupos."""
@@ -190,9 +175,11 @@ class SolicitudMatrizFrame(CTkFrame):
             return
 
         # Extraer códigos de aplicación
-        codigos_aplicacion = self.extraer_codigos_aplicacion(self.grupos_red)
+        codigos_aplicacion, codigos_nuevos = self.extraer_codigos_aplicacion(
+            self.grupos_red
+        )
 
-        if not codigos_aplicacion:
+        if not codigos_aplicacion and not codigos_nuevos:
             messagebox.showwarning(
                 "Advertencia",
                 "No se encontraron códigos de aplicación válidos en los grupos.\n"
@@ -201,9 +188,11 @@ class SolicitudMatrizFrame(CTkFrame):
             return
 
         # Abrir ventana de autorizadores
-        self.abrir_ventana_autorizadores(codigos_aplicacion)
+        self.abrir_ventana_autorizadores(codigos_aplicacion, codigos_nuevos)
 
-    def abrir_ventana_autorizadores(self, codigos_aplicacion: List[str]):
+    def abrir_ventana_autorizadores(
+        self, codigos_aplicacion: List[str], codigos_nuevos: List[str]
+    ):
         """Abre una nueva ventana para gestionar autorizadores."""
         ventana_autorizadores = tk.Toplevel(self.master)
         ventana_autorizadores.title("Gestión de Autorizadores")
@@ -216,6 +205,7 @@ class SolicitudMatrizFrame(CTkFrame):
             ventana_autorizadores,
             codigos_aplicacion=codigos_aplicacion,
             grupos_red=self.grupos_red,
+            codigos_nuevos=codigos_nuevos,
         )
 
         # ⭐ ASIGNAR EL CALLBACK PARA CREAR SOLICITUDES ⭐
@@ -233,9 +223,39 @@ class SolicitudMatrizFrame(CTkFrame):
         editor_frame.pack(expand=True, fill="both", padx=10, pady=10)
 
     def validar_grupos(self):
-        """Valida los grupos de red y muestra resultados."""
-        grupos_validos, grupos_invalidos = self.validar_grupos_red()
+        """Valida los grupos de red sin bloquear la interfaz y muestra resultados."""
+        if self._validacion is not None:
+            return
 
+        self.btn_confirmar.configure(state="disabled")
+        self._validacion = self.validador_grupos.validar_en_segundo_plano(
+            self.grupos_red
+        )
+        self.after(self.INTERVALO_VALIDACION_MS, self._revisar_validacion)
+
+    def _revisar_validacion(self):
+        """Muestra el resultado de la validación cuando termina."""
+        if not self._validacion.done():
+            self.after(self.INTERVALO_VALIDACION_MS, self._revisar_validacion)
+            return
+
+        validacion, self._validacion = self._validacion, None
+        self.btn_confirmar.configure(state="normal")
+        try:
+            grupos_validos, grupos_invalidos = validacion.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al validar grupos: {str(e)}")
+            return
+
+        self._mostrar_validacion(grupos_validos, grupos_invalidos)
+
+    def _mostrar_validacion(self, grupos_validos, grupos_invalidos):
+        """Informa el resultado de la validación y continúa si corresponde.
+
+        Args:
+            grupos_validos: Grupos encontrados en el dominio
+            grupos_invalidos: Grupos no encontrados
+        """
         mensaje = "Resultado de la validación:\n\n"
 
         if grupos_validos:
@@ -0,0 +1,118 @@
+"""
+Resolución de las rutas del proyecto.
+
+La raíz del proyecto se busca una sola vez por proceso subiendo desde este
+archivo hasta encontrar un marcador (``ejecutar_app.py``, ``setup.py`` o
+``pyproject.toml``). Se puede fijar con la variable de entorno
+MATRIZ_ROL_RAIZ o con ``configurar_raiz``. Los directorios que se piden con
+``directorio`` se crean la primera vez y se recuerdan, de modo que los
+generadores de correo y los gestores de datos no repiten la búsqueda ni los
+``mkdir`` en cada uso.
+"""
+
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Set, Union
+
+# Variable de entorno que fija la raíz del proyecto
+VARIABLE_RAIZ = "MATRIZ_ROL_RAIZ"
+
+# Archivos que identifican la raíz del proyecto
+MARCADORES_RAIZ = ("ejecutar_app.py", "setup.py", "pyproject.toml")
+
+# Directorios relativos a la raíz
+DIRECTORIO_DATOS = "data"
+DIRECTORIO_CONFIG = "config"
+DIRECTORIO_CORREOS = Path("output") / "correos"
+DIRECTORIO_CORREOS_INDIVIDUALES = Path("output") / "correos_individuales"
+
+_raiz_configurada: Optional[Path] = None
+_directorios_creados: Set[Path] = set()
+_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _descubrir_raiz() -> Path:
+    """Busca la raíz del proyecto subiendo desde este archivo."""
+    inicio = Path(__file__).resolve().parent
+    for candidato in (inicio, *inicio.parents):
+        if any((candidato / marcador).exists() for marcador in MARCADORES_RAIZ):
+            return candidato
+
+    # Instalado sin el árbol del proyecto: el directorio padre de src/
+    return inicio.parents[1]
+
+
+def configurar_raiz(raiz: Optional[Union[str, Path]]) -> None:
+    """
+    Fija la raíz del proyecto para el resto del proceso.
+
+    Args:
+        raiz: Nueva raíz (None vuelve a la variable de entorno o a la
+            búsqueda automática)
+    """
+    global _raiz_configurada
+
+    with _lock:
+        _raiz_configurada = Path(raiz).resolve() if raiz is not None else None
+        _directorios_creados.clear()
+
+
+def raiz_proyecto() -> Path:
+    """
+    Obtiene la raíz del proyecto.
+
+    Returns:
+        La raíz fijada con configurar_raiz, la de MATRIZ_ROL_RAIZ o la
+        encontrada automáticamente (en ese orden)
+    """
+    if _raiz_configurada is not None:
+        return _raiz_configurada
+
+    desde_entorno = os.environ.get(VARIABLE_RAIZ)
+    if desde_entorno:
+        return Path(desde_entorno)
+
+    return _descubrir_raiz()
+
+
+def directorio(relativo: Union[str, Path], crear: bool = True) -> Path:
+    """
+    Obtiene un directorio dentro de la raíz del proyecto.
+
+    Args:
+        relativo: Ruta relativa a la raíz
+        crear: Crear el directorio si no existe (solo la primera vez que
+            se pide en el proceso)
+
+    Returns:
+        Ruta del directorio
+    """
+    ruta = raiz_proyecto() / relativo
+    if crear and ruta not in _directorios_creados:
+        ruta.mkdir(parents=True, exist_ok=True)
+        with _lock:
+            _directorios_creados.add(ruta)
+    return ruta
+
+
+def directorio_datos() -> Path:
+    """Directorio de la BD local (``data`` en la raíz del proyecto)."""
+    return directorio(DIRECTORIO_DATOS)
+
+
+def directorio_config() -> Path:
+    """Directorio de configuración (``config`` en la raíz del proyecto)."""
+    return directorio(DIRECTORIO_CONFIG, crear=False)
+
+
+def directorio_correos() -> Path:
+    """Directorio de salida del correo consolidado."""
+    return directorio(DIRECTORIO_CORREOS)
+
+
+def directorio_correos_individuales() -> Path:
+    """Directorio de salida de los correos individuales."""
+    return directorio(DIRECTORIO_CORREOS_INDIVIDUALES)